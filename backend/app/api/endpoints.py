@@ -1,81 +1,191 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
-from app.db.base import get_db
+from typing import List, Optional
+from datetime import datetime
+from app.db.base import get_db, get_read_db, mark_write
 from app.db.models import Game, Frame
-from app.api.llm import get_llm_summary
+from app.api.llm import PROVIDERS, summarize_game
+from app.api.etag import conditional_response, if_match_revision, make_etag
+from app.core.admission import AdmissionRejected, summary_admission
+from app.core.cache import cache, game_tag, player_tag, publish_invalidation, summary_cache
+from app.core.config import settings
 from app.db import models, schemas
+from app.db.archive import load_frames, load_frames_bulk, restore_game
+from app.db.events import read_roll_events, record_roll_events
+from app.db.players import get_or_create_player, resolve_player, resolve_players
+from app.db.search import decode_cursor, encode_cursor, search_games
+from app.db.stats import (
+    RANK_FIELDS,
+    compare_players,
+    get_league_percentile_rank,
+    get_player_score_distribution,
+    get_player_trends,
+    rank_players,
+    record_game_created,
+    record_game_updated,
+)
+from app.db.usage import get_llm_usage_totals, record_llm_usage
 
 router = APIRouter()
 
+# Maximum number of games a single scoreboard request may ask for
+MAX_SCOREBOARD_GAMES = 64
+
+# Maximum number of players a single comparison may ask for
+MAX_COMPARED_PLAYERS = 64
+
+# Default window of the trends endpoint and bin width of the distribution endpoint
+DEFAULT_TRENDS_WINDOW = 10
+DEFAULT_BIN_WIDTH = 10
+
 
 @router.post("/games", response_model=schemas.GameResponse)
-def create_game(request: schemas.GameCreate, db: Session = Depends(get_db)):
+def create_game(request: schemas.GameCreate, response: Response, db: Session = Depends(get_db)):
     """
     Create a new game for a player.
 
     Args:
         request (schemas.GameCreate): The player name to associate with the game.
+        response (Response): The outgoing response, used to pin the client's reads to the primary.
         db (Session): Database session dependency.
 
     Returns:
-        dict: A dictionary containing the game ID and player name.
+        dict: A dictionary containing the game ID, player name and ID, and initial revision.
     """
-    # Create a new game with the provided player name
-    game = models.Game(player=request.player, frames=[])
+    # Create a new game for the player, registering the player on first use
+    player = get_or_create_player(db, request.player)
+    game = models.Game(player=player, frames=[])
     db.add(game)
+    record_game_created(db, player.id)
+    publish_invalidation(db, player_tag(player.id))
     db.commit()
     db.refresh(game)
+    mark_write(response)
 
-    return {"id": game.id, "player": game.player}
+    return {"id": game.id, "player": player.name, "player_id": player.id, "revision": game.revision}
 
 
-@router.post("/games/{game_id}/rolls")
-async def record_roll(game_id: int, frames_update: schemas.GameFramesUpdate, db: Session = Depends(get_db)):
+@router.post("/games/{game_id}/rolls", response_model=schemas.FramesUpdateResponse)
+async def record_roll(
+    game_id: int,
+    frames_update: schemas.GameFramesUpdate,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
     """
     Record or update rolls for a specific game.
 
+    The incoming frames are compared with the stored ones and only frames that changed
+    are written, so a retried update is a no-op that leaves the revision untouched.
+    A client can send the game revision it last saw, in the body or as the score ETag
+    in `If-Match`; the update is rejected with a 409 if the game has moved on since.
+    Concurrent writers are serialized by bumping the revision with a conditional
+    UPDATE, so the loser of a race also gets a 409 instead of overwriting frames.
+    Every written frame is appended to the roll event log served by `/events`.
+
     Args:
         game_id (int): The ID of the game to update.
         frames_update (schemas.GameFramesUpdate): Frames with updated rolls.
+        request (Request): The incoming request, read for the `If-Match` header.
+        response (Response): The outgoing response, used to pin the client's reads to the primary.
         db (Session): Database session dependency.
 
     Returns:
-        dict: Success message.
+        dict: Success message and the new revision of the game.
     """
     game = db.query(models.Game).filter(models.Game.id == game_id).first()
 
     if not game:
         raise HTTPException(status_code=404, detail="Game not found")
 
-    # Iterate through the frames to either create new frame records or update existing ones
-    for index, frame_rolls in enumerate(frames_update.frames):
-        frame = db.query(models.Frame).filter_by(game_id=game_id, frame_number=index + 1).first()
+    expected_revision = frames_update.revision
+    if expected_revision is None:
+        expected_revision = if_match_revision(request, "score", game_id)
+    if expected_revision is not None and expected_revision != game.revision:
+        raise HTTPException(status_code=409, detail="Game was modified by another request")
+
+    # Compare with the stored frames so only frames that actually changed are written
+    stored = load_frames(db, game_id)
+    stored_rolls = {frame.frame_number: frame.rolls for frame in stored}
+    changed = {
+        number: rolls for number, rolls in enumerate(frames_update.frames, start=1) if stored_rolls.get(number) != rolls
+    }
 
+    if not changed:
+        response.headers["ETag"] = make_etag("score", game_id, game.revision)
+        return {"message": "frames updated successfully", "revision": game.revision}
+
+    # Claim the next revision; a writer or archive run that committed since the game was read makes this miss
+    claimed = (
+        db.query(models.Game)
+        .filter(models.Game.id == game_id, models.Game.revision == game.revision, models.Game.archived == game.archived)
+        .update({models.Game.revision: models.Game.revision + 1}, synchronize_session="evaluate")
+    )
+    if not claimed:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Game was modified by another request")
+
+    # Corrections to an archived game bring its frames back into the hot table
+    if game.archived:
+        stored = restore_game(db, game)
+
+    existing = {frame.frame_number: frame for frame in stored}
+    for number, rolls in changed.items():
+        frame = existing.get(number)
         if frame:
-            frame.rolls = frame_rolls  # Update the rolls for the frame
+            frame.rolls = rolls  # Update the rolls for the frame
         else:
-            new_frame = models.Frame(game_id=game_id, frame_number=index + 1, rolls=frame_rolls)
-            db.add(new_frame)
-
+            frame = existing[number] = models.Frame(game_id=game_id, frame_number=number, rolls=rolls)
+            db.add(frame)
+
+    # Refresh the stored per-game aggregates from the full set of frames
+    frames = [existing[number] for number in sorted(existing)]
+    old_score, old_strikes, old_spares = game.score, game.strikes, game.spares
+    update_game_aggregates(game, frames)
+    record_game_updated(db, game, old_score, old_strikes, old_spares)
+    publish_invalidation(db, game_tag(game_id), player_tag(game.player_id))
+
+    revision = game.revision
+    record_roll_events(
+        db, game_id, revision, [(number, stored_rolls.get(number), rolls) for number, rolls in changed.items()]
+    )
     db.commit()
+    mark_write(response)
+    response.headers["ETag"] = make_etag("score", game_id, revision)
 
-    return {"message": "frames updated successfully"}
+    return {"message": "frames updated successfully", "revision": revision}
 
 
-@router.get("/games/{game_id}/score")
-async def get_current_score(game_id: int, db: Session = Depends(get_db)):
+@router.get("/games/{game_id}/score", response_model=schemas.ScoreResponse)
+async def get_current_score(game_id: int, request: Request, response: Response, db: Session = Depends(get_read_db)):
     """
     Retrieve the current score for a specific game.
 
+    The response carries an ETag derived from the game's revision, so a matching
+    `If-None-Match` request gets a 304 without loading or rescoring frames.
+
     Args:
         game_id (int): The ID of the game.
-        db (Session): Database session dependency.
+        request (Request): The incoming request.
+        response (Response): The outgoing response, used to set the ETag.
+        db (Session): Read-only database session dependency.
 
     Returns:
         dict: Game ID and current score.
     """
-    frames = db.query(models.Frame).filter(models.Frame.game_id == game_id).all()
+    revision = db.query(models.Game.revision).filter(models.Game.id == game_id).scalar()
+
+    if revision is None:
+        raise HTTPException(status_code=404, detail="Game not found")
+
+    not_modified = conditional_response(request, response, make_etag("score", game_id, revision))
+    if not_modified:
+        return not_modified
+
+    frames = load_frames(db, game_id)
 
     if not frames:
         raise HTTPException(status_code=404, detail="Game not found")
@@ -84,103 +194,418 @@ async def get_current_score(game_id: int, db: Session = Depends(get_db)):
     return {"game_id": game_id, "score": score}
 
 
-@router.get("/players/{player_name}/statistics")
-async def get_player_statistics(player_name: str, db: Session = Depends(get_db)):
+@router.get("/scoreboard", response_model=schemas.ScoreboardResponse)
+async def get_scoreboard(game_ids: List[int] = Query(...), db: Session = Depends(get_read_db)):
+    """
+    Retrieve the frame-by-frame scores of many games at once, e.g. for a bank of lanes.
+
+    The games and all of their frames are loaded with one IN query each (plus one for
+    archived games), instead of one score request per game.
+
+    Args:
+        game_ids (List[int]): The IDs of the games, as repeated `game_ids` query parameters.
+        db (Session): Read-only database session dependency.
+
+    Returns:
+        dict: The scorecard of every game found, in request order, and the IDs that weren't found.
+    """
+    game_ids = list(dict.fromkeys(game_ids))
+    if len(game_ids) > MAX_SCOREBOARD_GAMES:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_SCOREBOARD_GAMES} games per scoreboard")
+
+    players = dict(
+        db.query(models.Game.id, models.Player.name).join(models.Game.player).filter(models.Game.id.in_(game_ids)).all()
+    )
+    frames_by_game = load_frames_bulk(db, list(players))
+
+    games = []
+    for game_id in game_ids:
+        if game_id not in players:
+            continue
+
+        frames = frames_by_game[game_id]
+        cumulative_scores = calculate_frame_scores(frames)
+        games.append(
+            {
+                "game_id": game_id,
+                "player": players[game_id],
+                "score": current_score(cumulative_scores),
+                "frames": [
+                    {
+                        "frame_number": frame.frame_number,
+                        "rolls": frame.rolls,
+                        "cumulative_score": cumulative_scores[index] if index < len(cumulative_scores) else None,
+                    }
+                    for index, frame in enumerate(frames)
+                ],
+            }
+        )
+
+    return {"games": games, "not_found": [game_id for game_id in game_ids if game_id not in players]}
+
+
+@router.get("/games/search", response_model=schemas.GameSearchResponse)
+async def search_games_endpoint(
+    player: Optional[str] = None,
+    min_score: Optional[int] = Query(None, ge=0),
+    max_score: Optional[int] = Query(None, ge=0),
+    min_strikes: Optional[int] = Query(None, ge=0),
+    max_strikes: Optional[int] = Query(None, ge=0),
+    min_spares: Optional[int] = Query(None, ge=0),
+    max_spares: Optional[int] = Query(None, ge=0),
+    started_from: Optional[datetime] = None,
+    started_before: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Search games by score, strikes, spares, player and start time, newest first.
+
+    Filters are served from the indexed per-game aggregates. Results are paged with
+    an opaque cursor: pass the `next_cursor` of a page to get the next one, with
+    the same filters; it is null on the last page.
+
+    Args:
+        player (Optional[str]): The ID or name of the player whose games to return.
+        min_score (Optional[int]): Minimum score, inclusive.
+        max_score (Optional[int]): Maximum score, inclusive.
+        min_strikes (Optional[int]): Minimum number of strikes, inclusive.
+        max_strikes (Optional[int]): Maximum number of strikes, inclusive.
+        min_spares (Optional[int]): Minimum number of spares, inclusive.
+        max_spares (Optional[int]): Maximum number of spares, inclusive.
+        started_from (Optional[datetime]): Only return games started at or after this time.
+        started_before (Optional[datetime]): Only return games started before this time.
+        cursor (Optional[str]): The `next_cursor` of the previous page.
+        limit (int): Maximum number of games per page (default: 50).
+        db (Session): Read-only database session dependency.
+
+    Returns:
+        dict: The matching games and the cursor of the next page.
+    """
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    player_id = None
+    if player is not None:
+        found = resolve_player(db, player)
+        if found is None:
+            return {"games": [], "next_cursor": None}
+        player_id = found.id
+
+    # One extra row tells whether there is a next page
+    rows = search_games(
+        db,
+        limit + 1,
+        after,
+        player_id=player_id,
+        min_score=min_score,
+        max_score=max_score,
+        min_strikes=min_strikes,
+        max_strikes=max_strikes,
+        min_spares=min_spares,
+        max_spares=max_spares,
+        started_from=started_from,
+        started_before=started_before,
+    )
+    page = rows[:limit]
+
+    games = [
+        {
+            "game_id": game.id,
+            "player_id": game.player_id,
+            "player_name": player_name,
+            "score": game.score,
+            "strikes": game.strikes,
+            "spares": game.spares,
+            "start_time": game.start_time,
+        }
+        for game, player_name in page
+    ]
+    next_cursor = encode_cursor(page[-1][0].start_time, page[-1][0].id) if len(rows) > limit else None
+
+    return {"games": games, "next_cursor": next_cursor}
+
+
+@router.get("/events", response_model=schemas.RollEventFeedResponse)
+async def get_roll_events(
+    after: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    game_id: Optional[int] = None,
+    db: Session = Depends(get_read_db),
+):
+    """
+    Read the change feed of rolls and corrections, in the order they were committed.
+
+    Consumers pass the `last_sequence` of the previous batch as `after` to pull only
+    new events; an empty batch means they are up to date.
+
+    Args:
+        after (int): Only return events after this sequence number (default: 0, from the start).
+        limit (int): Maximum number of events in the batch (default: 100).
+        game_id (Optional[int]): Only return the events of this game, e.g. to replay it.
+        db (Session): Read-only database session dependency.
+
+    Returns:
+        dict: The batch of events and the sequence number to resume after.
+    """
+    events = read_roll_events(db, after, limit, game_id)
+
+    return {"events": events, "last_sequence": events[-1].sequence if events else after}
+
+
+@router.get("/players/compare", response_model=schemas.PlayerComparisonResponse)
+async def compare_players_endpoint(
+    players: List[str] = Query(...),
+    rank_by: Optional[str] = None,
+    started_from: Optional[datetime] = None,
+    started_before: Optional[datetime] = None,
+    db: Session = Depends(get_read_db),
+):
+    """
+    Compare the statistics of many players side by side.
+
+    Players are resolved with one query and their statistics computed with one grouped
+    aggregate query over their games, however many players are compared.
+
+    Args:
+        players (List[str]): The IDs or names of the players, e.g. `?players=1&players=Jane Doe`.
+        rank_by (Optional[str]): Order the players by this statistic, highest first, and number their ranks.
+        started_from (Optional[datetime]): Only count games started at or after this time.
+        started_before (Optional[datetime]): Only count games started before this time.
+        db (Session): Read-only database session dependency.
+
+    Returns:
+        dict: The statistics of every player found, in request or rank order, and the
+        references that matched no player with games.
+    """
+    player_refs = list(dict.fromkeys(players))
+    if len(player_refs) > MAX_COMPARED_PLAYERS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_COMPARED_PLAYERS} players per comparison")
+    if rank_by is not None and rank_by not in RANK_FIELDS:
+        raise HTTPException(status_code=400, detail=f"rank_by must be one of: {', '.join(RANK_FIELDS)}")
+
+    found = resolve_players(db, player_refs)
+    player_ids = list(dict.fromkeys(player.id for player in found.values()))
+    statistics = compare_players(db, player_ids, started_from, started_before)
+
+    compared = []
+    for player in dict.fromkeys(found.values()):
+        if player.id in statistics:
+            compared.append({"player_id": player.id, "player_name": player.name, **statistics[player.id]})
+    if rank_by is not None:
+        compared = rank_players(compared, rank_by)
+
+    not_found = [
+        player_ref for player_ref in player_refs if player_ref not in found or found[player_ref].id not in statistics
+    ]
+
+    return {"players": compared, "not_found": not_found}
+
+
+@router.get("/players/{player_ref}/statistics", response_model=schemas.PlayerStatisticsResponse)
+async def get_player_statistics(
+    player_ref: str, request: Request, response: Response, db: Session = Depends(get_read_db)
+):
     """
     Calculate and retrieve game statistics for a specific player.
 
     Args:
-        player_name (str): The name of the player.
-        db (Session): Database session dependency.
+        player_ref (str): The ID or name of the player.
+        request (Request): The incoming request.
+        response (Response): The outgoing response, used to set the ETag.
+        db (Session): Read-only database session dependency.
 
     Returns:
-        dict: Player name and calculated statistics (total games, total score, highest score, lowest score, average score).
+        dict: Player name and calculated statistics (total games, total score, highest score, lowest score, average score,
+            total strikes, total spares).
     """
-    games = db.query(models.Game).filter(models.Game.player == player_name).all()
+    player = resolve_player(db, player_ref)
+    stats = db.get(models.PlayerStats, player.id) if player else None
 
-    if not games:
+    if not stats or not stats.total_games:
         raise HTTPException(status_code=404, detail="No games found for this player")
 
-    total_games = len(games)
-    total_score = 0
-    highest_score = 0
-    lowest_score = float("inf")
-
-    for game in games:
-        frames = db.query(models.Frame).filter(models.Frame.game_id == game.id).all()
-        score = calculate_score(frames)
-        total_score += score
-        highest_score = max(highest_score, score)
-        lowest_score = min(lowest_score, score)
+    not_modified = conditional_response(request, response, make_etag("statistics", player.id, stats.revision))
+    if not_modified:
+        return not_modified
 
-    average_score = total_score / total_games if total_games > 0 else 0
+    average_score = stats.total_score / stats.total_games
 
     return {
-        "player_name": player_name,
-        "total_games": total_games,
-        "total_score": total_score,
-        "highest_score": highest_score,
-        "lowest_score": lowest_score,
+        "player_id": player.id,
+        "player_name": player.name,
+        "total_games": stats.total_games,
+        "total_score": stats.total_score,
+        "highest_score": stats.highest_score,
+        "lowest_score": stats.lowest_score,
         "average_score": round(average_score, 2),
+        "total_strikes": stats.strikes,
+        "total_spares": stats.spares,
     }
 
 
-@router.get("/players/{player_name}/history")
-async def get_player_history(player_name: str, db: Session = Depends(get_db)):
+@router.get("/players/{player_ref}/history", response_model=schemas.PlayerHistoryResponse)
+async def get_player_history(player_ref: str, request: Request, response: Response, db: Session = Depends(get_read_db)):
     """
     Retrieve the historical games played by a specific player, including game scores, strikes, and spares.
 
+    The response carries an ETag derived from the player's revision, so a matching
+    `If-None-Match` request gets a 304 without loading the player's games.
+
     Args:
-        player_name (str): The name of the player.
-        db (Session): Database session dependency.
+        player_ref (str): The ID or name of the player.
+        request (Request): The incoming request.
+        response (Response): The outgoing response, used to set the ETag.
+        db (Session): Read-only database session dependency.
 
     Returns:
         dict: Player name and a list of historical games with scores, strikes, and spares.
     """
-    games = db.query(models.Game).filter(models.Game.player == player_name).all()
+    player = resolve_player(db, player_ref)
+    if player is None:
+        raise HTTPException(status_code=404, detail="No games found for this player")
+
+    revision = db.query(models.PlayerStats.revision).filter(models.PlayerStats.player_id == player.id).scalar()
+
+    if revision is not None:
+        not_modified = conditional_response(request, response, make_etag("history", player.id, revision))
+        if not_modified:
+            return not_modified
+
+        # Only reuse a cached history built from the same revision the ETag was derived from
+        cached = cache.get(("history", player.id))
+        if cached is not None and cached[0] == revision:
+            return cached[1]
+
+    games = (
+        db.query(models.Game)
+        .filter(models.Game.player_id == player.id)
+        .order_by(models.Game.start_time, models.Game.id)
+        .all()
+    )
 
     if not games:
         raise HTTPException(status_code=404, detail="No games found for this player")
 
-    game_history = []
+    # Scores, strikes and spares are stored per game, so no frames need to be loaded
+    game_history = [
+        {
+            "game_id": game.id,
+            "score": game.score,
+            "strikes": game.strikes,
+            "spares": game.spares,
+            "start_time": game.start_time,
+        }
+        for game in games
+    ]
+    history = {"player_id": player.id, "player_name": player.name, "games": game_history}
+
+    if revision is not None:
+        cache.set(("history", player.id), (revision, history), tags=[player_tag(player.id)])
+
+    return history
+
+
+@router.get("/players/{player_ref}/trends", response_model=schemas.PlayerTrendsResponse)
+async def get_player_trends_endpoint(
+    player_ref: str, last_n: int = Query(DEFAULT_TRENDS_WINDOW, ge=1, le=100), db: Session = Depends(get_read_db)
+):
+    """
+    Retrieve rolling last-N averages, monthly averages and strike/spare rates for a player.
 
-    for game in games:
-        # Join the frames table with the game and calculate strikes and spares for each game
-        frames = db.query(models.Frame).filter(models.Frame.game_id == game.id).all()
+    Args:
+        player_ref (str): The ID or name of the player.
+        last_n (int): Number of most recent games in the rolling window (default: 10).
+        db (Session): Read-only database session dependency.
 
-        score = calculate_score(frames)
+    Returns:
+        dict: Player name, last-N summary, rolling per-game series and monthly trends.
+    """
+    player = resolve_player(db, player_ref)
+    if player is None:
+        raise HTTPException(status_code=404, detail="No games found for this player")
 
-        # Calculate the number of strikes and spares
-        strikes = 0
-        spares = 0
-        for frame in frames:
-            if frame.rolls[0] == 10:
-                strikes += 1  # Strike
-            elif len(frame.rolls) > 1 and sum(frame.rolls[:2]) == 10:
-                spares += 1  # Spare
+    # Only reuse trends computed at the player's current revision: an entry filled from a
+    # lagging replica after a write carries the older revision and is recomputed
+    revision = db.query(models.PlayerStats.revision).filter(models.PlayerStats.player_id == player.id).scalar()
+    cache_key = ("trends", player.id, last_n)
+    cached = cache.get(cache_key)
+    if cached is not None and revision is not None and cached[0] == revision:
+        return cached[1]
 
-        game_history.append(
-            {
-                "game_id": game.id,
-                "score": score,
-                "strikes": strikes,
-                "spares": spares,
-                "start_time": game.start_time,
-            }
-        )
+    trends = get_player_trends(db, player, last_n)
+    if trends is None:
+        raise HTTPException(status_code=404, detail="No games found for this player")
+
+    if revision is not None:
+        cache.set(cache_key, (revision, trends), tags=[player_tag(player.id)])
+
+    return trends
+
+
+@router.get("/players/{player_ref}/distribution", response_model=schemas.PlayerDistributionResponse)
+async def get_player_distribution_endpoint(
+    player_ref: str, bin_width: int = Query(DEFAULT_BIN_WIDTH, ge=1, le=300), db: Session = Depends(get_read_db)
+):
+    """
+    Retrieve a player's score histogram, median, 90th percentile and league-wide percentile rank.
+
+    Args:
+        player_ref (str): The ID or name of the player.
+        bin_width (int): Width of the histogram bins in points (default: 10).
+        db (Session): Read-only database session dependency.
+
+    Returns:
+        dict: Player name, number of games, median, p90, histogram and league percentile rank.
+    """
+    player = resolve_player(db, player_ref)
+    if player is None:
+        raise HTTPException(status_code=404, detail="No games found for this player")
+
+    # The player's own distribution is cached for the player's current revision, like trends
+    stats = db.get(models.PlayerStats, player.id)
+    cache_key = ("distribution", player.id, bin_width)
+    cached = cache.get(cache_key)
+    if cached is not None and stats is not None and cached[0] == stats.revision:
+        distribution = cached[1]
+    else:
+        distribution = get_player_score_distribution(db, player, bin_width)
+        if distribution is None:
+            raise HTTPException(status_code=404, detail="No games found for this player")
+
+        if stats is not None:
+            cache.set(cache_key, (stats.revision, distribution), tags=[player_tag(player.id)])
 
-    return {"player_name": player_name, "games": game_history}
+    # The league rank moves with every other player's games, so it is never cached
+    return {**distribution, "league_percentile_rank": get_league_percentile_rank(db, stats)}
 
 
-@router.get("/games/{game_id}/summary")
-async def get_game_summary(game_id: int, llm: str = "gpt", db: Session = Depends(get_db)):
+@router.get("/games/{game_id}/summary", response_model=schemas.GameSummaryResponse)
+async def get_game_summary(
+    game_id: int,
+    request: Request,
+    llm: str = "gpt",
+    db: Session = Depends(get_read_db),
+    write_db: Session = Depends(get_db),
+):
     """
     Fetch the summary of the current game using the selected LLM (GPT, BERT, T5, LLaMA).
 
+    Model calls go through admission control: each client is rate limited, only a few
+    calls run at once and a bounded number wait for a slot. Shed requests get a 429 with
+    `Retry-After`, or the last cached summary when degraded mode is enabled. The model
+    call runs in the threadpool so it never blocks the event loop serving other endpoints.
+    The token usage reported by the model is recorded for `/llm/usage`.
+
     Args:
         game_id (int): The ID of the game.
+        request (Request): The incoming request, used to identify the client.
         llm (str): The selected LLM for summarization (default: "gpt").
-        db (Session): Database session dependency.
+        db (Session): Read-only database session dependency.
+        write_db (Session): Database session dependency the token usage is recorded with.
 
     Returns:
         dict: A summary of the game based on the selected LLM.
@@ -190,29 +615,61 @@ async def get_game_summary(game_id: int, llm: str = "gpt", db: Session = Depends
     if not game:
         raise HTTPException(status_code=404, detail="Game not found")
 
-    # Fetch the frames associated with the game
-    frames = db.query(Frame).filter(Frame.game_id == game_id).all()
+    # Fetch the frames associated with the game, from the archive if it was archived
+    frames = load_frames(db, game_id)
 
     formatted_frames = {f"Frame {i + 1}": frame.rolls for i, frame in enumerate(frames)}
+    running_scores = calculate_frame_scores(frames)
 
     if not frames:
         raise HTTPException(status_code=404, detail="No frames found for this game")
 
-    # Use the selected LLM to generate the summary
-    if llm == "gpt":
-        summary = get_llm_summary(formatted_frames, model="gpt")
-    elif llm == "bert":
-        summary = get_llm_summary(formatted_frames, model="bert")
-    elif llm == "t5":
-        summary = get_llm_summary(formatted_frames, model="t5")
-    elif llm == "llama":
-        summary = get_llm_summary(formatted_frames, model="llama")
-    else:
+    if llm not in PROVIDERS:
         raise HTTPException(status_code=400, detail="Invalid LLM selected")
 
+    # An unchanged game reuses its last summary without calling the model again
+    cache_key = (game_id, llm)
+    revision = game.revision
+    cached = summary_cache.get(cache_key)
+    if cached is not None and cached[0] == revision:
+        return {"summary": cached[1]}
+
+    # Give the connection back to the pool rather than holding it during the model call
+    db.close()
+
+    client_id = request.client.host if request.client else "unknown"
+    try:
+        async with summary_admission.admit(client_id):
+            # Use the selected LLM to generate the summary
+            summary, usage = await run_in_threadpool(summarize_game, formatted_frames, llm, running_scores)
+    except AdmissionRejected as rejected:
+        if settings.SUMMARY_DEGRADED_MODE and cached is not None:
+            return {"summary": cached[1], "degraded": True}
+        raise HTTPException(status_code=429, detail=rejected.reason, headers={"Retry-After": str(rejected.retry_after)})
+
+    summary_cache.set(cache_key, (revision, summary))
+
+    if usage is not None:
+        record_llm_usage(write_db, usage)
+        write_db.commit()
+
     return {"summary": summary}
 
 
+@router.get("/llm/usage", response_model=schemas.LlmUsageResponse)
+def get_llm_usage(db: Session = Depends(get_read_db)):
+    """
+    Report the token usage of the generated summaries, per model and prompt version.
+
+    Args:
+        db (Session): Read-only database session dependency.
+
+    Returns:
+        dict: Request counts, token totals and average latency per model and prompt version.
+    """
+    return {"models": get_llm_usage_totals(db)}
+
+
 def calculate_score(frames):
     """
     Calculate the total score for a game based on the frames and rolls.
@@ -223,6 +680,21 @@ def calculate_score(frames):
     Returns:
         int: The calculated total score for the game.
     """
+    return current_score(calculate_frame_scores(frames))
+
+
+def calculate_frame_scores(frames):
+    """
+    Calculate the running score after each frame of a game.
+
+    Args:
+        frames (list): List of frames with rolls.
+
+    Returns:
+        list: The cumulative score after each started frame, or None for frames still
+        waiting on rolls or bonus rolls to be scored.
+    """
+    cumulative_scores = []
     total_score = 0
     rolls = []
     for frame in frames:
@@ -233,20 +705,69 @@ def calculate_score(frames):
         if frame_index >= len(rolls):
             break
 
+        frame_score = None
         if is_strike(rolls[frame_index]):  # Strike
             if frame_index + 2 < len(rolls):
-                total_score += 10 + rolls[frame_index + 1] + rolls[frame_index + 2]
+                frame_score = 10 + rolls[frame_index + 1] + rolls[frame_index + 2]
             frame_index += 1
         elif frame_index + 1 < len(rolls) and is_spare(rolls[frame_index], rolls[frame_index + 1]):  # Spare
             if frame_index + 2 < len(rolls):
-                total_score += 10 + rolls[frame_index + 2]
+                frame_score = 10 + rolls[frame_index + 2]
             frame_index += 2
         else:  # Regular frame
             if frame_index + 1 < len(rolls):
-                total_score += rolls[frame_index] + rolls[frame_index + 1]
+                frame_score = rolls[frame_index] + rolls[frame_index + 1]
             frame_index += 2
 
-    return total_score
+        if frame_score is None:
+            cumulative_scores.append(None)
+        else:
+            total_score += frame_score
+            cumulative_scores.append(total_score)
+
+    return cumulative_scores
+
+
+def current_score(cumulative_scores):
+    """
+    Return the score of the last fully scored frame, or 0 if no frame is scored yet.
+    """
+    return next((score for score in reversed(cumulative_scores) if score is not None), 0)
+
+
+def count_strikes_and_spares(frames):
+    """
+    Count the strikes and spares in a game.
+
+    Args:
+        frames (list): List of frames with rolls.
+
+    Returns:
+        tuple: The number of strikes and the number of spares.
+    """
+    strikes = 0
+    spares = 0
+    for frame in frames:
+        if not frame.rolls:
+            continue
+        if is_strike(frame.rolls[0]):
+            strikes += 1
+        elif len(frame.rolls) > 1 and is_spare(frame.rolls[0], frame.rolls[1]):
+            spares += 1
+
+    return strikes, spares
+
+
+def update_game_aggregates(game, frames):
+    """
+    Recalculate and store the score, strikes and spares of a game.
+
+    Args:
+        game (models.Game): The game to update.
+        frames (list): All frames of the game, ordered by frame number.
+    """
+    game.score = calculate_score(frames)
+    game.strikes, game.spares = count_strikes_and_spares(frames)
 
 
 def is_strike(roll):
@@ -0,0 +1,86 @@
+from fastapi import Request, Response
+
+
+def make_etag(kind: str, key, revision: int) -> str:
+    """
+    Build a weak ETag from a resource kind, its key and its revision counter.
+
+    Args:
+        kind (str): The kind of resource (e.g. "score", "history").
+        key: The identifier of the resource (game ID or player name).
+        revision (int): The revision counter of the underlying game or player.
+
+    Returns:
+        str: The quoted weak ETag value.
+    """
+    return f'W/"{kind}-{key}-{revision}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """
+    Check whether the client's `If-None-Match` header matches the current ETag.
+
+    Args:
+        request (Request): The incoming request.
+        etag (str): The current ETag of the resource.
+
+    Returns:
+        bool: True if the client already holds the current representation.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    # Weak comparison: ignore the W/ prefix on both sides
+    current = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == current for tag in if_none_match.split(","))
+
+
+def if_match_revision(request: Request, kind: str, key):
+    """
+    Read the revision the client expects from its `If-Match` header.
+
+    Args:
+        request (Request): The incoming request.
+        kind (str): The kind of resource the ETag was issued for.
+        key: The identifier of the resource.
+
+    Returns:
+        int or None: The revision named by the header, None if there is no header (or
+        it is `*`), or -1 if none of its ETags belong to this resource so it never matches.
+    """
+    if_match = request.headers.get("if-match")
+    if not if_match or if_match.strip() == "*":
+        return None
+
+    prefix = f"{kind}-{key}-"
+    for tag in if_match.split(","):
+        value = tag.strip().removeprefix("W/").strip('"')
+        if value.startswith(prefix) and value[len(prefix) :].isdecimal():
+            return int(value[len(prefix) :])
+
+    return -1
+
+
+def conditional_response(request: Request, response: Response, etag: str):
+    """
+    Attach the ETag to the response and build a 304 response if the client is up to date.
+
+    Args:
+        request (Request): The incoming request.
+        response (Response): The response the endpoint will return on a cache miss.
+        etag (str): The current ETag of the resource.
+
+    Returns:
+        Response or None: A 304 Not Modified response, or None if the full body must be sent.
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return None
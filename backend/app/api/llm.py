@@ -1,45 +1,29 @@
-from openai import OpenAI
-import os
-from dotenv import load_dotenv
+import threading
+import time
+from collections import namedtuple
+from app.api.prompts import build_prompt
+from app.core.config import settings
 
-# Load environment variables from .env file
-load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), "../../.env"))
+# What a backend may return instead of a plain string: the summary plus the token usage it reported,
+# and the model it was billed for when that differs from the backend's name
+Completion = namedtuple("Completion", ["text", "prompt_tokens", "completion_tokens", "model"], defaults=[None])
 
-# Access the OPENAI_API_KEY environment variable
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
-
-def get_llm_summary(frames, model: str = "gpt"):
+def openai_provider():
     """
-    Generate a summary of the current bowling game using OpenAI's GPT-4 model.
+    Create the OpenAI GPT-4o summarization backend.
 
-    Args:
-        frames (dict): Dictionary containing frame data.
-        model (str): The model to be used for summarization. Default is "gpt".
+    The OpenAI SDK is imported here rather than at module import time, so workers,
+    tests and cold containers only pay for it once a GPT summary is requested.
 
     Returns:
-        str: A generated summary of the current game status.
-    """
-    # Extract useful data from the frames
-    game_data = extract_game_data(frames)
-
-    # Prepare the prompt for GPT-4
-    prompt = f"""
-    You are a bowling expert, and you are summarizing the current bowling game status.
-    
-    The game consists of the following frames: {frames}.
-    
-    Total score: {game_data['total_score']}.
-    Number of strikes: {game_data['strikes']}.
-    Number of spares: {game_data['spares']}.
-    Number of open frames: {game_data['open_frames']}.
-    
-    Please provide a clear and short summary of the game so far, highlighting key moments such as strikes, spares, and any notable trends in the game.
+        callable: A function generating a summary (a Completion) for a prompt.
     """
+    from openai import OpenAI
 
-    if model == "gpt":
-        client = OpenAI(api_key=OPENAI_API_KEY)
+    client = OpenAI(api_key=settings.OPENAI_API_KEY, base_url=settings.OPENAI_BASE_URL)
 
+    def summarize(prompt: str) -> Completion:
         response = client.chat.completions.create(
             messages=[
                 {
@@ -47,27 +31,129 @@ def get_llm_summary(frames, model: str = "gpt"):
                     "content": prompt,
                 }
             ],
-            model="gpt-4o",
+            model=settings.OPENAI_MODEL,
+            max_tokens=settings.LLM_MAX_OUTPUT_TOKENS,
         )
 
-        # Extract and return the generated summary from the response
-        return response.choices[0].message.content
+        # Extract the generated summary, the token usage billed for it and the model that served it
+        usage = response.usage
+        return Completion(
+            response.choices[0].message.content,
+            usage.prompt_tokens if usage else None,
+            usage.completion_tokens if usage else None,
+            response.model or settings.OPENAI_MODEL,
+        )
+
+    return summarize
+
+
+def placeholder_provider(label: str):
+    """
+    Build a factory for a summarization backend that hasn't been implemented yet.
+
+    Args:
+        label (str): The display name of the model.
+
+    Returns:
+        callable: A provider factory returning a fixed apology message.
+    """
+
+    def factory():
+        return lambda prompt: f"Sorry, summarization with {label} hasn't been implemented yet."
+
+    return factory
+
+
+# Registry of summarization backends: model name -> factory creating the backend on first use
+PROVIDERS = {
+    "gpt": openai_provider,
+    "bert": placeholder_provider("BERT"),
+    "t5": placeholder_provider("T5"),
+    "llama": placeholder_provider("LLaMA"),
+}
+
+# Backends that have already been created, keyed by model name
+_loaded_providers = {}
+_providers_lock = threading.Lock()
+
+
+def register_provider(name: str, factory):
+    """
+    Register (or replace) a summarization backend.
+
+    Args:
+        name (str): The model name clients select the backend with.
+        factory (callable): Function creating the backend; called once, on first use.
+    """
+    with _providers_lock:
+        PROVIDERS[name] = factory
+        _loaded_providers.pop(name, None)
+
+
+def get_provider(name: str):
+    """
+    Return the summarization backend for a model, creating it on first use.
+
+    Args:
+        name (str): The model name.
+
+    Returns:
+        callable: A function generating a summary for a prompt.
+
+    Raises:
+        KeyError: If no backend is registered under that name.
+    """
+    provider = _loaded_providers.get(name)
+    if provider is None:
+        with _providers_lock:
+            provider = _loaded_providers.get(name)
+            if provider is None:
+                provider = _loaded_providers[name] = PROVIDERS[name]()
+
+    return provider
 
-    elif model == "bert":
-        # Placeholder for BERT-based summarization
-        return "Sorry, summarization with BERT hasn't been implemented yet."
 
-    elif model == "t5":
-        # Placeholder for T5-based summarization
-        return "Sorry, summarization with T5 hasn't been implemented yet."
+def summarize_game(frames, model: str = "gpt", running_scores=None, prompt_version: str = None):
+    """
+    Generate a summary of a bowling game and report the token usage of the request.
 
-    elif model == "llama":
-        # Placeholder for LLaMA-based summarization
-        return "Sorry, summarization with LLaMA hasn't been implemented yet."
+    The prompt is built with the configured prompt version and token budget. Usage is
+    only reported by backends returning a Completion with token counts.
 
-    else:
+    Args:
+        frames (dict): Dictionary containing frame data.
+        model (str): The model to be used for summarization. Default is "gpt".
+        running_scores (list): The cumulative score after each frame, if known.
+        prompt_version (str): The prompt version (default: LLM_PROMPT_VERSION).
+
+    Returns:
+        tuple: The summary, and a dict with the billed model (the backend's name if it reported
+        none), prompt version, prompt and completion tokens and latency of the request, or None
+        if the backend reported no usage.
+    """
+    if model not in PROVIDERS:
         # If the model is unknown, return an error message
-        return "Sorry, the selected model is not supported."
+        return "Sorry, the selected model is not supported.", None
+
+    prompt_version = prompt_version or settings.LLM_PROMPT_VERSION
+    prompt = build_prompt(prompt_version, frames, running_scores, settings.LLM_PROMPT_TOKEN_BUDGET)
+
+    started = time.perf_counter()
+    result = get_provider(model)(prompt)
+    latency = time.perf_counter() - started
+
+    if not isinstance(result, Completion):
+        return result, None
+    if result.prompt_tokens is None:
+        return result.text, None
+
+    return result.text, {
+        "model": result.model or model,
+        "prompt_version": prompt_version,
+        "prompt_tokens": result.prompt_tokens,
+        "completion_tokens": result.completion_tokens or 0,
+        "latency_ms": latency * 1000,
+    }
 
 
 def extract_game_data(frames):
@@ -0,0 +1,132 @@
+import math
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens of a prompt, at about four characters per token.
+    """
+    return math.ceil(len(text) / 4)
+
+
+def frame_notation(rolls) -> str:
+    """
+    Write the rolls of a frame in standard bowling notation.
+
+    Strikes are "X", spares "/" and misses "-", e.g. [10] is "X", [7, 3] is "7/",
+    [9, 0] is "9-" and a tenth frame of [10, 7, 3] is "X7/".
+
+    Args:
+        rolls (list): The pins knocked down by each roll of the frame.
+
+    Returns:
+        str: The frame in bowling notation.
+    """
+    marks = []
+    first_ball = True
+    standing = 10
+    for roll in rolls:
+        if roll == standing:
+            marks.append("X" if first_ball else "/")
+            first_ball, standing = True, 10
+        else:
+            marks.append(str(roll) if roll else "-")
+            # An open second ball ends the rack
+            standing = standing - roll if first_ball else 10
+            first_ball = not first_ball
+
+    return "".join(marks)
+
+
+def legacy_prompt(frames, running_scores=None, token_budget=None) -> str:
+    """
+    Version 1: the original free-form prompt embedding the Python repr of the frames.
+
+    Kept to benchmark newer versions against; it ignores the token budget.
+    """
+    from app.api.llm import extract_game_data
+
+    game_data = extract_game_data(frames)
+
+    return f"""
+    You are a bowling expert, and you are summarizing the current bowling game status.
+
+    The game consists of the following frames: {frames}.
+
+    Total score: {game_data['total_score']}.
+    Number of strikes: {game_data['strikes']}.
+    Number of spares: {game_data['spares']}.
+    Number of open frames: {game_data['open_frames']}.
+
+    Please provide a clear and short summary of the game so far, highlighting key moments such as strikes, spares, and any notable trends in the game.
+    """
+
+
+def compact_prompt(frames, running_scores=None, token_budget=None) -> str:
+    """
+    Version 2: the game as a scorecard in bowling notation, with running scores.
+
+    When the prompt would exceed the token budget, the running scores and then the
+    frame list are dropped, keeping at least the totals.
+
+    Args:
+        frames (dict): The rolls of each frame, keyed by frame label, in order.
+        running_scores (list): The cumulative score after each frame, None where not yet scored.
+        token_budget (int): Maximum estimated prompt tokens (default: unlimited).
+
+    Returns:
+        str: The prompt.
+    """
+    notations = [frame_notation(rolls) for rolls in frames.values()]
+    running_scores = list(running_scores or [])
+    running_scores += [None] * (len(notations) - len(running_scores))
+    scored = [score for score in running_scores if score is not None]
+
+    strikes = sum(notation.startswith("X") for notation in notations)
+    spares = sum(notation[1:2] == "/" for notation in notations)
+    totals = (
+        f"Score {scored[-1] if scored else 0} after {len(notations)} frames: "
+        f"{strikes} strikes, {spares} spares, {len(notations) - strikes - spares} open."
+    )
+    instruction = "Summarize this ten-pin bowling game in 2-3 short sentences, noting strikes, spares and trends."
+
+    with_scores = " | ".join(
+        f"{number} {notation} {'?' if score is None else score}"
+        for number, (notation, score) in enumerate(zip(notations, running_scores), start=1)
+    )
+    without_scores = " ".join(notations)
+    candidates = [
+        f"{instruction}\nFrames (notation, running score): {with_scores}\n{totals}",
+        f"{instruction}\nFrames: {without_scores}\n{totals}",
+        f"{instruction}\n{totals}",
+    ]
+
+    for prompt in candidates:
+        if token_budget is None or estimate_tokens(prompt) <= token_budget:
+            return prompt
+    return candidates[-1]
+
+
+# Prompt builders by version; summaries record the version they were generated with
+PROMPT_BUILDERS = {
+    "v1": legacy_prompt,
+    "v2": compact_prompt,
+}
+
+
+def build_prompt(version: str, frames, running_scores=None, token_budget=None) -> str:
+    """
+    Build the summary prompt of a game with the given prompt version.
+
+    Args:
+        version (str): The prompt version.
+        frames (dict): The rolls of each frame, keyed by frame label, in order.
+        running_scores (list): The cumulative score after each frame, if known.
+        token_budget (int): Maximum estimated prompt tokens (default: unlimited).
+
+    Returns:
+        str: The prompt.
+
+    Raises:
+        KeyError: If there is no such prompt version.
+    """
+    return PROMPT_BUILDERS[version](frames, running_scores, token_budget)
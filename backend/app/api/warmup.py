@@ -0,0 +1,235 @@
+import asyncio
+import logging
+import threading
+import time
+from fastapi import APIRouter, Response
+from sqlalchemy import text
+from sqlalchemy.orm import Session, configure_mappers
+from app.api.endpoints import DEFAULT_BIN_WIDTH, DEFAULT_TRENDS_WINDOW
+from app.core.cache import cache, player_tag
+from app.db import models, schemas
+from app.db.archive import load_frames, load_frames_bulk
+from app.db.events import read_roll_events
+from app.db.players import resolve_player
+from app.db.stats import get_player_score_distribution, get_player_trends
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# Recent games scanned per player to prime, when looking for recently active players
+GAMES_SCANNED_PER_PLAYER = 20
+
+
+def open_connections(engine, count: int) -> int:
+    """
+    Open pooled connections ahead of the first requests and return them to the pool.
+
+    Args:
+        engine (Engine): The engine whose pool is filled.
+        count (int): Number of connections to open, capped at the size of the pool.
+
+    Returns:
+        int: The number of connections opened.
+    """
+    pool_size = getattr(engine.pool, "size", None)
+    if pool_size is not None:
+        count = min(count, pool_size())
+
+    connections = []
+    try:
+        for _ in range(count):
+            connection = engine.connect()
+            connections.append(connection)
+            connection.execute(text("SELECT 1"))
+    finally:
+        for connection in connections:
+            connection.close()
+
+    return len(connections)
+
+
+def compile_hot_queries(db: Session) -> int:
+    """
+    Run the queries of the hot endpoints once, so their compiled SQL is cached by the engine.
+
+    The queries look up IDs that don't exist and change nothing; what is kept is the
+    SQL compiled for each statement, which later requests reuse.
+
+    Args:
+        db (Session): Database session bound to the engine to warm up.
+
+    Returns:
+        int: The number of queries run.
+    """
+    queries = [
+        lambda: db.query(models.Game).filter(models.Game.id == 0).first(),
+        lambda: load_frames(db, 0),
+        lambda: load_frames_bulk(db, [0]),
+        lambda: resolve_player(db, "0"),
+        lambda: db.get(models.PlayerStats, 0),
+        lambda: read_roll_events(db, 0, 1, game_id=0),
+    ]
+    for query in queries:
+        query()
+    db.rollback()
+
+    return len(queries)
+
+
+def recently_active_players(db: Session, limit: int):
+    """
+    Return the players of the most recent games, most recent first.
+
+    Only the latest games are scanned, by primary key, so this stays cheap on large tables.
+
+    Args:
+        db (Session): Database session.
+        limit (int): Maximum number of players.
+
+    Returns:
+        list: Player rows.
+    """
+    rows = db.query(models.Game.player_id).order_by(models.Game.id.desc()).limit(limit * GAMES_SCANNED_PER_PLAYER)
+    player_ids = list(dict.fromkeys(player_id for (player_id,) in rows))[:limit]
+    players = {player.id: player for player in db.query(models.Player).filter(models.Player.id.in_(player_ids))}
+
+    return [players[player_id] for player_id in player_ids if player_id in players]
+
+
+def prime_player_caches(db: Session, limit: int):
+    """
+    Fill the cache with the default trends and score distribution of recently active players.
+
+    Args:
+        db (Session): Database session.
+        limit (int): Maximum number of players to prime.
+
+    Returns:
+        list: The IDs of the players primed.
+    """
+    primed = []
+    for player in recently_active_players(db, limit):
+        stats = db.get(models.PlayerStats, player.id)
+        trends = get_player_trends(db, player, DEFAULT_TRENDS_WINDOW)
+        distribution = get_player_score_distribution(db, player, DEFAULT_BIN_WIDTH)
+        if stats is None or trends is None or distribution is None:
+            continue
+
+        # Stored with the revision like the endpoints do, which only reuse entries of the current revision
+        cache.set(("trends", player.id, DEFAULT_TRENDS_WINDOW), (stats.revision, trends), tags=[player_tag(player.id)])
+        cache.set(
+            ("distribution", player.id, DEFAULT_BIN_WIDTH), (stats.revision, distribution), tags=[player_tag(player.id)]
+        )
+        primed.append(player.id)
+
+    return primed
+
+
+def load_player_stats(db: Session, player_ids) -> int:
+    """
+    Read the statistics rollup rows of the given players.
+
+    `/players/{player}/statistics` reads these rows directly rather than through the
+    cache, so reading them ahead brings their pages into the database's buffer cache.
+
+    Args:
+        db (Session): Database session.
+        player_ids (list): The IDs of the players.
+
+    Returns:
+        int: The number of rows read.
+    """
+    rows = db.query(models.PlayerStats).filter(models.PlayerStats.player_id.in_(player_ids)).all()
+    db.rollback()
+
+    return len(rows)
+
+
+class Warmup:
+    """
+    Warms up a worker before it reports ready.
+
+    Pooled connections are opened and the hot queries compiled on the primary and on
+    every read replica. Then the trends and score distribution of recently active
+    players are primed in the cache, and their statistics rollup rows, which the
+    statistics endpoint reads uncached, are read on every database. Warm-up is best
+    effort: if it fails the worker still reports ready, and serves requests cold
+    rather than not at all.
+
+    Attributes:
+        ready (threading.Event): Set once warm-up has finished.
+        report (dict): What was warmed up and how long it took.
+    """
+
+    def __init__(self):
+        self.ready = threading.Event()
+        self.report = {}
+
+    def run(self, session_classes, connections: int, players: int):
+        """
+        Warm up the databases of the given session classes.
+
+        Args:
+            session_classes (list): Session classes of the primary database, then the read replicas.
+            connections (int): Connections to open per database.
+            players (int): Number of recently active players to prime the cache and statistics rows for.
+        """
+        started = time.perf_counter()
+        report = {"connections": 0, "queries": 0, "players": 0, "statistics_rows": 0}
+        try:
+            configure_mappers()
+            for session_class in session_classes:
+                with session_class() as db:
+                    report["connections"] += open_connections(db.get_bind(), connections)
+                    report["queries"] += compile_hot_queries(db)
+
+            if players > 0:
+                with session_classes[0]() as db:
+                    player_ids = prime_player_caches(db, players)
+                report["players"] = len(player_ids)
+
+                for session_class in session_classes:
+                    with session_class() as db:
+                        report["statistics_rows"] += load_player_stats(db, player_ids)
+        except Exception:
+            logger.exception("Warm-up failed; serving requests without it")
+        finally:
+            report["seconds"] = round(time.perf_counter() - started, 3)
+            self.report = report
+            self.ready.set()
+            logger.info("Warm-up finished: %s", report)
+
+    def start(self, session_classes, connections: int, players: int):
+        """
+        Run the warm-up in a worker thread, so the server answers /ready meanwhile.
+
+        Returns:
+            asyncio.Task: The running warm-up.
+        """
+        self.ready.clear()
+        return asyncio.create_task(asyncio.to_thread(self.run, session_classes, connections, players))
+
+
+warmup = Warmup()
+
+
+@router.get("/ready", response_model=schemas.ReadinessResponse)
+def get_readiness(response: Response):
+    """
+    Report whether this worker finished warming up and can take traffic.
+
+    Returns 503 while warm-up is still running, for load balancers and orchestrators
+    to hold traffic back until then.
+
+    Args:
+        response (Response): The outgoing response, whose status is set to 503 when not ready.
+
+    Returns:
+        dict: The readiness status and the warm-up report.
+    """
+    if not warmup.ready.is_set():
+        response.status_code = 503
+        return {"status": "warming up"}
+
+    return {"status": "ready", "warmup": warmup.report}
@@ -0,0 +1,189 @@
+import asyncio
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from app.core.config import settings
+
+
+class AdmissionRejected(Exception):
+    """
+    Raised when a request is shed by admission control.
+
+    Attributes:
+        retry_after (int): Seconds the client should wait before retrying.
+        reason (str): Why the request was rejected.
+    """
+
+    def __init__(self, retry_after: float, reason: str):
+        super().__init__(reason)
+        self.retry_after = max(1, math.ceil(retry_after))
+        self.reason = reason
+
+
+class TokenBuckets:
+    """
+    Per-client token bucket rate limiter.
+
+    Attributes:
+        rate (float): Tokens added per second to each client's bucket.
+        burst (int): Maximum number of tokens a bucket holds.
+        max_clients (int): Number of client buckets kept before the least recently used is dropped.
+    """
+
+    def __init__(self, rate: float, burst: int, max_clients: int = 10_000):
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, client_id: str) -> float:
+        """
+        Take a token from the client's bucket.
+
+        Args:
+            client_id (str): The identifier of the client.
+
+        Returns:
+            float: 0 if a token was taken, otherwise the seconds until one is available.
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.pop(client_id, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+
+            wait = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / self.rate
+
+            self._buckets[client_id] = (tokens, now)
+            while len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+
+        return wait
+
+
+class AdmissionController:
+    """
+    Bounds the number of concurrent slow calls, with a bounded wait queue and per-client and global rate limits.
+
+    At most `max_concurrent` calls run at once. Up to `max_queue` more wait for a slot,
+    each for at most `queue_timeout` seconds; anything beyond that is rejected at once so
+    a burst can't pile up behind slow calls. Calls are also rate limited per client and,
+    when `global_rate` is set, over all clients together.
+
+    Attributes:
+        max_concurrent (int): Maximum number of admitted calls running at once.
+        max_queue (int): Maximum number of calls waiting for a slot.
+        queue_timeout (float): Seconds a call may wait for a slot.
+        buckets (TokenBuckets): Per-client rate limiter.
+        global_bucket (TokenBuckets): Rate limiter shared by all clients (disabled when its rate is 0).
+    """
+
+    # Key of the single bucket shared by all clients
+    GLOBAL_KEY = "*"
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_queue: int,
+        queue_timeout: float,
+        rate: float,
+        burst: int,
+        global_rate: float = 0,
+        global_burst: int = 1,
+    ):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.buckets = TokenBuckets(rate, burst)
+        self.global_bucket = TokenBuckets(global_rate, global_burst, max_clients=1)
+        self.active = 0
+        self._waiters = deque()
+        self._lock = threading.Lock()
+
+    @asynccontextmanager
+    async def admit(self, client_id: str):
+        """
+        Hold an admission slot for the duration of the block.
+
+        Args:
+            client_id (str): The identifier of the client, used for rate limiting.
+
+        Raises:
+            AdmissionRejected: If the client or all clients together are over their rate, the queue
+                is full or the wait timed out.
+        """
+        wait = self.buckets.acquire(client_id)
+        if wait:
+            raise AdmissionRejected(wait, "Rate limit exceeded")
+
+        # Checked after the client's own limit, so a client over its rate can't drain the shared bucket
+        wait = self.global_bucket.acquire(self.GLOBAL_KEY)
+        if wait:
+            raise AdmissionRejected(wait, "Global rate limit exceeded")
+
+        await self._acquire_slot()
+        try:
+            yield
+        finally:
+            self._release_slot()
+
+    async def _acquire_slot(self):
+        with self._lock:
+            if self.active < self.max_concurrent:
+                self.active += 1
+                return
+            if len(self._waiters) >= self.max_queue:
+                raise AdmissionRejected(self.queue_timeout, "Too many pending requests")
+
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as error:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    if isinstance(error, asyncio.CancelledError):
+                        raise
+                    raise AdmissionRejected(self.queue_timeout, "Timed out waiting for capacity") from None
+            # The slot was handed over just as the wait ended: keep it, or pass it on if cancelled
+            if isinstance(error, asyncio.CancelledError):
+                self._release_slot()
+                raise
+
+    def _release_slot(self):
+        with self._lock:
+            if not self._waiters:
+                self.active -= 1
+                return
+            # Hand the slot straight to the oldest waiter; `active` stays unchanged
+            waiter = self._waiters.popleft()
+
+        waiter.get_loop().call_soon_threadsafe(_resolve, waiter)
+
+
+def _resolve(waiter):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+# Admission control guarding the slow LLM calls of the summary endpoint
+summary_admission = AdmissionController(
+    settings.SUMMARY_MAX_CONCURRENT,
+    settings.SUMMARY_MAX_QUEUE,
+    settings.SUMMARY_QUEUE_TIMEOUT,
+    settings.SUMMARY_RATE_PER_CLIENT,
+    settings.SUMMARY_BURST_PER_CLIENT,
+    settings.SUMMARY_GLOBAL_RATE,
+    settings.SUMMARY_GLOBAL_BURST,
+)
@@ -0,0 +1,200 @@
+import logging
+import select
+import threading
+import time
+from collections import OrderedDict
+from sqlalchemy import event, func
+from sqlalchemy import select as sql_select
+from sqlalchemy.orm import Session
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Postgres channel used to broadcast invalidation events to every worker
+INVALIDATION_CHANNEL = "bowling_cache_invalidation"
+
+# Session.info key holding the tags to invalidate once the transaction commits
+PENDING_TAGS = "cache_invalidation_tags"
+
+
+def game_tag(game_id) -> str:
+    """Return the invalidation tag of everything derived from a game."""
+    return f"game:{game_id}"
+
+
+def player_tag(player_id) -> str:
+    """Return the invalidation tag of everything derived from a player's games."""
+    return f"player:{player_id}"
+
+
+class Cache:
+    """
+    Thread-safe in-process LRU cache with a TTL and tag-based invalidation.
+
+    Every entry is stored with the tags it depends on; invalidating a tag drops all
+    entries carrying it. The TTL bounds staleness of entries read from lagging replicas.
+
+    Attributes:
+        max_entries (int): Maximum number of cached entries before the oldest are evicted.
+        ttl (float): Seconds an entry stays valid.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 30.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._tags = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Return the cached value for a key, or `default` if it's missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+
+            value, expires_at, _ = entry
+            if expires_at < time.monotonic():
+                self._drop(key)
+                return default
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, tags=()):
+        """
+        Cache a value under a key, tagged with the resources it was derived from.
+        """
+        if self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = (value, time.monotonic() + self.ttl, tuple(tags))
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate(self, tag):
+        """
+        Drop every entry carrying the given tag.
+        """
+        with self._lock:
+            for key in self._tags.pop(tag, ()):
+                self._drop(key)
+
+    def clear(self):
+        """
+        Drop every entry.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+
+    def _drop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+cache = Cache(settings.CACHE_MAX_ENTRIES, settings.CACHE_TTL_SECONDS)
+
+# Last generated summary per game and model; kept past invalidation so degraded mode can serve it
+summary_cache = Cache(settings.CACHE_MAX_ENTRIES, settings.SUMMARY_CACHE_TTL_SECONDS)
+
+
+def publish_invalidation(db: Session, *tags):
+    """
+    Invalidate cached entries for the given tags once the session's transaction commits.
+
+    With Postgres invalidation enabled the tags are also sent with NOTIFY inside the
+    transaction, so every other worker receives them exactly when the write commits.
+
+    Args:
+        db (Session): The session performing the write.
+        *tags (str): The tags to invalidate.
+    """
+    db.info.setdefault(PENDING_TAGS, set()).update(tags)
+
+    if settings.CACHE_INVALIDATION == "postgres":
+        for tag in tags:
+            db.execute(sql_select(func.pg_notify(INVALIDATION_CHANNEL, tag)))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session):
+    for tag in session.info.pop(PENDING_TAGS, ()):
+        cache.invalidate(tag)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session):
+    session.info.pop(PENDING_TAGS, None)
+
+
+class InvalidationListener:
+    """
+    Background thread that applies invalidation events broadcast with Postgres NOTIFY.
+
+    Each worker process runs one listener on a dedicated connection. After connecting,
+    and after every reconnect, the whole local cache is cleared because events sent
+    while the listener was disconnected are lost.
+
+    Attributes:
+        engine (Engine): Engine of the primary database.
+        channel (str): The NOTIFY channel to listen on.
+    """
+
+    def __init__(self, engine, channel: str = INVALIDATION_CHANNEL):
+        self.engine = engine
+        self.channel = channel
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="cache-invalidation", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join(timeout=5)
+
+    def _run(self):
+        backoff = 1
+        while not self._stopped.is_set():
+            try:
+                self._listen()
+                backoff = 1
+            except Exception:
+                logger.exception("Cache invalidation listener disconnected, retrying in %ss", backoff)
+                self._stopped.wait(backoff)
+                backoff = min(backoff * 2, 30)
+
+    def _listen(self):
+        raw = self.engine.raw_connection()
+        try:
+            connection = raw.driver_connection
+            connection.autocommit = True
+            with connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {self.channel}")
+            cache.clear()
+
+            while not self._stopped.is_set():
+                if select.select([connection], [], [], 1.0) == ([], [], []):
+                    continue
+                connection.poll()
+                while connection.notifies:
+                    cache.invalidate(connection.notifies.pop(0).payload)
+        finally:
+            raw.invalidate()
@@ -28,5 +28,70 @@ class Settings:
             POSTGRES_DB,
         )
 
+    # Optional comma-separated read replica URLs used by the read-only endpoints
+    DATABASE_REPLICA_URLS: list = [
+        url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()
+    ]
+
+    # Seconds after a client's own write during which its reads are served by the primary
+    READ_YOUR_WRITES_SECONDS: int = int(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+
+    # In-process response cache shared by the requests of one worker
+    CACHE_MAX_ENTRIES: int = int(os.getenv("CACHE_MAX_ENTRIES", "1024"))
+    CACHE_TTL_SECONDS: float = float(os.getenv("CACHE_TTL_SECONDS", "30"))
+
+    # How cache invalidation reaches other workers: "local" (single process) or "postgres" (LISTEN/NOTIFY)
+    CACHE_INVALIDATION: str = os.getenv("CACHE_INVALIDATION", "local").lower()
+
+    # Completed games older than this many days are moved to the compact archive
+    ARCHIVE_AFTER_DAYS: int = int(os.getenv("ARCHIVE_AFTER_DAYS", "90"))
+
+    # Admission control for the LLM summary endpoint, per worker process
+    SUMMARY_MAX_CONCURRENT: int = int(os.getenv("SUMMARY_MAX_CONCURRENT", "4"))
+    SUMMARY_MAX_QUEUE: int = int(os.getenv("SUMMARY_MAX_QUEUE", "8"))
+    SUMMARY_QUEUE_TIMEOUT: float = float(os.getenv("SUMMARY_QUEUE_TIMEOUT", "10"))
+    SUMMARY_RATE_PER_CLIENT: float = float(os.getenv("SUMMARY_RATE_PER_CLIENT", "0.2"))
+    SUMMARY_BURST_PER_CLIENT: int = int(os.getenv("SUMMARY_BURST_PER_CLIENT", "3"))
+
+    # Rate limit over all clients together, per worker process (0 disables it)
+    SUMMARY_GLOBAL_RATE: float = float(os.getenv("SUMMARY_GLOBAL_RATE", "2"))
+    SUMMARY_GLOBAL_BURST: int = int(os.getenv("SUMMARY_GLOBAL_BURST", "10"))
+
+    # Serve the last cached summary instead of a 429 when a summary request is shed
+    SUMMARY_DEGRADED_MODE: bool = os.getenv("SUMMARY_DEGRADED_MODE", "true").lower() in ("1", "true", "yes")
+    SUMMARY_CACHE_TTL_SECONDS: float = float(os.getenv("SUMMARY_CACHE_TTL_SECONDS", "86400"))
+
+    # API key of the OpenAI backend used for GPT game summaries
+    OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY")
+
+    # Model and endpoint of the OpenAI backend; any OpenAI-compatible server can be used (default: OpenAI)
+    OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-4o")
+    OPENAI_BASE_URL: str = os.getenv("OPENAI_BASE_URL") or None
+
+    # Summary prompt encoding (see app.api.prompts) and its budget in estimated tokens
+    LLM_PROMPT_VERSION: str = os.getenv("LLM_PROMPT_VERSION", "v2")
+    LLM_PROMPT_TOKEN_BUDGET: int = int(os.getenv("LLM_PROMPT_TOKEN_BUDGET", "256"))
+
+    # Maximum number of tokens a summary may be generated with
+    LLM_MAX_OUTPUT_TOKENS: int = int(os.getenv("LLM_MAX_OUTPUT_TOKENS", "150"))
+
+    # On-demand request profiling: requests sending this token in X-Profile are profiled (empty disables)
+    PROFILING_TOKEN: str = os.getenv("PROFILING_TOKEN", "")
+
+    # Profile every request, e.g. on a local or staging server
+    PROFILE_ALL_REQUESTS: bool = os.getenv("PROFILE_ALL_REQUESTS", "false").lower() in ("1", "true", "yes")
+
+    # Directory the collapsed-stack profiles and time breakdowns are written to
+    PROFILE_DIR: str = os.getenv("PROFILE_DIR", "profiles")
+
+    # Startup warm-up: pooled connections opened per database, and recently active players whose
+    # trends, distribution and statistics rows are primed (0 disables priming); /ready reports 503 until it finishes
+    WARMUP_ENABLED: bool = os.getenv("WARMUP_ENABLED", "true").lower() in ("1", "true", "yes")
+    WARMUP_CONNECTIONS: int = int(os.getenv("WARMUP_CONNECTIONS", "5"))
+    WARMUP_PRIME_PLAYERS: int = int(os.getenv("WARMUP_PRIME_PLAYERS", "0"))
+
+    # Opt-in fast JSON rendering of responses with orjson
+    ORJSON_RESPONSES: bool = os.getenv("ORJSON_RESPONSES", "false").lower() in ("1", "true", "yes")
+
 
 settings = Settings()
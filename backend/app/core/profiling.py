@@ -0,0 +1,197 @@
+import hmac
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.middleware.base import BaseHTTPMiddleware
+
+logger = logging.getLogger(__name__)
+
+# Header carrying the profiling token of a request that asks to be profiled
+PROFILE_HEADER = "X-Profile"
+
+# SQL timings of the request being profiled; unset for every other request
+_sql_timings: ContextVar = ContextVar("sql_timings", default=None)
+
+
+class SqlTimings:
+    """
+    Accumulates the number and duration of the SQL statements run by one request.
+    """
+
+    def __init__(self):
+        self.statements = 0
+        self.seconds = 0.0
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _sql_timings.get() is not None:
+        conn.info.setdefault("profile_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    timings = _sql_timings.get()
+    if timings is not None and conn.info.get("profile_started"):
+        timings.statements += 1
+        timings.seconds += time.perf_counter() - conn.info["profile_started"].pop()
+
+
+# Innermost frames of threads waiting for work: (file name, function name)
+IDLE_FRAMES = {("threading.py", "wait"), ("selectors.py", "select")}
+
+
+class StackSampler:
+    """
+    Samples the Python stacks of all threads of the process at a fixed interval.
+
+    A request runs both on the event-loop thread and, for sync handlers and
+    dependencies, on threadpool threads, so every thread but the sampler's own is
+    sampled. Threads waiting for work are left out, and each stack is rooted at the
+    name of its thread.
+
+    Samples are kept as collapsed stacks ("outer;inner;innermost count" lines), the
+    input format of flamegraph.pl, speedscope and most flame graph viewers.
+
+    Attributes:
+        interval (float): Seconds between samples.
+        samples (Counter): Number of samples per collapsed stack.
+    """
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.samples = Counter()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                code = frame.f_code
+                if thread_id == self._thread.ident or (os.path.basename(code.co_filename), code.co_name) in IDLE_FRAMES:
+                    continue
+
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(
+                        f"{getattr(code, 'co_qualname', code.co_name)} ({code.co_filename}:{code.co_firstlineno})"
+                    )
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, str(thread_id)))
+                self.samples[";".join(reversed(stack))] += 1
+
+    def collapsed(self) -> str:
+        """
+        Return the samples as collapsed stacks, one per line.
+        """
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+
+class ProfilingMiddleware(BaseHTTPMiddleware):
+    """
+    Profiles single requests on demand.
+
+    A request is profiled when it sends the configured token in the `X-Profile`
+    header, or for every request when `profile_all` is set. The threads of the
+    worker are sampled while it runs, and a collapsed-stack profile plus a JSON
+    breakdown of SQL and Python time are written to `directory`. The breakdown is
+    also returned in a `Server-Timing` header. Only one request per worker is
+    profiled at a time; others are served normally meanwhile, and their stacks
+    show up in the profile when they run alongside it, so profile under light load.
+
+    The middleware is only installed when profiling is configured, so requests
+    pay nothing for it otherwise.
+
+    Attributes:
+        token (str): Token a request must send to be profiled, or empty to disable the header.
+        profile_all (bool): Profile every request.
+        directory (Path): Directory the profiles are written to.
+    """
+
+    def __init__(self, app, token: str = "", profile_all: bool = False, directory: str = "profiles"):
+        super().__init__(app)
+        self.token = token
+        self.profile_all = profile_all
+        self.directory = Path(directory)
+        self._busy = threading.Lock()
+
+        if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+            event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+            event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+    def wants_profile(self, request) -> bool:
+        if self.profile_all:
+            return True
+        header = request.headers.get(PROFILE_HEADER)
+        return bool(self.token and header and hmac.compare_digest(header, self.token))
+
+    async def dispatch(self, request, call_next):
+        if not self.wants_profile(request) or not self._busy.acquire(blocking=False):
+            return await call_next(request)
+
+        try:
+            timings = SqlTimings()
+            token = _sql_timings.set(timings)
+            started = time.perf_counter()
+            try:
+                with StackSampler() as sampler:
+                    response = await call_next(request)
+            finally:
+                _sql_timings.reset(token)
+            elapsed = time.perf_counter() - started
+
+            name = self.write_profile(request, sampler, timings, elapsed)
+        finally:
+            self._busy.release()
+
+        response.headers["Server-Timing"] = (
+            f"sql;dur={timings.seconds * 1000:.2f}, "
+            f"python;dur={(elapsed - timings.seconds) * 1000:.2f}, "
+            f"total;dur={elapsed * 1000:.2f}"
+        )
+        response.headers[PROFILE_HEADER] = name
+        return response
+
+    def write_profile(self, request, sampler: StackSampler, timings: SqlTimings, elapsed: float) -> str:
+        """
+        Write the collapsed stacks and the time breakdown of a profiled request.
+
+        Returns:
+            str: The base name of the written files.
+        """
+        path = re.sub(r"[^A-Za-z0-9.-]+", "_", request.url.path.strip("/")) or "root"
+        name = f"{datetime.utcnow():%Y%m%dT%H%M%S%f}-{request.method}-{path}"
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (self.directory / f"{name}.folded").write_text(sampler.collapsed())
+        breakdown = {
+            "method": request.method,
+            "path": request.url.path,
+            "total_ms": round(elapsed * 1000, 3),
+            "sql_ms": round(timings.seconds * 1000, 3),
+            "python_ms": round((elapsed - timings.seconds) * 1000, 3),
+            "sql_statements": timings.statements,
+            "samples": sum(sampler.samples.values()),
+        }
+        (self.directory / f"{name}.json").write_text(json.dumps(breakdown, indent=2))
+        logger.info("Profiled %s %s: %s", request.method, request.url.path, breakdown)
+
+        return name
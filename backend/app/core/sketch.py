@@ -0,0 +1,102 @@
+import math
+
+# Highest possible bowling score; scores are integers in [0, MAX_SCORE]
+MAX_SCORE = 300
+
+
+class ScoreSketch:
+    """
+    Mergeable streaming sketch of a score distribution.
+
+    Bowling scores are integers between 0 and 300, so a fixed array of 301 counters
+    is an exact sketch: memory stays constant however many games are added, two
+    sketches merge by adding their counters, and quantiles are exact.
+
+    Attributes:
+        counts (list): Number of games per score.
+    """
+
+    def __init__(self):
+        self.counts = [0] * (MAX_SCORE + 1)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts)
+
+    def add(self, score: int, count: int = 1):
+        """
+        Add `count` games with the given score, clamped to the valid range.
+        """
+        self.counts[min(max(int(score), 0), MAX_SCORE)] += count
+
+    def merge(self, other: "ScoreSketch"):
+        """
+        Add the games of another sketch to this one.
+        """
+        self.counts = [mine + theirs for mine, theirs in zip(self.counts, other.counts)]
+        return self
+
+    def value_at(self, rank: int) -> int:
+        """
+        Return the score of the game at a zero-based rank in ascending order.
+        """
+        seen = 0
+        for score, count in enumerate(self.counts):
+            seen += count
+            if seen > rank:
+                return score
+        raise IndexError("rank out of range")
+
+    def quantile(self, fraction: float):
+        """
+        Return the continuous quantile, interpolated like SQL `percentile_cont`.
+
+        Args:
+            fraction (float): The quantile to compute, between 0 and 1.
+
+        Returns:
+            float or None: The quantile, or None if the sketch is empty.
+        """
+        total = self.total
+        if not total:
+            return None
+
+        position = fraction * (total - 1)
+        lower = self.value_at(math.floor(position))
+        upper = self.value_at(math.ceil(position))
+        return lower + (upper - lower) * (position - math.floor(position))
+
+    def percentile_rank(self, score: float) -> float:
+        """
+        Return the percentage of games scoring below `score`, counting ties as half.
+
+        Args:
+            score (float): The score to rank.
+
+        Returns:
+            float: The percentile rank between 0 and 100.
+        """
+        total = self.total
+        if not total:
+            return 0.0
+
+        below = sum(count for value, count in enumerate(self.counts) if value < score)
+        ties = sum(count for value, count in enumerate(self.counts) if value == score)
+        return 100 * (below + ties / 2) / total
+
+    def histogram(self, bin_width: int):
+        """
+        Group the scores into bins of `bin_width` points.
+
+        Args:
+            bin_width (int): Width of each bin in points.
+
+        Returns:
+            list: (low, high, count) tuples for every non-empty bin, in ascending order.
+        """
+        bins = {}
+        for score, count in enumerate(self.counts):
+            if count:
+                bins[score // bin_width] = bins.get(score // bin_width, 0) + count
+
+        return [(index * bin_width, index * bin_width + bin_width - 1, count) for index, count in sorted(bins.items())]
@@ -0,0 +1,272 @@
+import argparse
+import logging
+from collections import namedtuple
+from datetime import datetime, timedelta
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.db.models import Frame, Game, GameArchive
+
+logger = logging.getLogger(__name__)
+
+# Lightweight stand-in for a Frame row, rebuilt from the archive
+ArchivedFrame = namedtuple("ArchivedFrame", ["frame_number", "rolls"])
+
+
+def pack_frames(frames) -> bytes:
+    """
+    Pack the rolls of a game into bytes: a roll count followed by the rolls, per frame.
+
+    A complete game takes at most 31 bytes, versus ten rows in the frames table.
+
+    Args:
+        frames (list): Frames of the game, ordered by frame number.
+
+    Returns:
+        bytes: The packed rolls.
+    """
+    packed = bytearray()
+    for frame in frames:
+        packed.append(len(frame.rolls))
+        packed.extend(frame.rolls)
+
+    return bytes(packed)
+
+
+def unpack_frames(packed: bytes):
+    """
+    Unpack rolls packed by `pack_frames`.
+
+    Args:
+        packed (bytes): The packed rolls.
+
+    Returns:
+        list: ArchivedFrame tuples ordered by frame number.
+    """
+    packed = bytes(packed)
+    frames = []
+    position = 0
+    while position < len(packed):
+        count = packed[position]
+        frames.append(ArchivedFrame(len(frames) + 1, list(packed[position + 1 : position + 1 + count])))
+        position += 1 + count
+
+    return frames
+
+
+def has_valid_rolls(frames) -> bool:
+    """
+    Check that every roll of a game knocks down between 0 and 10 pins.
+
+    Rolls are not validated when they are recorded, so a game can hold values that
+    `pack_frames` cannot pack into one byte each.
+
+    Args:
+        frames (list): Frames of the game, ordered by frame number.
+
+    Returns:
+        bool: True if every roll is between 0 and 10.
+    """
+    return all(isinstance(roll, int) and 0 <= roll <= 10 for frame in frames for roll in frame.rolls)
+
+
+def is_game_complete(frames) -> bool:
+    """
+    Check whether all ten frames of a game, including bonus rolls, have been bowled.
+
+    Args:
+        frames (list): Frames of the game, ordered by frame number.
+
+    Returns:
+        bool: True if the game is finished.
+    """
+    if len(frames) != 10:
+        return False
+
+    for frame in frames[:9]:
+        if frame.rolls != [10] and len(frame.rolls) != 2:
+            return False
+
+    tenth = frames[9].rolls
+    if len(tenth) < 2:
+        return False
+    if tenth[0] == 10 or tenth[0] + tenth[1] == 10:
+        return len(tenth) == 3
+
+    return len(tenth) == 2
+
+
+def load_frames(db: Session, game_id: int):
+    """
+    Load the frames of a game from the hot frames table, or from the archive.
+
+    Args:
+        db (Session): Database session.
+        game_id (int): The ID of the game.
+
+    Returns:
+        list: Frames ordered by frame number (Frame rows or ArchivedFrame tuples).
+    """
+    frames = db.query(Frame).filter(Frame.game_id == game_id).order_by(Frame.frame_number).all()
+    if frames:
+        return frames
+
+    archive = db.get(GameArchive, game_id)
+    return unpack_frames(archive.rolls) if archive else []
+
+
+def load_frames_bulk(db: Session, game_ids):
+    """
+    Load the frames of many games at once, from the hot frames table or the archive.
+
+    Hot frames are read with a single IN query; games without hot frames are looked
+    up in the archive with a second one.
+
+    Args:
+        db (Session): Database session.
+        game_ids (list): The IDs of the games.
+
+    Returns:
+        dict: Frames ordered by frame number for each game ID (empty if the game has none).
+    """
+    frames = {game_id: [] for game_id in game_ids}
+    rows = (
+        db.query(Frame.game_id, Frame.frame_number, Frame.rolls)
+        .filter(Frame.game_id.in_(frames))
+        .order_by(Frame.game_id, Frame.frame_number)
+    )
+    for game_id, frame_number, rolls in rows:
+        frames[game_id].append(ArchivedFrame(frame_number, rolls))
+
+    cold = [game_id for game_id, game_frames in frames.items() if not game_frames]
+    if cold:
+        for archive in db.query(GameArchive).filter(GameArchive.game_id.in_(cold)):
+            frames[archive.game_id] = unpack_frames(archive.rolls)
+
+    return frames
+
+
+def restore_game(db: Session, game: Game):
+    """
+    Move an archived game's frames back into the frames table so it can be edited.
+
+    Args:
+        db (Session): Database session.
+        game (Game): The archived game.
+
+    Returns:
+        list: The restored Frame rows, ordered by frame number.
+    """
+    frames = []
+    archive = db.get(GameArchive, game.id)
+    if archive is not None:
+        frames = [
+            Frame(game_id=game.id, frame_number=frame.frame_number, rolls=frame.rolls)
+            for frame in unpack_frames(archive.rolls)
+        ]
+        db.add_all(frames)
+        db.delete(archive)
+
+    game.archived = False
+    db.flush()
+    return frames
+
+
+def archive_games(db: Session, older_than: timedelta, batch_size: int = 500):
+    """
+    Move completed games started before the cutoff from the frames table into the archive.
+
+    Games are processed in batches of `batch_size`, each committed separately. Unfinished
+    games, and games with rolls outside 0-10 (logged), are left in the hot table.
+
+    A game is only archived if its revision is still the one read with its frames, so a
+    correction recorded meanwhile is never lost; the game is left for the next run instead.
+
+    Args:
+        db (Session): Database session.
+        older_than (timedelta): Minimum age of the games to archive.
+        batch_size (int): Number of candidate games per batch (default: 500).
+
+    Returns:
+        int: The number of games archived.
+    """
+    cutoff = datetime.utcnow() - older_than
+    archived = 0
+    last_id = 0
+
+    while True:
+        revisions = dict(
+            db.query(Game.id, Game.revision)
+            .filter(Game.archived.is_(False), Game.start_time < cutoff, Game.id > last_id)
+            .order_by(Game.id)
+            .limit(batch_size)
+        )
+        if not revisions:
+            return archived
+        game_ids = list(revisions)
+        last_id = game_ids[-1]
+
+        frames_by_game = {}
+        for frame in db.query(Frame).filter(Frame.game_id.in_(game_ids)).order_by(Frame.game_id, Frame.frame_number):
+            frames_by_game.setdefault(frame.game_id, []).append(frame)
+
+        completed = []
+        for game_id, frames in frames_by_game.items():
+            if not is_game_complete(frames):
+                continue
+            if not has_valid_rolls(frames):
+                # Left in the hot table rather than aborting the batch and every later run
+                logger.warning("Not archiving game %s: it has rolls outside 0-10", game_id)
+                continue
+            completed.append(game_id)
+
+        # Claim each game at the revision its frames were read at; games corrected since are skipped
+        completed = [
+            game_id
+            for game_id in completed
+            if db.query(Game)
+            .filter(Game.id == game_id, Game.revision == revisions[game_id], Game.archived.is_(False))
+            .update({Game.archived: True}, synchronize_session=False)
+        ]
+
+        if completed:
+            db.add_all(
+                GameArchive(game_id=game_id, rolls=pack_frames(frames_by_game[game_id])) for game_id in completed
+            )
+            db.query(Frame).filter(Frame.game_id.in_(completed)).delete(synchronize_session=False)
+
+        db.commit()
+        db.expunge_all()
+        archived += len(completed)
+
+
+def main(argv=None):
+    """
+    Command line entry point for archiving finished games.
+
+    Usage:
+        python -m app.db.archive [--older-than-days DAYS] [--batch-size N]
+    """
+    parser = argparse.ArgumentParser(description="Move completed games into the compact archive.")
+    parser.add_argument(
+        "--older-than-days",
+        type=int,
+        default=settings.ARCHIVE_AFTER_DAYS,
+        help=f"Archive completed games older than this many days (default: {settings.ARCHIVE_AFTER_DAYS}).",
+    )
+    parser.add_argument("--batch-size", type=int, default=500, help="Games per transaction (default: 500).")
+    args = parser.parse_args(argv)
+
+    # Imported here so the module can be used without opening the configured database
+    from app.db.base import SessionLocal
+
+    db = SessionLocal()
+    try:
+        count = archive_games(db, timedelta(days=args.older_than_days), args.batch_size)
+    finally:
+        db.close()
+
+    print(f"Archived {count} game(s).")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,7 @@
+import itertools
+import threading
+import time
+from fastapi import Request, Response
 from sqlalchemy import create_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 from app.core.config import settings
@@ -10,6 +14,15 @@ engine = create_engine(DATABASE_URL)
 # Session local class for managing database sessions
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Engines and session classes for the optional read replicas
+replica_engines = [create_engine(url) for url in settings.DATABASE_REPLICA_URLS]
+ReplicaSessionLocals = [
+    sessionmaker(autocommit=False, autoflush=False, bind=replica_engine) for replica_engine in replica_engines
+]
+
+# Cookie holding the time until which a client's reads must see its own writes
+READ_YOUR_WRITES_COOKIE = "bowling_read_primary_until"
+
 # Base class for SQLAlchemy models
 Base = declarative_base()
 
@@ -27,3 +40,111 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+class ReadRouter:
+    """
+    Route read-only sessions to read replicas, round-robin.
+
+    Clients that wrote recently carry a read-your-writes cookie and are served by the
+    primary until it expires, so they never observe replica lag on their own rolls.
+
+    Attributes:
+        primary (sessionmaker): Session class bound to the primary database.
+        replicas (list): Session classes bound to the read replicas.
+        read_your_writes_seconds (int): How long reads stick to the primary after a write.
+    """
+
+    def __init__(self, primary, replicas, read_your_writes_seconds: int):
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self._next_replica = itertools.cycle(self.replicas)
+        self._lock = threading.Lock()
+
+    def mark_write(self, response: Response):
+        """
+        Pin the client's following reads to the primary for the read-your-writes window.
+
+        Args:
+            response (Response): The response of the write request.
+        """
+        if not self.replicas or self.read_your_writes_seconds <= 0:
+            return
+
+        until = time.time() + self.read_your_writes_seconds
+        response.set_cookie(
+            READ_YOUR_WRITES_COOKIE,
+            f"{until:.3f}",
+            max_age=self.read_your_writes_seconds,
+            httponly=True,
+            samesite="lax",
+        )
+
+    def wrote_recently(self, request: Request) -> bool:
+        """
+        Check whether the client is still inside its read-your-writes window.
+
+        Args:
+            request (Request): The incoming request.
+
+        Returns:
+            bool: True if the client's reads must go to the primary.
+        """
+        try:
+            return float(request.cookies.get(READ_YOUR_WRITES_COOKIE, 0)) > time.time()
+        except ValueError:
+            return False
+
+    def session_class(self, request: Request):
+        """
+        Pick the session class serving a read-only request.
+
+        Args:
+            request (Request): The incoming request.
+
+        Returns:
+            sessionmaker: The primary session class or the next replica's.
+        """
+        if not self.replicas or self.wrote_recently(request):
+            return self.primary
+
+        with self._lock:
+            return next(self._next_replica)
+
+    def get_db(self, request: Request):
+        """
+        Dependency that provides a read-only database session for each request.
+
+        Yields:
+            db: Database session bound to a replica, or to the primary when needed.
+        """
+        db = self.session_class(request)()
+        try:
+            yield db
+        finally:
+            db.close()
+
+
+read_router = ReadRouter(SessionLocal, ReplicaSessionLocals, settings.READ_YOUR_WRITES_SECONDS)
+
+
+# Dependency for getting a read-only DB session
+def get_read_db(request: Request):
+    """
+    Dependency that provides a read-only database session for each request.
+
+    Yields:
+        db: Database session bound to a read replica when one is configured.
+    """
+    yield from read_router.get_db(request)
+
+
+def mark_write(response: Response):
+    """
+    Pin the client's following reads to the primary after it wrote to the database.
+
+    Args:
+        response (Response): The response of the write request.
+    """
+    read_router.mark_write(response)
@@ -0,0 +1,73 @@
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from app.db.models import RollEvent
+
+# Postgres advisory lock key serializing writers of the roll event log
+ROLL_EVENTS_LOCK = 0x726F6C6C
+
+
+def event_kind(previous_rolls, rolls) -> str:
+    """
+    Classify a frame write: "roll" if it only adds rolls, "correction" if it changes earlier ones.
+
+    Args:
+        previous_rolls (list): The rolls of the frame before the write, or None for a new frame.
+        rolls (list): The rolls of the frame after the write.
+
+    Returns:
+        str: The kind of event.
+    """
+    if previous_rolls is None or rolls[: len(previous_rolls)] == list(previous_rolls):
+        return "roll"
+    return "correction"
+
+
+def record_roll_events(db: Session, game_id: int, revision: int, changes):
+    """
+    Append one event per written frame to the roll event log.
+
+    Call this last, just before committing: on Postgres it takes a transaction-level
+    advisory lock so sequence numbers are handed out in commit order, and a consumer
+    that resumes after a sequence number never skips an event committed later with
+    a lower number.
+
+    Args:
+        db (Session): Database session.
+        game_id (int): The ID of the game.
+        revision (int): The revision of the game after the write.
+        changes (list): (frame_number, previous_rolls, rolls) tuples of the written frames.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(select(func.pg_advisory_xact_lock(ROLL_EVENTS_LOCK)))
+
+    db.add_all(
+        RollEvent(
+            game_id=game_id,
+            frame_number=frame_number,
+            rolls=rolls,
+            previous_rolls=previous_rolls,
+            kind=event_kind(previous_rolls, rolls),
+            revision=revision,
+        )
+        for frame_number, previous_rolls, rolls in changes
+    )
+
+
+def read_roll_events(db: Session, after: int, limit: int, game_id: int = None):
+    """
+    Read a batch of events from the roll event log, oldest first.
+
+    Args:
+        db (Session): Database session.
+        after (int): Only return events with a sequence number above this.
+        limit (int): Maximum number of events to return.
+        game_id (int): Only return the events of this game (default: all games).
+
+    Returns:
+        list: RollEvent rows ordered by sequence number.
+    """
+    query = db.query(RollEvent).filter(RollEvent.sequence > after)
+    if game_id is not None:
+        query = query.filter(RollEvent.game_id == game_id)
+
+    return query.order_by(RollEvent.sequence).limit(limit).all()
@@ -1,8 +1,58 @@
-from sqlalchemy import Column, String, Integer, ForeignKey, Table, DateTime
-from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy import (
+    Column,
+    String,
+    Integer,
+    BigInteger,
+    ForeignKey,
+    Table,
+    DateTime,
+    Index,
+    Boolean,
+    LargeBinary,
+    Float,
+)
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db.base import Base
+from app.db.types import Rolls
+
+# Largest value of an Integer ID column on every supported database (Postgres integers are 32-bit)
+MAX_ID = 2**31 - 1
+
+
+class Player(Base):
+    """
+    Player model identifying a bowler by a compact integer key.
+
+    Names are matched case-insensitively with runs of whitespace collapsed, so
+    "Jane  Doe" and "jane doe" are the same player.
+
+    Attributes:
+        id (int): The primary key of the player.
+        name (str): The display name, as first entered.
+        normalized_name (str): The normalized name, unique across players.
+        games (relationship): Relationship to the Game model.
+    """
+
+    __tablename__ = "players"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    normalized_name = Column(
+        String,
+        nullable=False,
+        unique=True,
+        default=lambda context: Player.normalize(context.get_current_parameters()["name"]),
+    )
+
+    games = relationship("Game", back_populates="player")
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        """
+        Normalize a player name for matching: whitespace collapsed and case folded.
+        """
+        return " ".join(name.split()).casefold()
 
 
 class Game(Base):
@@ -11,17 +61,40 @@ class Game(Base):
 
     Attributes:
         id (int): The primary key of the game.
-        player (str): The name of the player associated with the game.
+        player_id (int): Foreign key linking to the Player table.
         start_time (datetime): The time the game was created.
+        score (int): The stored total score, refreshed whenever rolls are recorded.
+        strikes (int): The stored number of strikes in the game.
+        spares (int): The stored number of spares in the game.
+        revision (int): Counter bumped on every write to the game's frames, used for ETags.
+        archived (bool): Whether the game's frames were moved to the compact archive.
+        player (relationship): Relationship to the Player model.
         frames (relationship): Relationship to the Frame model.
     """
 
     __tablename__ = "games"
+    __table_args__ = (
+        Index("ix_games_player_id_start_time", "player_id", "start_time"),
+        # Game search filters on the aggregates and pages through games by (start_time, id)
+        Index("ix_games_start_time_id", "start_time", "id"),
+        Index("ix_games_score_start_time", "score", "start_time"),
+        Index("ix_games_strikes_start_time", "strikes", "start_time"),
+        Index("ix_games_spares_start_time", "spares", "start_time"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    player = Column(String, nullable=False)
+    player_id = Column(Integer, ForeignKey("players.id"), nullable=False)
     start_time = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    # Per-game aggregates kept in sync by record_roll so reads don't rescore frames
+    score = Column(Integer, default=0, nullable=False)
+    strikes = Column(Integer, default=0, nullable=False)
+    spares = Column(Integer, default=0, nullable=False)
+    revision = Column(Integer, default=0, nullable=False)
+    archived = Column(Boolean, default=False, nullable=False)
+
+    player = relationship("Player", back_populates="games")
+
     # Establish relationship with frames
     frames = relationship("Frame", back_populates="game", cascade="all, delete-orphan")
 
@@ -34,19 +107,122 @@ class Frame(Base):
         id (int): The primary key of the frame.
         game_id (int): Foreign key linking to the Game table.
         frame_number (int): The frame number (1 to 10).
-        rolls (ARRAY of int): The rolls in this frame (1-3 rolls for the 10th frame).
+        rolls (list of int): The rolls in this frame (1-3 rolls for the 10th frame).
     """
 
     __tablename__ = "frames"
 
     id = Column(Integer, primary_key=True, index=True)
-    game_id = Column(
-        Integer, ForeignKey("games.id"), nullable=False
-    )  # Link to the games table
+    game_id = Column(Integer, ForeignKey("games.id"), nullable=False)  # Link to the games table
     frame_number = Column(Integer, nullable=False)  # 1 to 10
-    rolls = Column(
-        ARRAY(Integer), nullable=False
-    )  # Array of rolls for that frame (can be 1 to 3 rolls)
+    rolls = Column(Rolls, nullable=False)  # Array of rolls for that frame (can be 1 to 3 rolls)
 
     # Establish relationship with the Game model
     game = relationship("Game", back_populates="frames")
+
+
+class PlayerStats(Base):
+    """
+    PlayerStats model holding pre-aggregated lifetime statistics for a player.
+
+    The rollup is maintained incrementally by create_game and record_roll and can be
+    rebuilt from the games table with `python -m app.db.stats rebuild`.
+
+    Attributes:
+        player_id (int): Primary key and foreign key linking to the Player table.
+        total_games (int): Number of games played.
+        total_score (int): Sum of the scores of all games.
+        highest_score (int): Highest game score.
+        lowest_score (int): Lowest game score.
+        strikes (int): Total number of strikes over all games.
+        spares (int): Total number of spares over all games.
+        revision (int): Counter bumped whenever any of the player's games changes, used for ETags.
+    """
+
+    __tablename__ = "player_stats"
+
+    player_id = Column(Integer, ForeignKey("players.id"), primary_key=True)
+    total_games = Column(Integer, default=0, nullable=False)
+    total_score = Column(Integer, default=0, nullable=False)
+    highest_score = Column(Integer, default=0, nullable=False)
+    lowest_score = Column(Integer, default=0, nullable=False)
+    strikes = Column(Integer, default=0, nullable=False)
+    spares = Column(Integer, default=0, nullable=False)
+    revision = Column(Integer, default=0, nullable=False)
+
+
+class GameArchive(Base):
+    """
+    GameArchive model storing the frames of a finished game in a compact packed form.
+
+    Completed games older than ARCHIVE_AFTER_DAYS are moved here from the frames table
+    by `python -m app.db.archive`, keeping the hot frames table and its indexes small.
+
+    Attributes:
+        game_id (int): Primary key and foreign key linking to the Game table.
+        rolls (bytes): All rolls of the game, packed by `app.db.archive.pack_frames`.
+        archived_at (datetime): The time the game was archived.
+    """
+
+    __tablename__ = "game_archive"
+
+    game_id = Column(Integer, ForeignKey("games.id"), primary_key=True)
+    rolls = Column(LargeBinary, nullable=False)
+    archived_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class RollEvent(Base):
+    """
+    RollEvent model recording every roll and correction in an append-only log.
+
+    Rows are only ever inserted. Sequence numbers are assigned in commit order, so a
+    consumer that has read every event up to a sequence number can resume after it
+    without missing events.
+
+    Attributes:
+        sequence (int): Monotonic position of the event in the log (primary key).
+        game_id (int): Foreign key linking to the Game table.
+        frame_number (int): The frame that was written.
+        rolls (list of int): The rolls of the frame after the write.
+        previous_rolls (list of int): The rolls of the frame before the write, None for a new frame.
+        kind (str): "roll" if rolls were added to the frame, "correction" if earlier rolls changed.
+        revision (int): The revision of the game after the write.
+        recorded_at (datetime): The time the event was recorded.
+    """
+
+    __tablename__ = "roll_events"
+    __table_args__ = (Index("ix_roll_events_game_id_sequence", "game_id", "sequence"),)
+
+    sequence = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    game_id = Column(Integer, ForeignKey("games.id"), nullable=False)
+    frame_number = Column(Integer, nullable=False)
+    rolls = Column(Rolls, nullable=False)
+    previous_rolls = Column(Rolls, nullable=True)
+    kind = Column(String, nullable=False)
+    revision = Column(Integer, nullable=False)
+    recorded_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class LlmUsage(Base):
+    """
+    LlmUsage model recording the token usage of every generated game summary.
+
+    Attributes:
+        id (int): The primary key of the record.
+        model (str): The model the summary was billed for, e.g. "gpt-4o".
+        prompt_version (str): The prompt version the summary was generated with.
+        prompt_tokens (int): Prompt tokens reported by the backend.
+        completion_tokens (int): Completion tokens reported by the backend.
+        latency_ms (float): Time taken by the backend call, in milliseconds.
+        created_at (datetime): The time the summary was generated.
+    """
+
+    __tablename__ = "llm_usage"
+
+    id = Column(Integer, primary_key=True)
+    model = Column(String, nullable=False)
+    prompt_version = Column(String, nullable=False)
+    prompt_tokens = Column(Integer, nullable=False)
+    completion_tokens = Column(Integer, nullable=False)
+    latency_ms = Column(Float, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
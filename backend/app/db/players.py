@@ -0,0 +1,102 @@
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.db.models import MAX_ID, Player
+
+
+def get_or_create_player(db: Session, name: str) -> Player:
+    """
+    Fetch the player with the given name, creating it on first use.
+
+    The player is created inside a savepoint, so a concurrent request creating the
+    same player first makes this one fall back to reading the existing row.
+
+    Args:
+        db (Session): Database session.
+        name (str): The player name as entered; matched after normalization.
+
+    Returns:
+        Player: The existing or newly created player.
+    """
+    normalized = Player.normalize(name)
+    player = db.query(Player).filter(Player.normalized_name == normalized).first()
+    if player is not None:
+        return player
+
+    try:
+        with db.begin_nested():
+            player = Player(name=" ".join(name.split()), normalized_name=normalized)
+            db.add(player)
+    except IntegrityError:
+        player = db.query(Player).filter(Player.normalized_name == normalized).one()
+
+    return player
+
+
+def parse_player_id(player_ref: str):
+    """
+    Read a player reference as an integer ID, if it can be one.
+
+    Args:
+        player_ref (str): The player's ID or name.
+
+    Returns:
+        int or None: The ID, or None if the reference isn't a number within the range of IDs.
+    """
+    if player_ref.isdecimal() and int(player_ref) <= MAX_ID:
+        return int(player_ref)
+
+    return None
+
+
+def resolve_player(db: Session, player_ref: str):
+    """
+    Find a player by integer ID or by name.
+
+    A numeric reference within the range of IDs is looked up as an ID first, then
+    as a name, so players whose name is a number can still be found.
+
+    Args:
+        db (Session): Database session.
+        player_ref (str): The player's ID or name.
+
+    Returns:
+        Player or None: The player, or None if there is no such player.
+    """
+    player_id = parse_player_id(player_ref)
+    if player_id is not None:
+        player = db.get(Player, player_id)
+        if player is not None:
+            return player
+
+    return db.query(Player).filter(Player.normalized_name == Player.normalize(player_ref)).first()
+
+
+def resolve_players(db: Session, player_refs):
+    """
+    Find many players by integer ID or by name with a single query.
+
+    References are resolved like `resolve_player`: a numeric reference matches an ID
+    first, then a name.
+
+    Args:
+        db (Session): Database session.
+        player_refs (list): The players' IDs or names.
+
+    Returns:
+        dict: The player found for each reference; references matching no player are left out.
+    """
+    ids = {parse_player_id(player_ref) for player_ref in player_refs} - {None}
+    names = {Player.normalize(player_ref) for player_ref in player_refs}
+    players = db.query(Player).filter(or_(Player.id.in_(ids), Player.normalized_name.in_(names))).all()
+
+    by_id = {player.id: player for player in players}
+    by_name = {player.normalized_name: player for player in players}
+    found = {}
+    for player_ref in player_refs:
+        player = by_id.get(parse_player_id(player_ref))
+        player = player or by_name.get(Player.normalize(player_ref))
+        if player is not None:
+            found[player_ref] = player
+
+    return found
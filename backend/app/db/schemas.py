@@ -1,6 +1,9 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
-from typing import List
+from typing import Annotated, List, Optional
+
+# Pins knocked down by one roll
+Roll = Annotated[int, Field(ge=0, le=10)]
 
 
 class GameCreate(BaseModel):
@@ -21,13 +24,16 @@ class GameResponse(BaseModel):
     Attributes:
         id (int): The ID of the newly created game.
         player (str): The name of the player associated with the game.
+        player_id (int): The ID of the player.
+        revision (int): The revision of the game, to send back with frame updates.
     """
 
     id: int
     player: str
+    player_id: int
+    revision: int
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class GameFramesUpdate(BaseModel):
@@ -35,10 +41,433 @@ class GameFramesUpdate(BaseModel):
     Schema for updating the frames in a game.
 
     Attributes:
-        frames (List[List[int]]): A list of lists of integers representing the rolls for each frame.
+        frames (List[List[int]]): A list of lists of integers representing the rolls for each frame, each from 0 to 10.
+        revision (Optional[int]): The revision the client last saw; the update is rejected if the game changed since.
+    """
+
+    frames: List[List[Roll]]
+    revision: Optional[int] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class MessageResponse(BaseModel):
+    """
+    Schema for simple acknowledgement responses.
+
+    Attributes:
+        message (str): A human readable status message.
+    """
+
+    message: str
+
+
+class FramesUpdateResponse(MessageResponse):
+    """
+    Schema for the response when a game's frames are updated.
+
+    Attributes:
+        revision (int): The revision of the game after the update.
+    """
+
+    revision: int
+
+
+class ScoreResponse(BaseModel):
+    """
+    Schema for the current score of a game.
+
+    Attributes:
+        game_id (int): The ID of the game.
+        score (int): The current total score of the game.
     """
 
-    frames: List[List[int]]
+    game_id: int
+    score: int
+
+
+class FrameScore(BaseModel):
+    """
+    Schema for one frame of a scorecard.
+
+    Attributes:
+        frame_number (int): The number of the frame, from 1 to 10.
+        rolls (List[int]): The pins knocked down by each roll of the frame.
+        cumulative_score (Optional[int]): The running score after this frame, None until it can be scored.
+    """
+
+    frame_number: int
+    rolls: List[int]
+    cumulative_score: Optional[int] = None
+
+
+class ScoreboardGame(BaseModel):
+    """
+    Schema for the scorecard of one game on the scoreboard.
+
+    Attributes:
+        game_id (int): The ID of the game.
+        player (str): The name of the player.
+        score (int): The current total score of the game.
+        frames (List[FrameScore]): The frames bowled so far with their running scores.
+    """
+
+    game_id: int
+    player: str
+    score: int
+    frames: List[FrameScore]
+
+
+class ScoreboardResponse(BaseModel):
+    """
+    Schema for the scorecards of many games.
+
+    Attributes:
+        games (List[ScoreboardGame]): The scorecard of every game found, in request order.
+        not_found (List[int]): The requested game IDs that don't exist.
+    """
+
+    games: List[ScoreboardGame]
+    not_found: List[int]
+
+
+class RollEventResponse(BaseModel):
+    """
+    Schema for one event of the roll change feed.
+
+    Attributes:
+        sequence (int): Position of the event in the log.
+        game_id (int): The ID of the game.
+        frame_number (int): The frame that was written.
+        rolls (List[int]): The rolls of the frame after the write.
+        previous_rolls (Optional[List[int]]): The rolls before the write, None for a new frame.
+        kind (str): "roll" if rolls were added, "correction" if earlier rolls changed.
+        revision (int): The revision of the game after the write.
+        recorded_at (datetime): The time the event was recorded.
+    """
+
+    sequence: int
+    game_id: int
+    frame_number: int
+    rolls: List[int]
+    previous_rolls: Optional[List[int]] = None
+    kind: str
+    revision: int
+    recorded_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class RollEventFeedResponse(BaseModel):
+    """
+    Schema for a batch of the roll change feed.
+
+    Attributes:
+        events (List[RollEventResponse]): The events, oldest first.
+        last_sequence (int): The sequence number to pass as `after` to read the next batch.
+    """
+
+    events: List[RollEventResponse]
+    last_sequence: int
+
+
+class PlayerStatisticsResponse(BaseModel):
+    """
+    Schema for the lifetime statistics of a player.
+
+    Attributes:
+        player_id (int): The ID of the player.
+        player_name (str): The name of the player.
+        total_games (int): Number of games played.
+        total_score (int): Sum of the scores of all games.
+        highest_score (int): Highest game score.
+        lowest_score (int): Lowest game score.
+        average_score (float): Average game score, rounded to two decimals.
+        total_strikes (int): Total number of strikes.
+        total_spares (int): Total number of spares.
+    """
+
+    player_id: int
+    player_name: str
+    total_games: int
+    total_score: int
+    highest_score: int
+    lowest_score: int
+    average_score: float
+    total_strikes: int
+    total_spares: int
+
+
+class PlayerComparison(PlayerStatisticsResponse):
+    """
+    Schema for the statistics of one player in a comparison.
+
+    Attributes:
+        strike_rate (float): Strikes per frame.
+        spare_rate (float): Spares per frame.
+        rank (Optional[int]): The player's rank when ranking was requested; tied players share a rank.
+    """
+
+    strike_rate: float
+    spare_rate: float
+    rank: Optional[int] = None
+
+
+class PlayerComparisonResponse(BaseModel):
+    """
+    Schema for the side-by-side statistics of many players.
+
+    Attributes:
+        players (List[PlayerComparison]): The statistics of every player found, in request or rank order.
+        not_found (List[str]): The requested players that don't exist or have no games.
+    """
+
+    players: List[PlayerComparison]
+    not_found: List[str]
+
+
+class GameHistoryItem(BaseModel):
+    """
+    Schema for a single game in a player's history.
+
+    Attributes:
+        game_id (int): The ID of the game.
+        score (int): The total score of the game.
+        strikes (int): Number of strikes in the game.
+        spares (int): Number of spares in the game.
+        start_time (datetime): The time the game was created.
+    """
+
+    game_id: int
+    score: int
+    strikes: int
+    spares: int
+    start_time: datetime
+
+
+class GameSearchItem(GameHistoryItem):
+    """
+    Schema for a game found by a game search.
+
+    Attributes:
+        player_id (int): The ID of the player.
+        player_name (str): The name of the player.
+    """
+
+    player_id: int
+    player_name: str
+
+
+class GameSearchResponse(BaseModel):
+    """
+    Schema for a page of game search results.
+
+    Attributes:
+        games (List[GameSearchItem]): The matching games, newest first.
+        next_cursor (Optional[str]): Cursor of the next page, None on the last page.
+    """
+
+    games: List[GameSearchItem]
+    next_cursor: Optional[str] = None
+
+
+class PlayerHistoryResponse(BaseModel):
+    """
+    Schema for the game history of a player.
+
+    Attributes:
+        player_id (int): The ID of the player.
+        player_name (str): The name of the player.
+        games (List[GameHistoryItem]): The player's games in chronological order.
+    """
+
+    player_id: int
+    player_name: str
+    games: List[GameHistoryItem]
+
+
+class TrendSummary(BaseModel):
+    """
+    Schema for the averages and rates over the most recent games of a player.
+
+    Attributes:
+        games (int): Number of games in the window.
+        average_score (float): Average score over the window.
+        strike_rate (float): Strikes per frame over the window.
+        spare_rate (float): Spares per frame over the window.
+    """
+
+    games: int
+    average_score: float
+    strike_rate: float
+    spare_rate: float
+
+
+class TrendGame(BaseModel):
+    """
+    Schema for a game annotated with rolling statistics.
+
+    Attributes:
+        game_id (int): The ID of the game.
+        start_time (datetime): The time the game was created.
+        score (int): The total score of the game.
+        rolling_average (float): Average score over the rolling window ending at this game.
+        strike_rate (float): Strikes per frame over the rolling window.
+        spare_rate (float): Spares per frame over the rolling window.
+    """
+
+    game_id: int
+    start_time: datetime
+    score: int
+    rolling_average: float
+    strike_rate: float
+    spare_rate: float
+
+
+class MonthlyTrend(TrendSummary):
+    """
+    Schema for the averages and rates of a player over one calendar month.
+
+    Attributes:
+        month (str): The month as "YYYY-MM".
+    """
+
+    month: str
+
+
+class PlayerTrendsResponse(BaseModel):
+    """
+    Schema for the rolling and monthly trends of a player.
+
+    Attributes:
+        player_id (int): The ID of the player.
+        player_name (str): The name of the player.
+        window (int): Size of the rolling window in games.
+        last_n (TrendSummary): Averages and rates over the last `window` games.
+        games (List[TrendGame]): The last `window` games with rolling statistics.
+        monthly (List[MonthlyTrend]): Averages and rates per month.
+    """
+
+    player_id: int
+    player_name: str
+    window: int
+    last_n: TrendSummary
+    games: List[TrendGame]
+    monthly: List[MonthlyTrend]
+
+
+class HistogramBin(BaseModel):
+    """
+    Schema for one bin of a score histogram.
+
+    Attributes:
+        low (int): Lowest score in the bin.
+        high (int): Highest score in the bin.
+        count (int): Number of games scoring within the bin.
+    """
+
+    low: int
+    high: int
+    count: int
+
+
+class PlayerDistributionResponse(BaseModel):
+    """
+    Schema for the score distribution of a player.
+
+    Attributes:
+        player_id (int): The ID of the player.
+        player_name (str): The name of the player.
+        games (int): Number of games played.
+        median (float): Median game score.
+        p90 (float): 90th percentile game score.
+        histogram (List[HistogramBin]): Non-empty score bins in ascending order.
+        league_percentile_rank (Optional[float]): Percentage of players with a lower average.
+    """
+
+    player_id: int
+    player_name: str
+    games: int
+    median: float
+    p90: float
+    histogram: List[HistogramBin]
+    league_percentile_rank: Optional[float]
+
+
+class GameSummaryResponse(BaseModel):
+    """
+    Schema for the LLM generated summary of a game.
+
+    Attributes:
+        summary (str): The natural language summary of the game.
+        degraded (bool): True if the model was over capacity and an earlier summary was served.
+    """
+
+    summary: str
+    degraded: bool = False
+
+
+class LlmUsageTotals(BaseModel):
+    """
+    Schema for the token usage of one model and prompt version.
+
+    Attributes:
+        model (str): The model the summaries were billed for.
+        prompt_version (str): The prompt version the summaries were generated with.
+        requests (int): Number of summaries generated.
+        prompt_tokens (int): Total prompt tokens.
+        completion_tokens (int): Total completion tokens.
+        total_tokens (int): Total prompt and completion tokens.
+        average_latency_ms (float): Average time taken by the model, in milliseconds.
+    """
+
+    model: str
+    prompt_version: str
+    requests: int
+    prompt_tokens: int
+    completion_tokens: int
+    total_tokens: int
+    average_latency_ms: float
+
+
+class LlmUsageResponse(BaseModel):
+    """
+    Schema for the token usage of the generated summaries.
+
+    Attributes:
+        models (List[LlmUsageTotals]): Usage per model and prompt version.
+    """
+
+    models: List[LlmUsageTotals]
+
+
+class WarmupReport(BaseModel):
+    """
+    Schema for what a worker warmed up before reporting ready.
+
+    Attributes:
+        connections (int): Pooled connections opened, over the primary and the read replicas.
+        queries (int): Hot queries compiled, over the primary and the read replicas.
+        players (int): Players whose trends and score distribution were primed in the cache.
+        statistics_rows (int): Statistics rollup rows of those players read, over the primary and the read replicas.
+        seconds (float): Time taken by the warm-up.
+    """
+
+    connections: int = 0
+    queries: int = 0
+    players: int = 0
+    statistics_rows: int = 0
+    seconds: float = 0.0
+
+
+class ReadinessResponse(BaseModel):
+    """
+    Schema for the readiness of a worker.
+
+    Attributes:
+        status (str): "ready" once warm-up finished, "warming up" before.
+        warmup (Optional[WarmupReport]): The warm-up report, once finished.
+    """
 
-    class Config:
-        orm_mode = True
+    status: str
+    warmup: Optional[WarmupReport] = None
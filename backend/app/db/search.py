@@ -0,0 +1,107 @@
+import base64
+from datetime import datetime
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session
+from app.db.models import MAX_ID, Game, Player
+
+
+def encode_cursor(start_time: datetime, game_id: int) -> str:
+    """
+    Encode the position of a game in the search order as an opaque pagination cursor.
+
+    Args:
+        start_time (datetime): The start time of the last game of a page.
+        game_id (int): The ID of the last game of a page.
+
+    Returns:
+        str: The cursor.
+    """
+    return base64.urlsafe_b64encode(f"{start_time.isoformat()}|{game_id}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    """
+    Decode a pagination cursor made by `encode_cursor`.
+
+    Args:
+        cursor (str): The cursor.
+
+    Returns:
+        tuple: The start time and the ID of the game the next page starts after.
+
+    Raises:
+        ValueError: If the cursor is malformed or its game ID is out of range.
+    """
+    try:
+        start_time, game_id = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode().split("|")
+        start_time, game_id = datetime.fromisoformat(start_time), int(game_id)
+    except (ValueError, UnicodeDecodeError) as error:
+        raise ValueError("Invalid cursor") from error
+
+    if not 0 <= game_id <= MAX_ID:
+        raise ValueError("Invalid cursor")
+    return start_time, game_id
+
+
+def search_games(
+    db: Session,
+    limit: int,
+    after=None,
+    player_id: int = None,
+    min_score: int = None,
+    max_score: int = None,
+    min_strikes: int = None,
+    max_strikes: int = None,
+    min_spares: int = None,
+    max_spares: int = None,
+    started_from: datetime = None,
+    started_before: datetime = None,
+):
+    """
+    Find games by their stored aggregates, newest first, one page at a time.
+
+    Filters compare against the indexed score, strike, spare and start time columns
+    of the games table, so no frames are loaded or rescored. Pages are read with
+    keyset pagination: each page starts strictly after the (start_time, id) of the
+    previous one, so deep pages cost the same as the first.
+
+    Args:
+        db (Session): Database session.
+        limit (int): Maximum number of games to return.
+        after (tuple): (start_time, id) of the last game of the previous page, or None for the first page.
+        player_id (int): Only return games of this player.
+        min_score (int): Minimum score, inclusive.
+        max_score (int): Maximum score, inclusive.
+        min_strikes (int): Minimum number of strikes, inclusive.
+        max_strikes (int): Maximum number of strikes, inclusive.
+        min_spares (int): Minimum number of spares, inclusive.
+        max_spares (int): Maximum number of spares, inclusive.
+        started_from (datetime): Only return games started at or after this time.
+        started_before (datetime): Only return games started before this time.
+
+    Returns:
+        list: (Game, player name) tuples ordered by start time and ID, newest first.
+    """
+    query = db.query(Game, Player.name).join(Player, Game.player_id == Player.id)
+
+    bounds = [
+        (Game.score, min_score, max_score),
+        (Game.strikes, min_strikes, max_strikes),
+        (Game.spares, min_spares, max_spares),
+    ]
+    for column, low, high in bounds:
+        if low is not None:
+            query = query.filter(column >= low)
+        if high is not None:
+            query = query.filter(column <= high)
+
+    if player_id is not None:
+        query = query.filter(Game.player_id == player_id)
+    if started_from is not None:
+        query = query.filter(Game.start_time >= started_from)
+    if started_before is not None:
+        query = query.filter(Game.start_time < started_before)
+    if after is not None:
+        query = query.filter(tuple_(Game.start_time, Game.id) < tuple_(*after))
+
+    return query.order_by(Game.start_time.desc(), Game.id.desc()).limit(limit).all()
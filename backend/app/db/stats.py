@@ -0,0 +1,526 @@
+import argparse
+from sqlalchemy import exists, func, literal, or_, select, text, true, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.core.sketch import ScoreSketch
+from app.db.models import Game, Player, PlayerStats
+from app.db.players import resolve_player
+
+# Frames per game, used to turn strike and spare counts into per-frame rates
+FRAMES_PER_GAME = 10
+
+
+def month_bucket(column, dialect_name: str):
+    """
+    Build a SQL expression that truncates a timestamp column to a "YYYY-MM" month label.
+
+    Args:
+        column: The timestamp column to truncate.
+        dialect_name (str): The name of the SQL dialect in use.
+
+    Returns:
+        ColumnElement: The month label expression for the given dialect.
+    """
+    if dialect_name == "postgresql":
+        return func.to_char(column, "YYYY-MM")
+    return func.strftime("%Y-%m", column)
+
+
+def upsert_statement(dialect_name: str, table):
+    """
+    Build an INSERT statement supporting ON CONFLICT DO UPDATE for the SQL dialect in use.
+
+    Args:
+        dialect_name (str): The name of the SQL dialect in use.
+        table: The mapped class or table to insert into.
+
+    Returns:
+        Insert: The dialect's INSERT statement.
+    """
+    if dialect_name == "postgresql":
+        return postgresql.insert(table)
+    return sqlite.insert(table)
+
+
+def rate(marks, games):
+    """
+    Convert a strike or spare count into a per-frame rate.
+
+    Args:
+        marks (int): Number of strikes or spares.
+        games (int): Number of games the marks were counted over.
+
+    Returns:
+        float: The rate of marks per frame, rounded to four decimals.
+    """
+    if not games:
+        return 0.0
+    return round(marks / (games * FRAMES_PER_GAME), 4)
+
+
+def get_player_trends(db: Session, player: Player, last_n: int):
+    """
+    Compute rolling and monthly statistics for a player in a single windowed query.
+
+    The inner query annotates every game with a rolling window over the last `last_n`
+    games and with per-month aggregates. The outer query keeps only the most recent
+    `last_n` games plus one row per month, so the result size is bounded by the window
+    and the number of months rather than the length of the player's history.
+
+    Args:
+        db (Session): Database session.
+        player (Player): The player.
+        last_n (int): Size of the rolling window in games.
+
+    Returns:
+        dict: Rolling per-game series, last-N summary and monthly averages, or None if the player has no games.
+    """
+    month = month_bucket(Game.start_time, db.get_bind().dialect.name).label("month")
+    chronological = (Game.start_time, Game.id)
+    rolling = {"order_by": chronological, "rows": (-(last_n - 1), 0)}
+
+    windowed = (
+        db.query(
+            Game.id.label("game_id"),
+            Game.start_time,
+            Game.score,
+            month,
+            func.avg(Game.score).over(**rolling).label("rolling_average"),
+            func.sum(Game.strikes).over(**rolling).label("rolling_strikes"),
+            func.sum(Game.spares).over(**rolling).label("rolling_spares"),
+            func.count().over(**rolling).label("rolling_games"),
+            func.avg(Game.score).over(partition_by=month).label("monthly_average"),
+            func.sum(Game.strikes).over(partition_by=month).label("monthly_strikes"),
+            func.sum(Game.spares).over(partition_by=month).label("monthly_spares"),
+            func.count().over(partition_by=month).label("monthly_games"),
+            func.row_number().over(order_by=(Game.start_time.desc(), Game.id.desc())).label("recency"),
+            func.row_number()
+            .over(partition_by=month, order_by=(Game.start_time.desc(), Game.id.desc()))
+            .label("month_rank"),
+        )
+        .filter(Game.player_id == player.id)
+        .subquery()
+    )
+
+    rows = (
+        db.query(windowed)
+        .filter(or_(windowed.c.recency <= last_n, windowed.c.month_rank == 1))
+        .order_by(windowed.c.start_time, windowed.c.game_id)
+        .all()
+    )
+
+    if not rows:
+        return None
+
+    games = []
+    monthly = []
+    for row in rows:
+        if row.recency <= last_n:
+            games.append(
+                {
+                    "game_id": row.game_id,
+                    "start_time": row.start_time,
+                    "score": row.score,
+                    "rolling_average": round(float(row.rolling_average), 2),
+                    "strike_rate": rate(row.rolling_strikes, row.rolling_games),
+                    "spare_rate": rate(row.rolling_spares, row.rolling_games),
+                }
+            )
+        if row.month_rank == 1:
+            monthly.append(
+                {
+                    "month": row.month,
+                    "games": row.monthly_games,
+                    "average_score": round(float(row.monthly_average), 2),
+                    "strike_rate": rate(row.monthly_strikes, row.monthly_games),
+                    "spare_rate": rate(row.monthly_spares, row.monthly_games),
+                }
+            )
+
+    # The newest game's rolling window is exactly the last N games
+    latest = max(rows, key=lambda row: (row.start_time, row.game_id))
+
+    return {
+        "player_id": player.id,
+        "player_name": player.name,
+        "window": last_n,
+        "last_n": {
+            "games": latest.rolling_games,
+            "average_score": round(float(latest.rolling_average), 2),
+            "strike_rate": rate(latest.rolling_strikes, latest.rolling_games),
+            "spare_rate": rate(latest.rolling_spares, latest.rolling_games),
+        },
+        "games": games,
+        "monthly": monthly,
+    }
+
+
+def get_player_score_distribution(db: Session, player: Player, bin_width: int):
+    """
+    Compute a player's score histogram, median and 90th percentile.
+
+    On Postgres the median and 90th percentile come from `percentile_cont` and the
+    histogram from a grouped bucket count. Other databases stream grouped per-score
+    counts into a ScoreSketch, which yields the same interpolated quantiles. All
+    queries return at most a few hundred rows, however many games are stored.
+
+    The result only depends on the player's own games, so it can be cached until
+    the player's revision changes.
+
+    Args:
+        db (Session): Database session.
+        player (Player): The player.
+        bin_width (int): Width of the histogram bins in points.
+
+    Returns:
+        dict: Games, median, p90 and histogram, or None if the player has no games.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        games, median, p90 = (
+            db.query(
+                func.count(Game.id),
+                func.percentile_cont(0.5).within_group(Game.score),
+                func.percentile_cont(0.9).within_group(Game.score),
+            )
+            .filter(Game.player_id == player.id)
+            .one()
+        )
+        bucket = (Game.score // bin_width).label("bucket")
+        histogram = [
+            (index * bin_width, index * bin_width + bin_width - 1, count)
+            for index, count in db.query(bucket, func.count(Game.id))
+            .filter(Game.player_id == player.id)
+            .group_by(bucket)
+            .order_by(bucket)
+        ]
+    else:
+        sketch = ScoreSketch()
+        for score, count in (
+            db.query(Game.score, func.count(Game.id)).filter(Game.player_id == player.id).group_by(Game.score)
+        ):
+            sketch.add(score, count)
+        games, median, p90, histogram = (
+            sketch.total,
+            sketch.quantile(0.5),
+            sketch.quantile(0.9),
+            sketch.histogram(bin_width),
+        )
+
+    if not games:
+        return None
+
+    return {
+        "player_id": player.id,
+        "player_name": player.name,
+        "games": games,
+        "median": round(float(median), 2),
+        "p90": round(float(p90), 2),
+        "histogram": [{"low": low, "high": high, "count": count} for low, high, count in histogram],
+    }
+
+
+def get_league_percentile_rank(db: Session, stats: PlayerStats):
+    """
+    Compute the percentage of players whose average score is below a player's.
+
+    Every player's rounded average is grouped in SQL into at most 301 rows and merged
+    into a sketch. The rank depends on the rollup of every player, not only this one.
+
+    Args:
+        db (Session): Database session.
+        stats (PlayerStats): The rollup row of the player, or None.
+
+    Returns:
+        float: The league percentile rank, or None if the player has no games.
+    """
+    if stats is None or not stats.total_games:
+        return None
+
+    average = func.round(PlayerStats.total_score * 1.0 / PlayerStats.total_games).label("average")
+    league = ScoreSketch()
+    for league_average, players in (
+        db.query(average, func.count()).filter(PlayerStats.total_games > 0).group_by(average)
+    ):
+        league.add(league_average, players)
+
+    return round(league.percentile_rank(int(stats.total_score / stats.total_games + 0.5)), 2)
+
+
+# Statistics players can be ranked by in a comparison, highest first
+RANK_FIELDS = ("average_score", "total_score", "highest_score", "strike_rate", "spare_rate", "total_games")
+
+
+def compare_players(db: Session, player_ids, started_from=None, started_before=None):
+    """
+    Compute the statistics of many players with one grouped aggregate query over their games.
+
+    Args:
+        db (Session): Database session.
+        player_ids (list): The IDs of the players.
+        started_from (datetime): Only count games started at or after this time.
+        started_before (datetime): Only count games started before this time.
+
+    Returns:
+        dict: The statistics of each player with at least one game, keyed by player ID.
+    """
+    query = db.query(
+        Game.player_id,
+        func.count(Game.id),
+        func.sum(Game.score),
+        func.max(Game.score),
+        func.min(Game.score),
+        func.sum(Game.strikes),
+        func.sum(Game.spares),
+    ).filter(Game.player_id.in_(player_ids))
+    if started_from is not None:
+        query = query.filter(Game.start_time >= started_from)
+    if started_before is not None:
+        query = query.filter(Game.start_time < started_before)
+    rows = query.group_by(Game.player_id).all()
+
+    return {
+        player_id: {
+            "total_games": games,
+            "total_score": total_score,
+            "highest_score": highest_score,
+            "lowest_score": lowest_score,
+            "average_score": round(total_score / games, 2),
+            "total_strikes": strikes,
+            "total_spares": spares,
+            "strike_rate": rate(strikes, games),
+            "spare_rate": rate(spares, games),
+        }
+        for player_id, games, total_score, highest_score, lowest_score, strikes, spares in rows
+    }
+
+
+def rank_players(players, field: str):
+    """
+    Order compared players by a statistic, highest first, and number their ranks.
+
+    Tied players share a rank and the next rank is skipped ("1, 2, 2, 4").
+
+    Args:
+        players (list): Player statistics as returned by `compare_players`.
+        field (str): The statistic to rank by, one of RANK_FIELDS.
+
+    Returns:
+        list: The players in rank order, each with its "rank" set.
+    """
+    ranked = sorted(players, key=lambda player: player[field], reverse=True)
+    for position, player in enumerate(ranked):
+        tied = position and player[field] == ranked[position - 1][field]
+        player["rank"] = ranked[position - 1]["rank"] if tied else position + 1
+
+    return ranked
+
+
+def get_player_stats_row(db: Session, player_id: int, lock: bool = False):
+    """
+    Fetch the rollup row of a player, creating an empty one if it doesn't exist.
+
+    The row is created inside a savepoint: locking a row that doesn't exist yet locks
+    nothing, so a concurrent request may create it first, in which case this one
+    falls back to reading (and locking) that row.
+
+    Args:
+        db (Session): Database session.
+        player_id (int): The ID of the player.
+        lock (bool): Lock the row for the rest of the transaction (default: False).
+
+    Returns:
+        PlayerStats: The rollup row of the player.
+    """
+    query = db.query(PlayerStats).filter(PlayerStats.player_id == player_id)
+    if lock:
+        query = query.with_for_update()
+    stats = query.first()
+
+    if stats is None:
+        try:
+            with db.begin_nested():
+                stats = PlayerStats(
+                    player_id=player_id,
+                    total_games=0,
+                    total_score=0,
+                    highest_score=0,
+                    lowest_score=0,
+                    strikes=0,
+                    spares=0,
+                    revision=0,
+                )
+                db.add(stats)
+        except IntegrityError:
+            stats = query.one()
+
+    return stats
+
+
+def record_game_created(db: Session, player_id: int):
+    """
+    Add a new, empty game to the rollup of a player.
+
+    Args:
+        db (Session): Database session.
+        player_id (int): The ID of the player who started the game.
+    """
+    stats = get_player_stats_row(db, player_id, lock=True)
+
+    # A new game scores 0 until rolls are recorded
+    if stats.total_games == 0:
+        stats.highest_score = 0
+    stats.lowest_score = 0
+    stats.total_games += 1
+    stats.revision += 1
+
+
+def record_game_updated(db: Session, game: Game, old_score: int, old_strikes: int, old_spares: int):
+    """
+    Apply the change in a game's stored aggregates to the rollup of its player.
+
+    Totals are adjusted by the difference between the old and new aggregates. The
+    highest and lowest scores are only recomputed from the games table when the
+    game held the previous extreme and moved away from it.
+
+    Args:
+        db (Session): Database session.
+        game (Game): The game whose aggregates were just refreshed.
+        old_score (int): The score of the game before the update.
+        old_strikes (int): The number of strikes before the update.
+        old_spares (int): The number of spares before the update.
+    """
+    stats = get_player_stats_row(db, game.player_id, lock=True)
+    stats.revision += 1
+
+    stats.total_score += game.score - old_score
+    stats.strikes += game.strikes - old_strikes
+    stats.spares += game.spares - old_spares
+
+    stale_high = old_score == stats.highest_score and game.score < old_score
+    stale_low = old_score == stats.lowest_score and game.score > old_score
+
+    if stale_high or stale_low:
+        db.flush()
+        stats.highest_score, stats.lowest_score = (
+            db.query(func.max(Game.score), func.min(Game.score)).filter(Game.player_id == game.player_id).one()
+        )
+    else:
+        stats.highest_score = max(stats.highest_score, game.score)
+        stats.lowest_score = min(stats.lowest_score, game.score)
+
+
+def rebuild_player_stats(db: Session, player_id: int = None):
+    """
+    Rebuild the player rollup from the games table to repair any drift.
+
+    Rows are upserted rather than replaced, and every row written gets its revision
+    bumped, so ETags handed out before the rebuild never match the repaired statistics.
+    Players left without games keep their row, emptied, for the same reason. On
+    Postgres the rollup table is locked against writers for the whole rebuild, so
+    concurrent incremental updates are neither wiped nor applied twice; SQLite
+    serializes writers by itself.
+
+    Args:
+        db (Session): Database session.
+        player_id (int): Only rebuild this player's row (default: all players).
+
+    Returns:
+        int: The number of rollup rows written.
+    """
+    dialect_name = db.get_bind().dialect.name
+    if dialect_name == "postgresql":
+        # Conflicts with the row locks writers take, but not with plain reads
+        db.execute(text(f"LOCK TABLE {PlayerStats.__tablename__} IN EXCLUSIVE MODE"))
+
+    games = Game.player_id == player_id if player_id is not None else true()
+    stats = PlayerStats.player_id == player_id if player_id is not None else true()
+
+    emptied = db.execute(
+        update(PlayerStats)
+        .where(stats, ~exists().where(Game.player_id == PlayerStats.player_id))
+        .values(
+            total_games=0,
+            total_score=0,
+            highest_score=0,
+            lowest_score=0,
+            strikes=0,
+            spares=0,
+            revision=PlayerStats.revision + 1,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+    # New rows start at revision 1. SQLite requires a WHERE clause in an upsert from a SELECT, even an always true one
+    aggregates = (
+        select(
+            Game.player_id,
+            func.count(Game.id),
+            func.sum(Game.score),
+            func.max(Game.score),
+            func.min(Game.score),
+            func.sum(Game.strikes),
+            func.sum(Game.spares),
+            literal(1),
+        )
+        .where(games)
+        .group_by(Game.player_id)
+    )
+    upsert = upsert_statement(dialect_name, PlayerStats).from_select(
+        [
+            PlayerStats.player_id,
+            PlayerStats.total_games,
+            PlayerStats.total_score,
+            PlayerStats.highest_score,
+            PlayerStats.lowest_score,
+            PlayerStats.strikes,
+            PlayerStats.spares,
+            PlayerStats.revision,
+        ],
+        aggregates,
+    )
+    columns = ["total_games", "total_score", "highest_score", "lowest_score", "strikes", "spares"]
+    rebuilt = db.execute(
+        upsert.on_conflict_do_update(
+            index_elements=[PlayerStats.player_id],
+            set_={**{column: upsert.excluded[column] for column in columns}, "revision": PlayerStats.revision + 1},
+        )
+    )
+    db.commit()
+
+    return emptied.rowcount + rebuilt.rowcount
+
+
+def main(argv=None):
+    """
+    Command line entry point for maintaining the player statistics rollup.
+
+    Usage:
+        python -m app.db.stats rebuild [--player ID_OR_NAME]
+    """
+    parser = argparse.ArgumentParser(description="Maintain the player statistics rollup table.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    rebuild = commands.add_parser("rebuild", help="Rebuild player_stats from the games table.")
+    rebuild.add_argument("--player", help="Only rebuild the statistics of this player (ID or name).")
+    args = parser.parse_args(argv)
+
+    # Imported here so the module can be used without opening the configured database
+    from app.db.base import SessionLocal
+
+    db = SessionLocal()
+    try:
+        player_id = None
+        if args.player is not None:
+            player = resolve_player(db, args.player)
+            if player is None:
+                parser.error(f"unknown player {args.player!r}")
+            player_id = player.id
+        rows = rebuild_player_stats(db, player_id)
+    finally:
+        db.close()
+
+    print(f"Rebuilt {rows} player statistics row(s).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+from sqlalchemy import Integer, LargeBinary
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.types import TypeDecorator
+
+
+class Rolls(TypeDecorator):
+    """
+    Column type for the rolls of a frame: a list of pin counts between 0 and 10.
+
+    Postgres stores the rolls natively as an integer array. Other databases store
+    them packed one byte per roll, e.g. a strike takes a single byte.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(ARRAY(Integer))
+        return dialect.type_descriptor(LargeBinary())
+
+    def process_bind_param(self, value, dialect):
+        if value is None or dialect.name == "postgresql":
+            return value
+        return bytes(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None or dialect.name == "postgresql":
+            return value
+        return list(value)
@@ -0,0 +1,53 @@
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.db.models import LlmUsage
+
+
+def record_llm_usage(db: Session, usage: dict):
+    """
+    Record the token usage of a generated summary.
+
+    Args:
+        db (Session): Database session.
+        usage (dict): The usage reported by `app.api.llm.summarize_game`.
+    """
+    db.add(LlmUsage(**usage))
+
+
+def get_llm_usage_totals(db: Session):
+    """
+    Aggregate the recorded token usage per model and prompt version.
+
+    Args:
+        db (Session): Database session.
+
+    Returns:
+        list: Dictionaries with the number of requests, the prompt and completion tokens
+        and the average latency of each model and prompt version.
+    """
+    rows = (
+        db.query(
+            LlmUsage.model,
+            LlmUsage.prompt_version,
+            func.count(LlmUsage.id),
+            func.sum(LlmUsage.prompt_tokens),
+            func.sum(LlmUsage.completion_tokens),
+            func.avg(LlmUsage.latency_ms),
+        )
+        .group_by(LlmUsage.model, LlmUsage.prompt_version)
+        .order_by(LlmUsage.model, LlmUsage.prompt_version)
+        .all()
+    )
+
+    return [
+        {
+            "model": model,
+            "prompt_version": prompt_version,
+            "requests": requests,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+            "average_latency_ms": round(average_latency, 3),
+        }
+        for model, prompt_version, requests, prompt_tokens, completion_tokens, average_latency in rows
+    ]
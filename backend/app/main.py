@@ -1,12 +1,53 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from dotenv import load_dotenv
 import os
-from app.api import endpoints
+from app.api import endpoints, warmup
+from app.core.config import settings
+from app.core.cache import InvalidationListener
+from app.core.profiling import ProfilingMiddleware
+from app.db.base import ReplicaSessionLocals, SessionLocal, engine
 
 load_dotenv()
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Start and stop per-worker background services.
+
+    With CACHE_INVALIDATION=postgres every worker listens for invalidation events
+    broadcast by the writes of all other workers. Unless WARMUP_ENABLED is off, the
+    worker warms up its connection pools and caches in the background and reports
+    ready on /ready once done.
+    """
+    listener = None
+    if settings.CACHE_INVALIDATION == "postgres":
+        listener = InvalidationListener(engine).start()
+
+    warming_up = None
+    if settings.WARMUP_ENABLED:
+        warming_up = warmup.warmup.start(
+            [SessionLocal, *ReplicaSessionLocals], settings.WARMUP_CONNECTIONS, settings.WARMUP_PRIME_PLAYERS
+        )
+    else:
+        warmup.warmup.ready.set()
+
+    try:
+        yield
+    finally:
+        # Stop taking new traffic while shutting down
+        warmup.warmup.ready.clear()
+        if warming_up is not None:
+            await warming_up
+        if listener is not None:
+            listener.stop()
+
+
+# Render responses with orjson when enabled, otherwise with the standard json module
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse if settings.ORJSON_RESPONSES else JSONResponse)
 
 FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:3000")
 
@@ -19,5 +60,15 @@ app.add_middleware(
     allow_headers=["*"],  # Allow all headers
 )
 
+# Profile requests on demand; not installed at all unless configured
+if settings.PROFILING_TOKEN or settings.PROFILE_ALL_REQUESTS:
+    app.add_middleware(
+        ProfilingMiddleware,
+        token=settings.PROFILING_TOKEN,
+        profile_all=settings.PROFILE_ALL_REQUESTS,
+        directory=settings.PROFILE_DIR,
+    )
+
 # Include all routes from the endpoints module
 app.include_router(endpoints.router)
+app.include_router(warmup.router)
@@ -0,0 +1,6 @@
+"""
+Micro-benchmarks for the bowling backend.
+
+Run all of them from the backend/ directory with `python -m benchmarks`, or a single
+one with `python -m benchmarks.<module>`.
+"""
@@ -0,0 +1,27 @@
+import importlib
+import sys
+
+# Benchmark modules run by `python -m benchmarks`, in order
+BENCHMARKS = [
+    "benchmarks.bench_serialization",
+    "benchmarks.bench_startup",
+    "benchmarks.bench_prompts",
+]
+
+
+def main(argv=None):
+    """
+    Run every benchmark, or only those whose module name contains one of the given arguments.
+    """
+    selected = argv if argv is not None else sys.argv[1:]
+
+    for name in BENCHMARKS:
+        if selected and not any(pattern in name for pattern in selected):
+            continue
+        print(f"== {name}")
+        importlib.import_module(name).main()
+        print()
+
+
+if __name__ == "__main__":
+    main()
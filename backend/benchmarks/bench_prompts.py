@@ -0,0 +1,110 @@
+"""
+Size and latency of each summary prompt version, against a local fake OpenAI server.
+
+A stand-in for the chat completions API runs in a thread and answers every request
+after a delay proportional to the prompt size, reporting usage like the real API.
+Games are summarized through the real OpenAI backend pointed at it, so the report
+shows per prompt version the characters and estimated tokens of the prompt, the
+prompt tokens reported back and the median round trip, without a network or an API key.
+"""
+
+import json
+import random
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from app.api import llm
+from app.api.endpoints import calculate_frame_scores
+from app.api.prompts import PROMPT_BUILDERS, estimate_tokens
+from app.core.config import settings
+from app.db.archive import ArchivedFrame
+from benchmarks.seed import generate_game, player_skill
+
+GAMES = 50
+
+# Simulated prompt processing time of the fake server, per prompt token
+SECONDS_PER_PROMPT_TOKEN = 0.00005
+
+
+class FakeChatCompletions(BaseHTTPRequestHandler):
+    """
+    Answers OpenAI chat completion requests with a canned summary and estimated usage.
+    """
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        prompt_tokens = sum(estimate_tokens(message["content"]) for message in request["messages"])
+        time.sleep(prompt_tokens * SECONDS_PER_PROMPT_TOKEN)
+
+        summary = "A steady game with a strong finish."
+        body = json.dumps(
+            {
+                "id": "chatcmpl-bench",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": request["model"],
+                "choices": [
+                    {"index": 0, "message": {"role": "assistant", "content": summary}, "finish_reason": "stop"}
+                ],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": estimate_tokens(summary),
+                    "total_tokens": prompt_tokens + estimate_tokens(summary),
+                },
+            }
+        ).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def sample_games(count: int):
+    """
+    Generate finished and unfinished games as (frames dict, running scores) pairs.
+    """
+    rng = random.Random(0)
+    games = []
+    for index in range(count):
+        rolls = generate_game(rng, player_skill(index), frames=rng.choice([4, 7, 10, 10]))
+        frames = [ArchivedFrame(number, frame) for number, frame in enumerate(rolls, start=1)]
+        games.append(({f"Frame {frame.frame_number}": frame.rolls for frame in frames}, calculate_frame_scores(frames)))
+
+    return games
+
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeChatCompletions)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    settings.OPENAI_BASE_URL = f"http://127.0.0.1:{server.server_port}/v1"
+    settings.OPENAI_API_KEY = settings.OPENAI_API_KEY or "fake"
+    llm.register_provider("bench", llm.openai_provider)
+
+    games = sample_games(GAMES)
+    print(f"{GAMES} games, token budget {settings.LLM_PROMPT_TOKEN_BUDGET}")
+    print(f"{'version':>8} {'chars':>8} {'est tokens':>11} {'api tokens':>11} {'median ms':>10}")
+    try:
+        for version, build in PROMPT_BUILDERS.items():
+            prompts = [build(frames, scores, settings.LLM_PROMPT_TOKEN_BUDGET) for frames, scores in games]
+            usages = [llm.summarize_game(frames, "bench", scores, version)[1] for frames, scores in games]
+
+            print(
+                f"{version:>8} "
+                f"{statistics.mean(len(prompt) for prompt in prompts):>8.0f} "
+                f"{statistics.mean(estimate_tokens(prompt) for prompt in prompts):>11.1f} "
+                f"{statistics.mean(usage['prompt_tokens'] for usage in usages):>11.1f} "
+                f"{statistics.median(usage['latency_ms'] for usage in usages):>10.2f}"
+            )
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
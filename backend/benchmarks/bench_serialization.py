@@ -0,0 +1,83 @@
+"""
+Serialization cost per response for large player histories.
+
+Compares the previous path (an untyped dict passed through FastAPI's generic
+`jsonable_encoder` and rendered by `JSONResponse`) with the typed path
+(`PlayerHistoryResponse` validated and dumped by pydantic-core) rendered by either
+`JSONResponse` or the opt-in `ORJSONResponse`.
+"""
+
+import timeit
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import TypeAdapter
+
+from app.db.schemas import PlayerHistoryResponse
+
+HISTORY_SIZES = [100, 1_000, 10_000]
+
+
+def build_history(size: int):
+    """
+    Build a player history payload with `size` games, as returned by the history endpoint.
+    """
+    start = datetime(2024, 1, 1, 18, 30)
+    return {
+        "player_id": 1,
+        "player_name": "Benchmark Player",
+        "games": [
+            {
+                "game_id": game_id,
+                "score": 90 + game_id % 210,
+                "strikes": game_id % 12,
+                "spares": game_id % 9,
+                "start_time": start + timedelta(hours=game_id),
+            }
+            for game_id in range(1, size + 1)
+        ],
+    }
+
+
+def untyped_json(payload):
+    return JSONResponse(jsonable_encoder(payload)).body
+
+
+def typed_json(payload, adapter=TypeAdapter(PlayerHistoryResponse)):
+    return JSONResponse(adapter.dump_python(adapter.validate_python(payload), mode="json")).body
+
+
+def typed_orjson(payload, adapter=TypeAdapter(PlayerHistoryResponse)):
+    return ORJSONResponse(adapter.dump_python(adapter.validate_python(payload), mode="json")).body
+
+
+PATHS = [
+    ("dict + jsonable_encoder (before)", untyped_json),
+    ("response_model + JSONResponse", typed_json),
+    ("response_model + ORJSONResponse", typed_orjson),
+]
+
+
+def measure(func, payload, repeat: int = 5):
+    """
+    Return the best per-call time in milliseconds and the rendered body size in bytes.
+    """
+    number = max(1, 2_000 // len(payload["games"]))
+    best = min(timeit.repeat(lambda: func(payload), number=number, repeat=repeat)) / number
+    return best * 1000, len(func(payload))
+
+
+def main():
+    print(f"{'games':>7}  {'path':<34} {'ms/response':>12} {'bytes':>10} {'speedup':>8}")
+    for size in HISTORY_SIZES:
+        payload = build_history(size)
+        baseline = None
+        for label, func in PATHS:
+            millis, size_bytes = measure(func, payload)
+            baseline = baseline or millis
+            print(f"{size:>7}  {label:<34} {millis:>12.3f} {size_bytes:>10} {baseline / millis:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
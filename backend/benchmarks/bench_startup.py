@@ -0,0 +1,74 @@
+"""
+Cold import time of the application, as paid by every worker, test run and container.
+
+Each sample imports `app.main` in a fresh interpreter. The report shows the median
+wall time, whether the OpenAI SDK was imported eagerly, and the packages costing
+the most import time according to `python -X importtime`.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLES = 5
+TOP_PACKAGES = 8
+
+PROBE = (
+    "import sys, time\n"
+    "started = time.perf_counter()\n"
+    "import app.main\n"
+    "print(time.perf_counter() - started, 'openai' in sys.modules)\n"
+)
+
+
+def run_probe():
+    """
+    Import the app in a fresh interpreter and return (seconds, openai_imported).
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    ).stdout.split()
+    return float(output[0]), output[1] == "True"
+
+
+def slowest_packages():
+    """
+    Return the packages costing the most import time as (self microseconds, package) pairs.
+
+    Self times reported by `python -X importtime` are summed per top-level package.
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+
+    packages = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_time, _, module = line.removeprefix("import time:").split("|")
+        if self_time.strip().isdigit():
+            package = module.strip().split(".")[0]
+            packages[package] = packages.get(package, 0) + int(self_time)
+
+    return sorted(((micros, package) for package, micros in packages.items()), reverse=True)[:TOP_PACKAGES]
+
+
+def main():
+    samples = [run_probe() for _ in range(SAMPLES)]
+    median = statistics.median(seconds for seconds, _ in samples)
+
+    print(f"import app.main: {median * 1000:.1f} ms median of {SAMPLES} cold starts")
+    print(f"openai imported at startup: {'yes' if samples[0][1] else 'no'}")
+    print(f"{'self ms':>10}  package")
+    for micros, package in slowest_packages():
+        print(f"{micros / 1000:>10.1f}  {package}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Async load driver replaying a league-night workload against the API.
+
+Runs a mix of concurrent roll streams (a game bowled frame by frame through
+`record_roll`), score polls, history reads and statistics reads for a fixed
+duration, then reports throughput and latency percentiles per operation:
+
+    python -m benchmarks.loadtest --url http://localhost:8000 --duration 30 --concurrency 64
+
+Without `--url` the app is driven in-process through httpx's ASGI transport,
+against the configured database. Seed it first with `python -m benchmarks.seed`
+using the same `--players` count.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import httpx
+from benchmarks.seed import generate_game, player_name, player_skill
+
+# Relative weight of each operation in the workload mix
+DEFAULT_MIX = {"roll_stream": 2, "score": 10, "history": 3, "statistics": 5}
+
+
+class Recorder:
+    """
+    Collects per-operation latencies and errors.
+    """
+
+    def __init__(self):
+        self.latencies = {}
+        self.errors = {}
+
+    def record(self, operation: str, seconds: float, ok: bool):
+        self.latencies.setdefault(operation, []).append(seconds)
+        if not ok:
+            self.errors[operation] = self.errors.get(operation, 0) + 1
+
+    def report(self, elapsed: float):
+        columns = ("p50 ms", "p95 ms", "p99 ms", "max ms")
+        print(f"{'operation':<12} {'requests':>9} {'req/s':>9} {'errors':>7} " + " ".join(f"{c:>8}" for c in columns))
+        total = 0
+        for operation, latencies in sorted(self.latencies.items()):
+            total += len(latencies)
+            cuts = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+            print(
+                f"{operation:<12} {len(latencies):>9} {len(latencies) / elapsed:>9.1f} "
+                f"{self.errors.get(operation, 0):>7} {cuts[49] * 1000:>8.1f} {cuts[94] * 1000:>8.1f} "
+                f"{cuts[98] * 1000:>8.1f} {max(latencies) * 1000:>8.1f}"
+            )
+        print(f"{'total':<12} {total:>9} {total / elapsed:>9.1f}")
+
+
+async def timed(recorder: Recorder, operation: str, request):
+    """
+    Await a request, recording its latency under `operation`; 304s count as successes.
+    """
+    started = time.perf_counter()
+    try:
+        response = await request
+        ok = response.status_code < 400
+    except httpx.HTTPError:
+        response, ok = None, False
+    recorder.record(operation, time.perf_counter() - started, ok)
+    return response
+
+
+async def roll_stream(client: httpx.AsyncClient, recorder: Recorder, rng: random.Random, players: int):
+    """
+    Bowl one game frame by frame, posting the full frame list after each frame like the scorecard does.
+    """
+    index = rng.randrange(players)
+    created = await timed(recorder, "create_game", client.post("/games", json={"player": player_name(index)}))
+    if created is None or created.status_code >= 400:
+        return
+
+    game_id = created.json()["id"]
+    frames = generate_game(rng, player_skill(index))
+    for frame_number in range(1, len(frames) + 1):
+        await timed(
+            recorder, "record_roll", client.post(f"/games/{game_id}/rolls", json={"frames": frames[:frame_number]})
+        )
+
+
+async def worker(client, recorder, rng, players, mix, deadline, game_ids):
+    operations, weights = zip(*mix.items())
+    while time.perf_counter() < deadline:
+        operation = rng.choices(operations, weights)[0]
+        player = player_name(rng.randrange(players))
+
+        if operation == "roll_stream":
+            await roll_stream(client, recorder, rng, players)
+        elif operation == "score":
+            await timed(recorder, "score", client.get(f"/games/{rng.choice(game_ids)}/score"))
+        elif operation == "history":
+            await timed(recorder, "history", client.get(f"/players/{player}/history"))
+        elif operation == "statistics":
+            await timed(recorder, "statistics", client.get(f"/players/{player}/statistics"))
+
+
+async def run(url, duration: float, concurrency: int, players: int, max_game_id: int, mix, seed_value: int):
+    """
+    Drive the workload with `concurrency` concurrent clients for `duration` seconds.
+    """
+    if url:
+        transport = httpx.AsyncHTTPTransport(limits=httpx.Limits(max_connections=concurrency))
+        base_url = url
+    else:
+        from app.main import app
+
+        transport = httpx.ASGITransport(app=app)
+        base_url = "http://loadtest"
+
+    recorder = Recorder()
+    game_ids = range(1, max_game_id + 1)
+    async with httpx.AsyncClient(transport=transport, base_url=base_url, timeout=30) as client:
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(
+            *(
+                worker(client, recorder, random.Random(seed_value + number), players, mix, deadline, game_ids)
+                for number in range(concurrency)
+            )
+        )
+        elapsed = time.perf_counter() - started
+
+    recorder.report(elapsed)
+    return recorder
+
+
+def parse_mix(value: str):
+    """
+    Parse a workload mix such as "roll_stream=2,score=10,history=3,statistics=5".
+    """
+    mix = {}
+    for item in value.split(","):
+        operation, weight = item.split("=")
+        if operation not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(f"unknown operation {operation!r}")
+        mix[operation] = float(weight)
+    return mix
+
+
+def main(argv=None):
+    default_mix = ",".join(f"{operation}={weight}" for operation, weight in DEFAULT_MIX.items())
+    parser = argparse.ArgumentParser(description="Replay a mixed league-night workload against the API.")
+    parser.add_argument("--url", help="Base URL of a running server (default: drive the app in-process).")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds to run (default: 30).")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent clients (default: 32).")
+    parser.add_argument("--players", type=int, default=500, help="Players seeded by benchmarks.seed (default: 500).")
+    parser.add_argument("--max-game-id", type=int, default=100_000, help="Poll scores of game IDs up to this.")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX, help=f"Workload mix (default: {default_mix}).")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42).")
+    args = parser.parse_args(argv)
+
+    asyncio.run(run(args.url, args.duration, args.concurrency, args.players, args.max_game_id, args.mix, args.seed))
+
+
+if __name__ == "__main__":
+    main()
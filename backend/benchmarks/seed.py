@@ -0,0 +1,176 @@
+"""
+Synthetic league data generator.
+
+Generates games that follow the rules of ten-pin bowling for a pool of players with
+different skill levels, and bulk-inserts them into the configured database:
+
+    python -m benchmarks.seed --players 500 --games 1000000
+
+Games, frames and the player statistics rollup are written with multi-row inserts
+in batches, so millions of games can be seeded in minutes.
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import insert
+from app.api.endpoints import calculate_score, count_strikes_and_spares
+from app.db.archive import ArchivedFrame
+from app.db.models import Frame, Game, Player
+from app.db.stats import rebuild_player_stats
+
+
+def player_name(index: int) -> str:
+    """
+    Return the name of the synthetic player with the given index.
+    """
+    return f"Player {index:05d}"
+
+
+def player_skill(index: int):
+    """
+    Return the (strike, spare) probabilities of a synthetic player.
+
+    Skills are derived from the player index so the seeder and the load driver agree
+    on the same pool of players without sharing state.
+    """
+    rng = random.Random(index)
+    strike = rng.uniform(0.05, 0.6)
+    return strike, min(0.9, strike + rng.uniform(0.1, 0.3))
+
+
+def roll_frame(rng: random.Random, skill, pins: int = 10):
+    """
+    Roll the first two balls at a full rack: a strike, a spare or an open frame.
+    """
+    strike, spare = skill
+    if pins == 10 and rng.random() < strike:
+        return [10]
+
+    first = rng.randint(max(0, pins - 5), pins - 1) if rng.random() < 0.95 else 0
+    if rng.random() < spare:
+        return [first, pins - first]
+
+    return [first, rng.randint(0, pins - first - 1)]
+
+
+def generate_game(rng: random.Random, skill, frames: int = 10):
+    """
+    Generate the frames of a game following bowling rules, including tenth-frame bonus balls.
+
+    Args:
+        rng (random.Random): Random number generator.
+        skill (tuple): The player's strike and spare probabilities.
+        frames (int): Number of frames to bowl; fewer than 10 gives an unfinished game.
+
+    Returns:
+        list: The rolls of each frame.
+    """
+    game = [roll_frame(rng, skill) for _ in range(min(frames, 9))]
+
+    if frames == 10:
+        tenth = roll_frame(rng, skill)
+        if tenth == [10]:
+            # A strike earns two bonus balls, the second at a fresh rack if the first was a strike
+            second = roll_frame(rng, skill)[0]
+            third = roll_frame(rng, skill)[0] if second == 10 else rng.randint(0, 10 - second)
+            tenth = [10, second, third]
+        elif sum(tenth) == 10:
+            tenth = tenth + [roll_frame(rng, skill)[0]]
+        game.append(tenth)
+
+    return game
+
+
+def seed(db, players: int, games: int, days: int, in_progress: float, batch_size: int, seed_value: int):
+    """
+    Bulk-insert synthetic players, games, their frames and the player rollup.
+
+    Args:
+        db (Session): Database session.
+        players (int): Number of distinct players.
+        games (int): Number of games to generate.
+        days (int): Spread game start times over this many past days.
+        in_progress (float): Fraction of games left unfinished.
+        batch_size (int): Games per insert batch.
+        seed_value (int): Seed of the random number generator.
+
+    Returns:
+        int: The number of frames inserted.
+    """
+    rng = random.Random(seed_value)
+    skills = [player_skill(index) for index in range(players)]
+    now = datetime.utcnow()
+    frames_inserted = 0
+
+    # Register the synthetic players, reusing those left by an earlier run
+    names = {Player.normalize(player_name(index)): player_name(index) for index in range(players)}
+    player_ids = dict(db.query(Player.normalized_name, Player.id).filter(Player.normalized_name.in_(names)))
+    missing = [{"name": name, "normalized_name": key} for key, name in names.items() if key not in player_ids]
+    if missing:
+        player_ids.update(db.execute(insert(Player).returning(Player.normalized_name, Player.id), missing).all())
+    player_ids = [player_ids[key] for key in names]
+
+    for offset in range(0, games, batch_size):
+        game_rows = []
+        game_frames = []
+        for _ in range(min(batch_size, games - offset)):
+            index = rng.randrange(players)
+            length = rng.randint(1, 9) if rng.random() < in_progress else 10
+            rolls = generate_game(rng, skills[index], length)
+            frames = [ArchivedFrame(number + 1, frame) for number, frame in enumerate(rolls)]
+            strikes, spares = count_strikes_and_spares(frames)
+            game_rows.append(
+                {
+                    "player_id": player_ids[index],
+                    "start_time": now - timedelta(seconds=rng.randrange(days * 86400)),
+                    "score": calculate_score(frames),
+                    "strikes": strikes,
+                    "spares": spares,
+                    "revision": 1,
+                    "archived": False,
+                }
+            )
+            game_frames.append(rolls)
+
+        game_ids = db.scalars(insert(Game).returning(Game.id, sort_by_parameter_order=True), game_rows).all()
+        frame_rows = [
+            {"game_id": game_id, "frame_number": number + 1, "rolls": rolls}
+            for game_id, frames in zip(game_ids, game_frames)
+            for number, rolls in enumerate(frames)
+        ]
+        db.execute(insert(Frame), frame_rows)
+        db.commit()
+        frames_inserted += len(frame_rows)
+
+    rebuild_player_stats(db)
+    return frames_inserted
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Seed the configured database with synthetic bowling games.")
+    parser.add_argument("--players", type=int, default=500, help="Number of distinct players (default: 500).")
+    parser.add_argument("--games", type=int, default=100_000, help="Number of games to generate (default: 100000).")
+    parser.add_argument("--days", type=int, default=365, help="Spread games over this many past days (default: 365).")
+    parser.add_argument("--in-progress", type=float, default=0.02, help="Fraction of unfinished games (default: 0.02).")
+    parser.add_argument("--batch-size", type=int, default=5_000, help="Games per insert batch (default: 5000).")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42).")
+    args = parser.parse_args(argv)
+
+    from app.db.base import SessionLocal
+
+    db = SessionLocal()
+    started = time.perf_counter()
+    try:
+        frames = seed(db, args.players, args.games, args.days, args.in_progress, args.batch_size, args.seed)
+    finally:
+        db.close()
+    elapsed = time.perf_counter() - started
+
+    print(f"Seeded {args.games} games ({frames} frames) for {args.players} players in {elapsed:.1f}s")
+    print(f"{args.games / elapsed:,.0f} games/s")
+
+
+if __name__ == "__main__":
+    main()
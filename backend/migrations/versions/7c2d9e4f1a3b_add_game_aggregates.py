@@ -0,0 +1,97 @@
+"""add stored game aggregates
+
+Revision ID: 7c2d9e4f1a3b
+Revises: 41325a40b08e
+Create Date: 2026-10-19 09:12:44.118302
+
+"""
+
+from itertools import groupby
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "7c2d9e4f1a3b"
+down_revision: Union[str, None] = "41325a40b08e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def calculate_score(frames) -> int:
+    # Same rules as the scoring in app.api.endpoints, copied so the migration doesn't change with the app:
+    # the score of the last frame whose bonus rolls are all known
+    rolls = [roll for frame in frames for roll in frame.rolls]
+    score = 0
+    index = 0
+    for _ in range(10):
+        if index >= len(rolls):
+            break
+        if rolls[index] == 10:
+            if index + 2 >= len(rolls):
+                break
+            score += 10 + rolls[index + 1] + rolls[index + 2]
+            index += 1
+        elif index + 1 < len(rolls) and rolls[index] + rolls[index + 1] == 10:
+            if index + 2 >= len(rolls):
+                break
+            score += 10 + rolls[index + 2]
+            index += 2
+        else:
+            if index + 1 >= len(rolls):
+                break
+            score += rolls[index] + rolls[index + 1]
+            index += 2
+
+    return score
+
+
+def count_strikes_and_spares(frames):
+    # Same rules as app.api.endpoints.count_strikes_and_spares, copied for the same reason
+    strikes = 0
+    spares = 0
+    for frame in frames:
+        if not frame.rolls:
+            continue
+        if frame.rolls[0] == 10:
+            strikes += 1
+        elif len(frame.rolls) > 1 and frame.rolls[0] + frame.rolls[1] == 10:
+            spares += 1
+
+    return strikes, spares
+
+
+def upgrade() -> None:
+    op.add_column("games", sa.Column("score", sa.Integer(), server_default="0", nullable=False))
+    op.add_column("games", sa.Column("strikes", sa.Integer(), server_default="0", nullable=False))
+    op.add_column("games", sa.Column("spares", sa.Integer(), server_default="0", nullable=False))
+    op.create_index("ix_games_player_start_time", "games", ["player", "start_time"], unique=False)
+
+    # Backfill the aggregates of existing games from their frames
+    bind = op.get_bind()
+    games = sa.table(
+        "games",
+        sa.column("id", sa.Integer),
+        sa.column("score", sa.Integer),
+        sa.column("strikes", sa.Integer),
+        sa.column("spares", sa.Integer),
+    )
+    frames = bind.execute(
+        sa.text("SELECT game_id, frame_number, rolls FROM frames ORDER BY game_id, frame_number")
+    ).all()
+    for game_id, game_frames in groupby(frames, key=lambda frame: frame.game_id):
+        game_frames = list(game_frames)
+        strikes, spares = count_strikes_and_spares(game_frames)
+        bind.execute(
+            games.update()
+            .where(games.c.id == game_id)
+            .values(score=calculate_score(game_frames), strikes=strikes, spares=spares)
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_games_player_start_time", table_name="games")
+    op.drop_column("games", "spares")
+    op.drop_column("games", "strikes")
+    op.drop_column("games", "score")
@@ -0,0 +1,31 @@
+"""add game search indexes
+
+Revision ID: 9b4e7c1d2a85
+Revises: c5f8a2d73e16
+Create Date: 2026-10-19 19:03:27.640118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b4e7c1d2a85"
+down_revision: Union[str, None] = "c5f8a2d73e16"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_games_start_time_id", "games", ["start_time", "id"], unique=False)
+    op.create_index("ix_games_score_start_time", "games", ["score", "start_time"], unique=False)
+    op.create_index("ix_games_strikes_start_time", "games", ["strikes", "start_time"], unique=False)
+    op.create_index("ix_games_spares_start_time", "games", ["spares", "start_time"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_games_spares_start_time", table_name="games")
+    op.drop_index("ix_games_strikes_start_time", table_name="games")
+    op.drop_index("ix_games_score_start_time", table_name="games")
+    op.drop_index("ix_games_start_time_id", table_name="games")
@@ -0,0 +1,41 @@
+"""create roll event log
+
+Revision ID: a7d5e2b91c38
+Revises: f1c83d5a9e24
+Create Date: 2026-10-19 16:58:40.771302
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "a7d5e2b91c38"
+down_revision: Union[str, None] = "f1c83d5a9e24"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "roll_events",
+        sa.Column("sequence", sa.BigInteger(), nullable=False),
+        sa.Column("game_id", sa.Integer(), nullable=False),
+        sa.Column("frame_number", sa.Integer(), nullable=False),
+        sa.Column("rolls", postgresql.ARRAY(sa.Integer()), nullable=False),
+        sa.Column("previous_rolls", postgresql.ARRAY(sa.Integer()), nullable=True),
+        sa.Column("kind", sa.String(), nullable=False),
+        sa.Column("revision", sa.Integer(), nullable=False),
+        sa.Column("recorded_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["game_id"], ["games.id"]),
+        sa.PrimaryKeyConstraint("sequence"),
+    )
+    op.create_index("ix_roll_events_game_id_sequence", "roll_events", ["game_id", "sequence"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_roll_events_game_id_sequence", table_name="roll_events")
+    op.drop_table("roll_events")
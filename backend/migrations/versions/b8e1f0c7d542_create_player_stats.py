@@ -0,0 +1,44 @@
+"""create player_stats rollup
+
+Revision ID: b8e1f0c7d542
+Revises: 7c2d9e4f1a3b
+Create Date: 2026-10-19 10:03:17.564120
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b8e1f0c7d542"
+down_revision: Union[str, None] = "7c2d9e4f1a3b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "player_stats",
+        sa.Column("player", sa.String(), nullable=False),
+        sa.Column("total_games", sa.Integer(), nullable=False),
+        sa.Column("total_score", sa.Integer(), nullable=False),
+        sa.Column("highest_score", sa.Integer(), nullable=False),
+        sa.Column("lowest_score", sa.Integer(), nullable=False),
+        sa.Column("strikes", sa.Integer(), nullable=False),
+        sa.Column("spares", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("player"),
+    )
+
+    # Populate the rollup from the stored per-game aggregates
+    op.execute("""
+        INSERT INTO player_stats (player, total_games, total_score, highest_score, lowest_score, strikes, spares)
+        SELECT player, count(id), sum(score), max(score), min(score), sum(strikes), sum(spares)
+        FROM games
+        GROUP BY player
+        """)
+
+
+def downgrade() -> None:
+    op.drop_table("player_stats")
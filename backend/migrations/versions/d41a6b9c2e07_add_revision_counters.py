@@ -0,0 +1,27 @@
+"""add revision counters for etags
+
+Revision ID: d41a6b9c2e07
+Revises: b8e1f0c7d542
+Create Date: 2026-10-19 11:40:52.902113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "d41a6b9c2e07"
+down_revision: Union[str, None] = "b8e1f0c7d542"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("games", sa.Column("revision", sa.Integer(), server_default="0", nullable=False))
+    op.add_column("player_stats", sa.Column("revision", sa.Integer(), server_default="0", nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column("player_stats", "revision")
+    op.drop_column("games", "revision")
@@ -0,0 +1,37 @@
+"""create game archive
+
+Revision ID: e93f27a8b6c1
+Revises: d41a6b9c2e07
+Create Date: 2026-10-19 13:26:05.417730
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "e93f27a8b6c1"
+down_revision: Union[str, None] = "d41a6b9c2e07"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("games", sa.Column("archived", sa.Boolean(), server_default=sa.false(), nullable=False))
+    op.create_table(
+        "game_archive",
+        sa.Column("game_id", sa.Integer(), nullable=False),
+        sa.Column("rolls", sa.LargeBinary(), nullable=False),
+        sa.Column("archived_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["game_id"],
+            ["games.id"],
+        ),
+        sa.PrimaryKeyConstraint("game_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("game_archive")
+    op.drop_column("games", "archived")
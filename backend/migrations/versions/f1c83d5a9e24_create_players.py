@@ -0,0 +1,110 @@
+"""create players
+
+Revision ID: f1c83d5a9e24
+Revises: e93f27a8b6c1
+Create Date: 2026-10-19 15:42:11.208934
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "f1c83d5a9e24"
+down_revision: Union[str, None] = "e93f27a8b6c1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def normalize(name: str) -> str:
+    # Same rule as Player.normalize, copied so the migration doesn't change with the model
+    return " ".join(name.split()).casefold()
+
+
+def upgrade() -> None:
+    op.create_table(
+        "players",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("normalized_name", sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("normalized_name"),
+    )
+    op.add_column("games", sa.Column("player_id", sa.Integer(), nullable=True))
+
+    # One player per normalized name, keeping the spelling of the player's first game
+    connection = op.get_bind()
+    player_ids = {}
+    names = connection.execute(sa.text("SELECT player FROM games GROUP BY player ORDER BY min(start_time)"))
+    for (name,) in names.all():
+        key = normalize(name)
+        if key not in player_ids:
+            player_ids[key] = connection.execute(
+                sa.text("INSERT INTO players (name, normalized_name) VALUES (:name, :key) RETURNING id"),
+                {"name": " ".join(name.split()), "key": key},
+            ).scalar_one()
+        connection.execute(
+            sa.text("UPDATE games SET player_id = :player_id WHERE player = :name"),
+            {"player_id": player_ids[key], "name": name},
+        )
+
+    op.alter_column("games", "player_id", nullable=False)
+    op.create_foreign_key("games_player_id_fkey", "games", "players", ["player_id"], ["id"])
+    op.create_index("ix_games_player_id_start_time", "games", ["player_id", "start_time"], unique=False)
+    op.drop_index("ix_games_player_start_time", table_name="games")
+    op.drop_column("games", "player")
+
+    # Re-key the rollup by player ID; name variants merge into one row
+    op.drop_table("player_stats")
+    op.create_table(
+        "player_stats",
+        sa.Column("player_id", sa.Integer(), nullable=False),
+        sa.Column("total_games", sa.Integer(), nullable=False),
+        sa.Column("total_score", sa.Integer(), nullable=False),
+        sa.Column("highest_score", sa.Integer(), nullable=False),
+        sa.Column("lowest_score", sa.Integer(), nullable=False),
+        sa.Column("strikes", sa.Integer(), nullable=False),
+        sa.Column("spares", sa.Integer(), nullable=False),
+        sa.Column("revision", sa.Integer(), server_default="0", nullable=False),
+        sa.ForeignKeyConstraint(["player_id"], ["players.id"]),
+        sa.PrimaryKeyConstraint("player_id"),
+    )
+    op.execute("""
+        INSERT INTO player_stats (player_id, total_games, total_score, highest_score, lowest_score, strikes, spares, revision)
+        SELECT player_id, count(id), sum(score), max(score), min(score), sum(strikes), sum(spares), 1
+        FROM games
+        GROUP BY player_id
+        """)
+
+
+def downgrade() -> None:
+    op.add_column("games", sa.Column("player", sa.String(), nullable=True))
+    op.execute("UPDATE games SET player = (SELECT name FROM players WHERE players.id = games.player_id)")
+    op.alter_column("games", "player", nullable=False)
+    op.create_index("ix_games_player_start_time", "games", ["player", "start_time"], unique=False)
+    op.drop_index("ix_games_player_id_start_time", table_name="games")
+    op.drop_constraint("games_player_id_fkey", "games", type_="foreignkey")
+    op.drop_column("games", "player_id")
+
+    op.drop_table("player_stats")
+    op.create_table(
+        "player_stats",
+        sa.Column("player", sa.String(), nullable=False),
+        sa.Column("total_games", sa.Integer(), nullable=False),
+        sa.Column("total_score", sa.Integer(), nullable=False),
+        sa.Column("highest_score", sa.Integer(), nullable=False),
+        sa.Column("lowest_score", sa.Integer(), nullable=False),
+        sa.Column("strikes", sa.Integer(), nullable=False),
+        sa.Column("spares", sa.Integer(), nullable=False),
+        sa.Column("revision", sa.Integer(), server_default="0", nullable=False),
+        sa.PrimaryKeyConstraint("player"),
+    )
+    op.execute("""
+        INSERT INTO player_stats (player, total_games, total_score, highest_score, lowest_score, strikes, spares, revision)
+        SELECT player, count(id), sum(score), max(score), min(score), sum(strikes), sum(spares), 1
+        FROM games
+        GROUP BY player
+        """)
+    op.drop_table("players")
@@ -1,21 +1,48 @@
+import os
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
 from app.main import app
-from app.db.base import Base, get_db
+from app.db.base import Base, get_db, get_read_db
 from app.db.models import Game, Frame
+from app.core.cache import cache, summary_cache
+from app.core.config import settings
 
-# Path to the test database
-SQLALCHEMY_TEST_DATABASE_URL = "sqlite:///./test.db"
+# Database the tests run against: in-memory SQLite by default, or e.g. a Postgres URL
+SQLALCHEMY_TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL", "sqlite://")
 
-# Create an engine and session for the test database
-engine = create_engine(
-    SQLALCHEMY_TEST_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+if SQLALCHEMY_TEST_DATABASE_URL.startswith("sqlite"):
+    # A single shared connection keeps the in-memory database alive for the whole run
+    engine = create_engine(
+        SQLALCHEMY_TEST_DATABASE_URL, connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
 
-# Create a session factory
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work (pysqlite's own handling breaks them)
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+else:
+    engine = create_engine(SQLALCHEMY_TEST_DATABASE_URL)
+
+# The app's own database is never used by the tests, so don't warm it up
+settings.WARMUP_ENABLED = False
+
+
+@pytest.fixture(scope="session", autouse=True)
+def tables():
+    """
+    Create all tables once for the whole test run.
+    """
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
 
 
 @pytest.fixture(scope="function")
@@ -23,20 +50,21 @@ def db():
     """
     Create a new database session for a test.
 
-    This fixture will create a new session for every test and roll back any changes after the test is done.
+    The session runs inside an outer transaction that is rolled back after the test.
+    Commits made by the test or the endpoints only release a savepoint, so every test
+    starts from empty tables without recreating them.
     """
-    # Ensure all tables are created before starting the test
-    Base.metadata.create_all(bind=engine)
-    db = TestingSessionLocal()
+    connection = engine.connect()
+    transaction = connection.begin()
+    db = Session(bind=connection, autoflush=False, join_transaction_mode="create_savepoint")
 
     try:
         yield db
     finally:
-        # Rollback any changes and close the session after each test
-        db.rollback()
+        # Roll back everything the test wrote and close the session
         db.close()
-        # Drop all tables after the test to start fresh for each test
-        Base.metadata.drop_all(bind=engine)
+        transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture(scope="function")
@@ -55,6 +83,11 @@ def client(db):
             db.close()
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+
+    # Start every test with an empty in-process cache
+    cache.clear()
+    summary_cache.clear()
 
     # Create a TestClient for sending HTTP requests in tests
     with TestClient(app) as test_client:
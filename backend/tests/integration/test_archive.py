@@ -0,0 +1,154 @@
+from datetime import datetime, timedelta
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from app.db import archive, models
+from app.db.archive import archive_games, has_valid_rolls, is_game_complete, pack_frames, unpack_frames
+
+"""
+This module contains tests for archiving finished games out of the hot frames table.
+"""
+
+PERFECT_GAME = [[10]] * 9 + [[10, 10, 10]]
+
+
+def create_game(client: TestClient, db: Session, frames, days_ago: int):
+    """
+    Create a game through the API, record its frames and backdate its start time.
+    """
+    game_id = client.post("/games", json={"player": "Archive Player"}).json()["id"]
+    client.post(f"/games/{game_id}/rolls", json={"frames": frames})
+    db.query(models.Game).filter(models.Game.id == game_id).update(
+        {models.Game.start_time: datetime.utcnow() - timedelta(days=days_ago)}
+    )
+    db.commit()
+    return game_id
+
+
+def test_pack_frames_round_trip():
+    """
+    Test that packed frames unpack to the same rolls in a couple of dozen bytes.
+    """
+    frames = [models.Frame(rolls=rolls) for rolls in PERFECT_GAME]
+
+    packed = pack_frames(frames)
+
+    assert [frame.rolls for frame in unpack_frames(packed)] == PERFECT_GAME
+    assert len(packed) == 22
+
+
+def test_is_game_complete():
+    """
+    Test detection of finished games, including tenth-frame bonus rolls.
+    """
+    frame = lambda rolls: models.Frame(rolls=rolls)  # noqa: E731
+
+    assert is_game_complete([frame(r) for r in PERFECT_GAME])
+    assert is_game_complete([frame([3, 4])] * 10)
+    assert not is_game_complete([frame([3, 4])] * 9)
+    assert not is_game_complete([frame([10])] * 9 + [frame([5, 5])])
+
+
+def test_has_valid_rolls():
+    """
+    Test that rolls outside 0-10, which cannot be packed, are detected.
+    """
+    frame = lambda rolls: models.Frame(rolls=rolls)  # noqa: E731
+
+    assert has_valid_rolls([frame(r) for r in PERFECT_GAME])
+    assert not has_valid_rolls([frame([11, 0])] + [frame([3, 4])] * 9)
+    assert not has_valid_rolls([frame([300, 0])])
+    assert not has_valid_rolls([frame([-1, 5])])
+
+
+def test_games_with_invalid_rolls_are_not_archived(client: TestClient, db: Session):
+    """
+    Test that a game with an impossible roll is skipped without stopping the archive run.
+    """
+    # Arrange
+    invalid_game = create_game(client, db, [[3, 4]] * 10, days_ago=120)
+    # The API rejects such rolls, but rows written before it did may still hold them
+    db.query(models.Frame).filter(models.Frame.game_id == invalid_game, models.Frame.frame_number == 1).update(
+        {models.Frame.rolls: [11, 0]}
+    )
+    db.commit()
+    valid_game = create_game(client, db, PERFECT_GAME, days_ago=120)
+
+    # Act
+    archived = archive_games(db, timedelta(days=90), batch_size=1)
+
+    # Assert
+    assert archived == 1
+    assert db.query(models.Frame).filter(models.Frame.game_id == invalid_game).count() == 10
+    assert db.get(models.GameArchive, valid_game) is not None
+
+
+def test_game_corrected_during_archive_run_is_not_archived(client: TestClient, db: Session, monkeypatch):
+    """
+    Test that a game corrected after its frames were read is left in the hot table with the correction.
+    """
+    # Arrange
+    game_id = create_game(client, db, [[3, 4]] * 10, days_ago=120)
+
+    def correct_while_checking(frames):
+        # What a concurrent correction of the first frame writes, after the archive run read the frames
+        db.query(models.Frame).filter(models.Frame.game_id == game_id, models.Frame.frame_number == 1).update(
+            {models.Frame.rolls: [5, 4]}, synchronize_session=False
+        )
+        db.query(models.Game).filter(models.Game.id == game_id).update(
+            {models.Game.revision: models.Game.revision + 1}, synchronize_session=False
+        )
+        return has_valid_rolls(frames)
+
+    monkeypatch.setattr(archive, "has_valid_rolls", correct_while_checking)
+
+    # Act
+    archived = archive_games(db, timedelta(days=90))
+
+    # Assert
+    assert archived == 0
+    assert db.get(models.GameArchive, game_id) is None
+    first_frame = models.Frame.game_id == game_id, models.Frame.frame_number == 1
+    assert db.query(models.Frame.rolls).filter(*first_frame).scalar() == [5, 4]
+
+
+def test_archived_games_resolve_transparently(client: TestClient, db: Session):
+    """
+    Test that old completed games are archived while score, history and statistics
+    still resolve them, and that unfinished or recent games stay in the hot table.
+    """
+    # Arrange
+    old_game = create_game(client, db, PERFECT_GAME, days_ago=120)
+    unfinished_game = create_game(client, db, [[10], [4, 3]], days_ago=120)
+    recent_game = create_game(client, db, [[3, 4]] * 10, days_ago=1)
+
+    # Act
+    archived = archive_games(db, timedelta(days=90))
+
+    # Assert
+    assert archived == 1
+    assert db.query(models.Frame).filter(models.Frame.game_id == old_game).count() == 0
+    assert db.query(models.Frame).filter(models.Frame.game_id == unfinished_game).count() == 2
+    assert db.query(models.Frame).filter(models.Frame.game_id == recent_game).count() == 10
+
+    assert client.get(f"/games/{old_game}/score").json()["score"] == 300
+    history = client.get("/players/Archive Player/history").json()["games"]
+    assert [game["score"] for game in history] == [300, 24, 70]
+    assert client.get("/players/Archive Player/statistics").json()["highest_score"] == 300
+
+
+def test_record_roll_restores_archived_game(client: TestClient, db: Session):
+    """
+    Test that correcting an archived game moves its frames back into the hot table.
+    """
+    # Arrange
+    game_id = create_game(client, db, PERFECT_GAME, days_ago=120)
+    archive_games(db, timedelta(days=90))
+
+    # Act
+    response = client.post(f"/games/{game_id}/rolls", json={"frames": [[9, 0]]})
+
+    # Assert
+    assert response.status_code == 200
+    assert db.query(models.GameArchive).count() == 0
+    assert db.query(models.Frame).filter(models.Frame.game_id == game_id).count() == 10
+    assert client.get(f"/games/{game_id}/score").json()["score"] == 279
@@ -1,7 +1,16 @@
 import pytest
 from fastapi.testclient import TestClient
 from app.db import models
-from sqlalchemy.orm import Session
+from sqlalchemy import event
+from sqlalchemy.orm import Query, Session
+from datetime import datetime, timedelta
+from app.db.archive import archive_games
+from app.db.search import encode_cursor
+from app.db.stats import get_player_stats_row, rebuild_player_stats
+from app.api import endpoints, llm, warmup
+from app.core.admission import AdmissionController
+from app.core.cache import cache
+from app.core.config import settings
 
 
 def test_create_game(client: TestClient):
@@ -43,7 +52,7 @@ def test_record_roll_valid(client: TestClient, db: Session):
     This test ensures that rolls can be recorded and updated for a valid game.
     """
     # Arrange
-    game = models.Game(player="Test Player")
+    game = models.Game(player=models.Player(name="Test Player"))
     db.add(game)
     db.commit()
     db.refresh(game)
@@ -60,6 +69,26 @@ def test_record_roll_valid(client: TestClient, db: Session):
     assert response.json() == "Rolls recorded successfully."
 
 
+def test_record_roll_out_of_range(client: TestClient):
+    """
+    Test recording rolls outside 0-10.
+
+    This should return a 422 error on every database, before anything is stored.
+    """
+    # Arrange
+    game_id = client.post("/games", json={"player": "Range Player"}).json()["id"]
+
+    # Act
+    negative = client.post(f"/games/{game_id}/rolls", json={"frames": [[-1, 3]]})
+    too_many = client.post(f"/games/{game_id}/rolls", json={"frames": [[300]]})
+
+    # Assert
+    assert negative.status_code == 422
+    assert too_many.status_code == 422
+    # A game without frames has no score yet
+    assert client.get(f"/games/{game_id}/score").status_code == 404
+
+
 def test_record_roll_invalid_game_id(client: TestClient):
     """
     Test recording rolls for an invalid game ID.
@@ -88,7 +117,7 @@ def test_get_score_strike_spare_open_frame(client: TestClient, db: Session):
     Expected total score: 41
     """
     # Arrange
-    game = models.Game(player="Test Player")
+    game = models.Game(player=models.Player(name="Test Player"))
     db.add(game)
     db.commit()
     db.refresh(game)
@@ -122,7 +151,7 @@ def test_get_score_tenth_frame_strike(client: TestClient, db: Session):
     This should result in a perfect game with a score of 300.
     """
     # Arrange
-    game = models.Game(player="Test Player")
+    game = models.Game(player=models.Player(name="Test Player"))
     db.add(game)
     db.commit()
     db.refresh(game)
@@ -164,7 +193,7 @@ def test_get_score_tenth_frame_spare(client: TestClient, db: Session):
     Expected total score: 275.
     """
     # Arrange
-    game = models.Game(player="Test Player")
+    game = models.Game(player=models.Player(name="Test Player"))
     db.add(game)
     db.commit()
     db.refresh(game)
@@ -206,7 +235,7 @@ def test_get_score_tenth_frame_open(client: TestClient, db: Session):
     Expected total score: 267.
     """
     # Arrange
-    game = models.Game(player="Test Player")
+    game = models.Game(player=models.Player(name="Test Player"))
     db.add(game)
     db.commit()
     db.refresh(game)
@@ -240,17 +269,18 @@ def test_get_score_tenth_frame_open(client: TestClient, db: Session):
     assert response.json()["score"] == 267
 
 
-def test_get_summary_valid(client: TestClient, mocker):
+def test_get_summary_valid(client: TestClient, db: Session, monkeypatch):
     """
     Test generating a natural language summary of the game using an LLM.
 
     This test mocks the LLM to ensure the summary is generated correctly and returned via the summary endpoint.
     """
     # Mock the LLM summary generation
-    mocker.patch("app.api.llm.get_llm_summary", return_value="Test summary")
+    monkeypatch.setattr(endpoints, "summarize_game", lambda *args, **kwargs: ("Test summary", None))
+    monkeypatch.setattr(endpoints, "summary_admission", AdmissionController(4, 8, 1, rate=100, burst=100))
 
     # Arrange
-    game = models.Game(player="Test Player")
+    game = models.Game(player=models.Player(name="Test Player"))
     db.add(game)
     db.commit()
     db.refresh(game)
@@ -279,3 +309,822 @@ def test_get_summary_invalid_game_id(client: TestClient):
     # Assert
     assert response.status_code == 404
     assert response.json()["detail"] == "Game not found"
+
+
+def test_record_roll_stores_game_aggregates(client: TestClient, db: Session):
+    """
+    Test that recording rolls stores the score, strikes and spares on the game.
+
+    The history endpoint reads these stored aggregates instead of rescoring frames.
+    """
+    # Arrange
+    game = models.Game(player=models.Player(name="Stored Player"))
+    db.add(game)
+    db.commit()
+    db.refresh(game)
+
+    data = {"frames": [[10], [5, 5], [4, 3]]}
+
+    # Act
+    client.post(f"/games/{game.id}/rolls", json=data)
+    response = client.get("/players/Stored Player/history")
+
+    # Assert
+    stored = db.query(models.Game).filter(models.Game.player.has(name="Stored Player")).one()
+    assert (stored.score, stored.strikes, stored.spares) == (41, 1, 1)
+    assert response.status_code == 200
+    history = response.json()["games"]
+    assert history[0]["score"] == 41
+    assert history[0]["strikes"] == 1
+    assert history[0]["spares"] == 1
+
+
+def test_get_player_trends(client: TestClient, db: Session):
+    """
+    Test rolling last-N and monthly trends computed by the trends endpoint.
+
+    - Two games in January scoring 100 and 200
+    - One game in February scoring 150
+    With a window of 2 games the last-N average is (200 + 150) / 2 = 175.
+    """
+    # Arrange
+    games = [
+        (datetime(2024, 1, 5), 100, 2, 3),
+        (datetime(2024, 1, 20), 200, 5, 2),
+        (datetime(2024, 2, 3), 150, 4, 4),
+    ]
+    player = models.Player(name="Trend Player")
+    for start_time, score, strikes, spares in games:
+        db.add(models.Game(player=player, start_time=start_time, score=score, strikes=strikes, spares=spares))
+    db.commit()
+
+    # Act
+    response = client.get("/players/Trend Player/trends", params={"last_n": 2})
+
+    # Assert
+    assert response.status_code == 200
+    trends = response.json()
+    assert trends["last_n"] == {"games": 2, "average_score": 175.0, "strike_rate": 0.45, "spare_rate": 0.3}
+    assert [game["score"] for game in trends["games"]] == [200, 150]
+    assert [game["rolling_average"] for game in trends["games"]] == [150.0, 175.0]
+    assert trends["monthly"] == [
+        {"month": "2024-01", "games": 2, "average_score": 150.0, "strike_rate": 0.35, "spare_rate": 0.25},
+        {"month": "2024-02", "games": 1, "average_score": 150.0, "strike_rate": 0.4, "spare_rate": 0.4},
+    ]
+
+
+def test_get_player_trends_unknown_player(client: TestClient):
+    """
+    Test requesting trends for a player without games.
+
+    This should return a 404 error.
+    """
+    # Act
+    response = client.get("/players/Nobody/trends")
+
+    # Assert
+    assert response.status_code == 404
+    assert response.json()["detail"] == "No games found for this player"
+
+
+def test_get_player_statistics_from_rollup(client: TestClient):
+    """
+    Test that statistics are maintained incrementally as games are created and rolled.
+
+    - Game 1: strike, spare, open frame scoring 41
+    - Game 2: two open frames scoring 15
+    - Game 3: no rolls yet, scoring 0
+    """
+    # Arrange
+    first = client.post("/games", json={"player": "Rollup Player"}).json()["id"]
+    second = client.post("/games", json={"player": "Rollup Player"}).json()["id"]
+    client.post("/games", json={"player": "Rollup Player"})
+
+    # Act
+    client.post(f"/games/{first}/rolls", json={"frames": [[10], [5, 5], [4, 3]]})
+    client.post(f"/games/{second}/rolls", json={"frames": [[4, 3], [6, 2]]})
+    response = client.get("/players/Rollup Player/statistics")
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json() == {
+        "player_id": 1,
+        "player_name": "Rollup Player",
+        "total_games": 3,
+        "total_score": 56,
+        "highest_score": 41,
+        "lowest_score": 0,
+        "average_score": 18.67,
+        "total_strikes": 1,
+        "total_spares": 1,
+    }
+
+
+def test_rebuild_player_stats_repairs_drift(db: Session):
+    """
+    Test that rebuilding the rollup restores statistics from the games table.
+    """
+    # Arrange
+    player = models.Player(name="Drift Player")
+    db.add(models.Game(player=player, score=120, strikes=3, spares=2))
+    db.add(models.Game(player=player, score=80, strikes=1, spares=1))
+    db.flush()
+    player_id = player.id
+    db.add(
+        models.PlayerStats(
+            player_id=player_id,
+            total_games=7,
+            total_score=1,
+            highest_score=1,
+            lowest_score=1,
+            strikes=0,
+            spares=0,
+        )
+    )
+    db.commit()
+
+    # Act
+    rebuild_player_stats(db, player_id)
+
+    # Assert
+    stats = db.get(models.PlayerStats, player_id)
+    db.refresh(stats)
+    assert (stats.total_games, stats.total_score, stats.highest_score, stats.lowest_score) == (2, 200, 120, 80)
+    assert (stats.strikes, stats.spares) == (4, 3)
+
+
+def test_rebuild_player_stats_keeps_revisions_increasing(db: Session):
+    """
+    Test that rebuilt rows, including those of players left without games, get a higher revision.
+    """
+    # Arrange
+    active = models.Player(name="Active Player")
+    idle = models.Player(name="Idle Player")
+    db.add(models.Game(player=active, score=90, strikes=1, spares=2))
+    db.add(idle)
+    db.flush()
+    active_id, idle_id = active.id, idle.id
+    for player_id, revision in ((active_id, 5), (idle_id, 3)):
+        db.add(
+            models.PlayerStats(
+                player_id=player_id,
+                total_games=2,
+                total_score=150,
+                highest_score=100,
+                lowest_score=50,
+                strikes=0,
+                spares=0,
+                revision=revision,
+            )
+        )
+    db.commit()
+
+    # Act
+    rows = rebuild_player_stats(db)
+
+    # Assert
+    db.expire_all()
+    active_stats, idle_stats = db.get(models.PlayerStats, active_id), db.get(models.PlayerStats, idle_id)
+    assert rows == 2
+    assert (active_stats.total_games, active_stats.total_score, active_stats.revision) == (1, 90, 6)
+    assert (idle_stats.total_games, idle_stats.total_score, idle_stats.highest_score) == (0, 0, 0)
+    assert idle_stats.revision == 4
+
+
+def test_get_score_conditional_get(client: TestClient):
+    """
+    Test that the score endpoint returns an ETag and honours If-None-Match.
+
+    A matching ETag yields 304 until a new roll bumps the game's revision.
+    """
+    # Arrange
+    game_id = client.post("/games", json={"player": "ETag Player"}).json()["id"]
+    client.post(f"/games/{game_id}/rolls", json={"frames": [[4, 3]]})
+    first = client.get(f"/games/{game_id}/score")
+    etag = first.headers["etag"]
+
+    # Act
+    unchanged = client.get(f"/games/{game_id}/score", headers={"If-None-Match": etag})
+    client.post(f"/games/{game_id}/rolls", json={"frames": [[4, 3], [10]]})
+    changed = client.get(f"/games/{game_id}/score", headers={"If-None-Match": etag})
+
+    # Assert
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["score"] == 7
+
+
+def test_get_history_and_statistics_conditional_get(client: TestClient):
+    """
+    Test that history and statistics ETags change when the player starts a new game.
+    """
+    # Arrange
+    client.post("/games", json={"player": "ETag Player"})
+    history_etag = client.get("/players/ETag Player/history").headers["etag"]
+    statistics_etag = client.get("/players/ETag Player/statistics").headers["etag"]
+
+    # Act
+    history = client.get("/players/ETag Player/history", headers={"If-None-Match": history_etag})
+    statistics = client.get("/players/ETag Player/statistics", headers={"If-None-Match": statistics_etag})
+    client.post("/games", json={"player": "ETag Player"})
+    refreshed = client.get("/players/ETag Player/history", headers={"If-None-Match": history_etag})
+
+    # Assert
+    assert history.status_code == 304
+    assert statistics.status_code == 304
+    assert refreshed.status_code == 200
+    assert len(refreshed.json()["games"]) == 2
+
+
+def test_get_player_history_serializes_start_time(client: TestClient, db: Session):
+    """
+    Test that the typed history response renders start times as ISO 8601 strings.
+    """
+    # Arrange
+    db.add(models.Game(player=models.Player(name="History Player"), start_time=datetime(2024, 3, 9, 19, 45), score=180))
+    db.commit()
+
+    # Act
+    response = client.get("/players/History Player/history")
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json()["games"] == [
+        {"game_id": 1, "score": 180, "strikes": 0, "spares": 0, "start_time": "2024-03-09T19:45:00"}
+    ]
+
+
+def test_get_player_trends_cache_invalidated_by_roll(client: TestClient):
+    """
+    Test that cached trends are invalidated when one of the player's games is rolled.
+    """
+    # Arrange
+    game_id = client.post("/games", json={"player": "Cached Player"}).json()["id"]
+    before = client.get("/players/Cached Player/trends").json()
+
+    # Act
+    client.post(f"/games/{game_id}/rolls", json={"frames": [[10], [4, 3]]})
+    after = client.get("/players/Cached Player/trends").json()
+
+    # Assert
+    assert before["last_n"]["average_score"] == 0.0
+    assert after["last_n"]["average_score"] == 24.0
+
+
+def test_get_player_distribution_league_rank_follows_other_players(client: TestClient):
+    """
+    Test that a player's cached distribution still reports a current league rank.
+
+    Player B overtaking Player A changes A's rank without touching A's games, so
+    only A's own histogram may come from the cache.
+    """
+    # Arrange
+    game_a = client.post("/games", json={"player": "Leading Player"}).json()["id"]
+    client.post(f"/games/{game_a}/rolls", json={"frames": [[10], [4, 3]]})
+    game_b = client.post("/games", json={"player": "Chasing Player"}).json()["id"]
+    client.post(f"/games/{game_b}/rolls", json={"frames": [[5, 4]]})
+    before = client.get("/players/Leading Player/distribution").json()
+
+    # Act
+    client.post(f"/games/{game_b}/rolls", json={"frames": [[10], [10], [10], [10]]})
+    after = client.get("/players/Leading Player/distribution").json()
+
+    # Assert
+    assert after["histogram"] == before["histogram"]
+    assert after["league_percentile_rank"] < before["league_percentile_rank"]
+
+
+def test_get_player_trends_ignores_entry_of_older_revision(client: TestClient):
+    """
+    Test that trends cached from a lagging replica after a write are not served.
+
+    A reader on a replica that hasn't applied the roll yet refills the cache with the
+    pre-roll trends; they carry the pre-roll revision, so the next reader recomputes.
+    """
+    # Arrange
+    game_id = client.post("/games", json={"player": "Lagging Player"}).json()["id"]
+    player_id = client.get("/players/Lagging Player/history").json()["player_id"]
+    client.get("/players/Lagging Player/trends")
+    stale = cache.get(("trends", player_id, endpoints.DEFAULT_TRENDS_WINDOW))
+    client.post(f"/games/{game_id}/rolls", json={"frames": [[10], [4, 3]]})
+    cache.set(("trends", player_id, endpoints.DEFAULT_TRENDS_WINDOW), stale)
+
+    # Act
+    response = client.get("/players/Lagging Player/trends")
+
+    # Assert
+    assert stale[1]["last_n"]["average_score"] == 0.0
+    assert response.json()["last_n"]["average_score"] == 24.0
+
+
+def test_get_summary_uses_provider_registry(client: TestClient):
+    """
+    Test that summaries are dispatched through the provider registry.
+
+    A placeholder backend answers without loading the OpenAI SDK, and an unknown
+    model name is rejected with a 400 error.
+    """
+    # Arrange
+    game_id = client.post("/games", json={"player": "Summary Player"}).json()["id"]
+    client.post(f"/games/{game_id}/rolls", json={"frames": [[5, 4]]})
+
+    # Act
+    placeholder = client.get(f"/games/{game_id}/summary", params={"llm": "bert"})
+    invalid = client.get(f"/games/{game_id}/summary", params={"llm": "unknown"})
+
+    # Assert
+    assert placeholder.status_code == 200
+    assert placeholder.json()["summary"] == "Sorry, summarization with BERT hasn't been implemented yet."
+    assert invalid.status_code == 400
+    assert invalid.json()["detail"] == "Invalid LLM selected"
+
+
+def test_get_player_distribution(client: TestClient, db: Session):
+    """
+    Test the score histogram, median, 90th percentile and league rank of a player.
+
+    - Player A scores 100, 150, 200 and 250 (average 175)
+    - Player B averages 120 and player C averages 200
+    Player A's average is above one of the other two players, a percentile rank of 50.
+    """
+    # Arrange
+    players = {name: models.Player(name=name) for name in ("Player A", "Player B", "Player C")}
+    for score in (100, 150, 200, 250):
+        db.add(models.Game(player=players["Player A"], score=score))
+    db.add_all(players.values())
+    db.flush()
+    for name, total_score in (("Player A", 700), ("Player B", 240), ("Player C", 400)):
+        db.add(
+            models.PlayerStats(
+                player_id=players[name].id,
+                total_games=4 if name == "Player A" else 2,
+                total_score=total_score,
+                highest_score=0,
+                lowest_score=0,
+                strikes=0,
+                spares=0,
+                revision=1,
+            )
+        )
+    db.commit()
+
+    # Act
+    response = client.get("/players/Player A/distribution", params={"bin_width": 50})
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json() == {
+        "player_id": 1,
+        "player_name": "Player A",
+        "games": 4,
+        "median": 175.0,
+        "p90": 235.0,
+        "histogram": [
+            {"low": 100, "high": 149, "count": 1},
+            {"low": 150, "high": 199, "count": 1},
+            {"low": 200, "high": 249, "count": 1},
+            {"low": 250, "high": 299, "count": 1},
+        ],
+        "league_percentile_rank": 50.0,
+    }
+
+
+def test_get_summary_reuses_summary_of_unchanged_game(client: TestClient, monkeypatch):
+    """
+    Test that the summary of an unchanged game is served from the summary cache.
+
+    The model is only called again after a new roll changes the game.
+    """
+    # Arrange
+    calls = []
+    monkeypatch.setitem(llm.PROVIDERS, "counting", lambda: lambda prompt: calls.append(prompt) or "Counted summary")
+    game_id = client.post("/games", json={"player": "Summary Cache Player"}).json()["id"]
+    client.post(f"/games/{game_id}/rolls", json={"frames": [[5, 4]]})
+
+    # Act
+    first = client.get(f"/games/{game_id}/summary", params={"llm": "counting"})
+    second = client.get(f"/games/{game_id}/summary", params={"llm": "counting"})
+    client.post(f"/games/{game_id}/rolls", json={"frames": [[5, 4], [3, 3]]})
+    third = client.get(f"/games/{game_id}/summary", params={"llm": "counting"})
+
+    # Assert
+    assert first.json() == second.json() == third.json() == {"summary": "Counted summary", "degraded": False}
+    assert len(calls) == 2
+
+
+def test_get_summary_sheds_load(client: TestClient, monkeypatch):
+    """
+    Test that summary requests over a client's rate are shed.
+
+    With degraded mode the last summary of the game is served and flagged; without
+    it the request is rejected with a 429 and a Retry-After header.
+    """
+    # Arrange
+    monkeypatch.setattr(endpoints, "summary_admission", AdmissionController(1, 0, 1, rate=0.01, burst=1))
+    game_id = client.post("/games", json={"player": "Busy Player"}).json()["id"]
+    client.post(f"/games/{game_id}/rolls", json={"frames": [[5, 4]]})
+    client.get(f"/games/{game_id}/summary", params={"llm": "bert"})
+    client.post(f"/games/{game_id}/rolls", json={"frames": [[5, 4], [3, 3]]})
+
+    # Act
+    degraded = client.get(f"/games/{game_id}/summary", params={"llm": "bert"})
+    monkeypatch.setattr(settings, "SUMMARY_DEGRADED_MODE", False)
+    rejected = client.get(f"/games/{game_id}/summary", params={"llm": "bert"})
+
+    # Assert
+    assert degraded.status_code == 200
+    assert degraded.json()["degraded"] is True
+    assert rejected.status_code == 429
+    assert rejected.json()["detail"] == "Rate limit exceeded"
+    assert int(rejected.headers["Retry-After"]) >= 1
+
+
+def test_record_roll_rejects_stale_revision(client: TestClient):
+    """
+    Test optimistic concurrency on frame updates.
+
+    Two terminals start from the same revision: the first update wins, and the
+    second, sent with the now stale revision, is rejected with a 409 without
+    overwriting the first terminal's frames.
+    """
+    # Arrange
+    created = client.post("/games", json={"player": "Racing Player"}).json()
+    game_id, revision = created["id"], created["revision"]
+
+    # Act
+    first = client.post(f"/games/{game_id}/rolls", json={"frames": [[5, 4]], "revision": revision})
+    second = client.post(f"/games/{game_id}/rolls", json={"frames": [[1, 1]], "revision": revision})
+    etag = client.get(f"/games/{game_id}/score").headers["ETag"]
+    stale_header = client.post(
+        f"/games/{game_id}/rolls", json={"frames": [[2, 2]]}, headers={"If-Match": f'W/"score-{game_id}-{revision}"'}
+    )
+    current_header = client.post(
+        f"/games/{game_id}/rolls", json={"frames": [[5, 4], [3, 3]]}, headers={"If-Match": etag}
+    )
+
+    # Assert
+    assert first.status_code == 200
+    assert first.json()["revision"] == revision + 1
+    assert second.status_code == 409
+    assert stale_header.status_code == 409
+    assert current_header.status_code == 200
+    assert client.get(f"/games/{game_id}/score").json()["score"] == 15
+
+
+def test_record_roll_writes_only_changed_frames(client: TestClient, db: Session):
+    """
+    Test that an update only rewrites frames whose rolls changed.
+
+    Re-sending the same frames is a no-op that keeps the revision, and a correction
+    to one frame leaves the rows of the other frames untouched.
+    """
+    # Arrange
+    game_id = client.post("/games", json={"player": "Retry Player"}).json()["id"]
+    revision = client.post(f"/games/{game_id}/rolls", json={"frames": [[5, 4], [3, 3]]}).json()["revision"]
+    frame_writes = []
+
+    def record_frame_writes(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith(("UPDATE frames", "INSERT INTO frames")):
+            frame_writes.append(parameters)
+
+    event.listen(db.get_bind(), "before_cursor_execute", record_frame_writes)
+
+    # Act
+    try:
+        retried = client.post(f"/games/{game_id}/rolls", json={"frames": [[5, 4], [3, 3]]})
+        corrected = client.post(f"/games/{game_id}/rolls", json={"frames": [[5, 4], [3, 4]]})
+    finally:
+        event.remove(db.get_bind(), "before_cursor_execute", record_frame_writes)
+
+    # Assert
+    assert retried.json()["revision"] == revision
+    assert corrected.json()["revision"] == revision + 1
+    assert len(frame_writes) == 1
+    assert client.get(f"/games/{game_id}/score").json()["score"] == 16
+
+
+def test_get_scoreboard(client: TestClient, db: Session):
+    """
+    Test the scorecards of several games in one request.
+
+    - An archived perfect game is read back from the archive
+    - A game with a strike awaiting its bonus rolls has no running score for that frame yet
+    - An unknown game ID is reported as not found
+    The whole scoreboard is loaded with a fixed number of SELECT queries.
+    """
+    # Arrange
+    perfect_game = client.post("/games", json={"player": "Lane 1"}).json()["id"]
+    client.post(f"/games/{perfect_game}/rolls", json={"frames": [[10]] * 9 + [[10, 10, 10]]})
+    db.query(models.Game).filter(models.Game.id == perfect_game).update({models.Game.start_time: datetime(2000, 1, 1)})
+    db.commit()
+    archive_games(db, timedelta(days=90))
+    open_game = client.post("/games", json={"player": "Lane 2"}).json()["id"]
+    client.post(f"/games/{open_game}/rolls", json={"frames": [[5, 5], [3, 4], [10]]})
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(db.get_bind(), "before_cursor_execute", record_statement)
+
+    # Act
+    try:
+        response = client.get("/scoreboard", params={"game_ids": [open_game, 99999, perfect_game, open_game]})
+    finally:
+        event.remove(db.get_bind(), "before_cursor_execute", record_statement)
+
+    # Assert
+    assert response.status_code == 200
+    body = response.json()
+    assert [game["game_id"] for game in body["games"]] == [open_game, perfect_game]
+    assert body["not_found"] == [99999]
+    assert [frame["cumulative_score"] for frame in body["games"][0]["frames"]] == [13, 20, None]
+    assert body["games"][0]["score"] == 20
+    assert body["games"][1]["frames"][-1] == {"frame_number": 10, "rolls": [10, 10, 10], "cumulative_score": 300}
+    assert len(statements) <= 3
+
+
+def test_player_name_variants_share_one_player(client: TestClient, db: Session):
+    """
+    Test that games created with differently spelled names belong to the same player.
+
+    Names are matched ignoring case and extra whitespace, and player endpoints accept
+    either the player's integer ID or any spelling of the name.
+    """
+    # Arrange
+    first = client.post("/games", json={"player": "Jane Doe"}).json()
+    second = client.post("/games", json={"player": "  jane   DOE "}).json()
+    client.post(f"/games/{first['id']}/rolls", json={"frames": [[5, 4]]})
+    client.post(f"/games/{second['id']}/rolls", json={"frames": [[3, 3]]})
+
+    # Act
+    by_id = client.get(f"/players/{first['player_id']}/statistics")
+    by_variant = client.get("/players/JANE doe/history")
+    unknown = client.get("/players/Nobody/statistics")
+
+    # Assert
+    assert second["player_id"] == first["player_id"]
+    assert second["player"] == "Jane Doe"
+    assert db.query(models.Player).count() == 1
+    assert by_id.json()["total_games"] == 2
+    assert by_id.json()["player_name"] == "Jane Doe"
+    assert [game["score"] for game in by_variant.json()["games"]] == [9, 6]
+    assert unknown.status_code == 404
+
+
+def test_player_reference_with_non_decimal_digits(client: TestClient):
+    """
+    Test that a reference of digits int() can't parse, like "²", is looked up as a name.
+    """
+    # Act
+    response = client.get("/players/²/history")
+
+    # Assert
+    assert response.status_code == 404
+
+
+def test_player_reference_beyond_id_range(client: TestClient):
+    """
+    Test that a number too large to be an ID is looked up as a name.
+    """
+    # Arrange
+    client.post("/games", json={"player": "99999999999999999999"})
+
+    # Act
+    by_name = client.get("/players/99999999999999999999/statistics")
+    unknown = client.get("/players/2147483648/statistics")
+
+    # Assert
+    assert by_name.status_code == 200
+    assert by_name.json()["player_name"] == "99999999999999999999"
+    assert unknown.status_code == 404
+
+
+def test_roll_events_change_feed(client: TestClient):
+    """
+    Test that rolls and corrections are appended to the change feed.
+
+    - Frame 1 is bowled one roll at a time, then corrected
+    - A retried update writes no event
+    A consumer reads the feed in batches of two, resuming after the last sequence.
+    """
+    # Arrange
+    game_id = client.post("/games", json={"player": "Feed Player"}).json()["id"]
+    for frames in ([[5]], [[5, 4]], [[5, 4]], [[6, 3]]):
+        client.post(f"/games/{game_id}/rolls", json={"frames": frames})
+
+    # Act
+    first = client.get("/events", params={"limit": 2}).json()
+    second = client.get("/events", params={"after": first["last_sequence"], "limit": 2}).json()
+    caught_up = client.get("/events", params={"after": second["last_sequence"]}).json()
+    replay = client.get("/events", params={"game_id": game_id}).json()
+
+    # Assert
+    events = first["events"] + second["events"]
+    assert [(event["kind"], event["previous_rolls"], event["rolls"]) for event in events] == [
+        ("roll", None, [5]),
+        ("roll", [5], [5, 4]),
+        ("correction", [5, 4], [6, 3]),
+    ]
+    assert [event["revision"] for event in events] == [1, 2, 3]
+    assert [event["sequence"] for event in events] == sorted(event["sequence"] for event in events)
+    assert caught_up == {"events": [], "last_sequence": second["last_sequence"]}
+    assert replay["events"] == events
+
+
+def test_get_summary_records_token_usage(client: TestClient, monkeypatch):
+    """
+    Test that the token usage reported by the model is recorded and aggregated per billed model.
+
+    The backend receives the compact prompt with the running scores, and a backend
+    returning a plain string records no usage.
+    """
+    # Arrange
+    prompts = []
+
+    def metered():
+        return lambda prompt: prompts.append(prompt) or llm.Completion("Metered summary", 40, 12, "metered-1")
+
+    monkeypatch.setitem(llm.PROVIDERS, "metered", metered)
+    monkeypatch.setattr(endpoints, "summary_admission", AdmissionController(4, 8, 1, rate=100, burst=100))
+    game_id = client.post("/games", json={"player": "Metered Player"}).json()["id"]
+    client.post(f"/games/{game_id}/rolls", json={"frames": [[10], [7, 3]]})
+
+    # Act
+    client.get(f"/games/{game_id}/summary", params={"llm": "metered"})
+    client.post(f"/games/{game_id}/rolls", json={"frames": [[10], [7, 3], [9, 0]]})
+    client.get(f"/games/{game_id}/summary", params={"llm": "metered"})
+    client.get(f"/games/{game_id}/summary", params={"llm": "bert"})
+    response = client.get("/llm/usage")
+
+    # Assert
+    assert "1 X 20 | 2 7/ 39 | 3 9- 48" in prompts[1]
+    assert response.status_code == 200
+    [usage] = response.json()["models"]
+    assert usage["model"] == "metered-1"
+    assert usage["prompt_version"] == settings.LLM_PROMPT_VERSION
+    assert (usage["requests"], usage["prompt_tokens"], usage["completion_tokens"], usage["total_tokens"]) == (
+        2,
+        80,
+        24,
+        104,
+    )
+
+
+def test_readiness(client: TestClient, monkeypatch):
+    """
+    Test that a worker reports 503 on /ready until its warm-up finished.
+    """
+    # Arrange
+    monkeypatch.setattr(warmup, "warmup", warmup.Warmup())
+
+    # Act
+    warming_up = client.get("/ready")
+    warmup.warmup.ready.set()
+    ready = client.get("/ready")
+
+    # Assert
+    assert warming_up.status_code == 503
+    assert warming_up.json()["status"] == "warming up"
+    assert ready.status_code == 200
+    assert ready.json()["status"] == "ready"
+
+
+def test_search_games(client: TestClient, db: Session):
+    """
+    Test searching games by their aggregates, player and start time, with keyset pagination.
+
+    - Five October games of Player A score 200, 210, 260, 270 and 280, with 8 strikes from 260 up
+    - Player B also scores 300 in October, and Player A 290 in September
+    Searching Player A's 250+ October games with 8 or more strikes, two per page, returns
+    the three games newest first over two pages.
+    """
+    # Arrange
+    player_a = models.Player(name="Player A")
+    player_b = models.Player(name="Player B")
+    october = datetime(2026, 10, 1)
+    for day, score in enumerate((200, 210, 260, 270, 280), start=1):
+        db.add(
+            models.Game(
+                player=player_a, score=score, strikes=8 if score >= 260 else 3, start_time=october + timedelta(days=day)
+            )
+        )
+    db.add(models.Game(player=player_b, score=300, strikes=12, start_time=october + timedelta(days=2)))
+    db.add(models.Game(player=player_a, score=290, strikes=11, start_time=october - timedelta(days=5)))
+    db.commit()
+    filters = {
+        "player": "player a",
+        "min_score": 250,
+        "min_strikes": 8,
+        "started_from": "2026-10-01",
+        "started_before": "2026-11-01",
+        "limit": 2,
+    }
+
+    # Act
+    first = client.get("/games/search", params=filters).json()
+    second = client.get("/games/search", params={**filters, "cursor": first["next_cursor"]}).json()
+    invalid = client.get("/games/search", params={"cursor": "not a cursor"})
+    out_of_range = client.get("/games/search", params={"cursor": encode_cursor(datetime.utcnow(), 10**20)})
+
+    # Assert
+    assert [game["score"] for game in first["games"]] == [280, 270]
+    assert [game["score"] for game in second["games"]] == [260]
+    assert second["next_cursor"] is None
+    assert first["games"][0]["player_name"] == "Player A"
+    assert invalid.status_code == 400
+    assert out_of_range.status_code == 400
+
+
+def test_compare_players(client: TestClient, db: Session):
+    """
+    Test comparing several players side by side, ranked by average score.
+
+    - Player A averages 150, Player B 200 and Player C 150 over two games each
+    - "Player D" doesn't exist and "Player E" has no games
+    - "²" is made of digits int() can't parse, and "99999999999999999999" is too large
+      for an ID, so both are looked up as names only
+    Players A and C tie for second place, and all statistics come from one grouped query.
+    """
+    # Arrange
+    scores = {"Player A": (100, 200), "Player B": (190, 210), "Player C": (150, 150)}
+    for name, (first, second) in scores.items():
+        player = models.Player(name=name)
+        db.add_all([models.Game(player=player, score=first, strikes=2), models.Game(player=player, score=second)])
+    db.add(models.Player(name="Player E"))
+    db.commit()
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(db.get_bind(), "before_cursor_execute", record_statement)
+
+    # Act
+    try:
+        response = client.get(
+            "/players/compare",
+            params={
+                "players": ["player a", "Player B", "3", "Player D", "Player E"],
+                "rank_by": "average_score",
+            },
+        )
+    finally:
+        event.remove(db.get_bind(), "before_cursor_execute", record_statement)
+    unranked = client.get("/players/compare", params={"players": ["Player C", "²", "99999999999999999999", "Player A"]})
+    invalid = client.get("/players/compare", params={"players": ["Player A"], "rank_by": "name"})
+
+    # Assert
+    assert response.status_code == 200
+    body = response.json()
+    assert [(player["player_name"], player["rank"]) for player in body["players"]] == [
+        ("Player B", 1),
+        ("Player A", 2),
+        ("Player C", 2),
+    ]
+    assert body["players"][1]["highest_score"] == 200
+    assert body["players"][1]["strike_rate"] == 0.1
+    assert body["not_found"] == ["Player D", "Player E"]
+    assert len(statements) == 2
+    assert [player["player_name"] for player in unranked.json()["players"]] == ["Player C", "Player A"]
+    assert unranked.json()["players"][0]["rank"] is None
+    assert unranked.json()["not_found"] == ["²", "99999999999999999999"]
+    assert invalid.status_code == 400
+
+
+def test_player_stats_row_created_concurrently(db: Session, monkeypatch):
+    """
+    Test that a rollup row created by a concurrent request is reused rather than failing.
+
+    The lookup misses the row, as it would before the other request committed, so the
+    insert hits the primary key and falls back to reading the existing row.
+    """
+    # Arrange
+    player = models.Player(name="Racing Player")
+    db.add(player)
+    db.flush()
+    player_id = player.id
+    db.add(models.PlayerStats(player_id=player_id, total_games=2, total_score=0, highest_score=0, lowest_score=0))
+    db.commit()
+    db.expunge_all()
+
+    lookups = []
+    first = Query.first
+
+    def missing_once(query):
+        lookups.append(query)
+        return None if len(lookups) == 1 else first(query)
+
+    monkeypatch.setattr(Query, "first", missing_once)
+
+    # Act
+    stats = get_player_stats_row(db, player_id, lock=True)
+    db.commit()
+
+    # Assert
+    assert stats.total_games == 2
+    assert db.query(models.PlayerStats).count() == 1
@@ -0,0 +1,80 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.main import app
+from app.db import base, models
+from app.db.base import Base, ReadRouter, get_db, get_read_db
+
+"""
+This module tests read-replica routing against two local SQLite databases, one
+acting as the primary and one as a (never replicated) read replica.
+"""
+
+
+@pytest.fixture(scope="function")
+def databases(tmp_path, monkeypatch):
+    """
+    Create a primary and a replica database and route the app's sessions to them.
+    """
+    sessions = {}
+    for name in ("primary", "replica"):
+        engine = create_engine(f"sqlite:///{tmp_path / name}.db", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=engine)
+        sessions[name] = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    monkeypatch.setattr(base, "read_router", ReadRouter(sessions["primary"], [sessions["replica"]], 60))
+
+    def override_get_db():
+        db = sessions["primary"]()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides.pop(get_read_db, None)
+
+    yield sessions
+
+    app.dependency_overrides.clear()
+
+
+def test_reads_are_served_by_replica(databases):
+    """
+    Test that read-only endpoints use the replica when the client hasn't written.
+    """
+    # Arrange
+    replica = databases["replica"]()
+    replica.add(models.Game(player=models.Player(name="Replica Player"), score=99))
+    replica.commit()
+    replica.close()
+
+    # Act
+    with TestClient(app) as client:
+        response = client.get("/players/Replica Player/history")
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json()["games"][0]["score"] == 99
+
+
+def test_reads_after_own_write_are_served_by_primary(databases):
+    """
+    Test read-your-writes: after its own roll a client reads from the primary,
+    while a client that didn't write still reads from the (lagging) replica.
+    """
+    with TestClient(app) as writer, TestClient(app) as reader:
+        # Arrange
+        game_id = writer.post("/games", json={"player": "Primary Player"}).json()["id"]
+
+        # Act
+        roll = writer.post(f"/games/{game_id}/rolls", json={"frames": [[10], [4, 3]]})
+        own_read = writer.get(f"/games/{game_id}/score")
+        other_read = reader.get(f"/games/{game_id}/score")
+
+    # Assert
+    assert base.READ_YOUR_WRITES_COOKIE in roll.cookies
+    assert own_read.status_code == 200
+    assert own_read.json()["score"] == 24
+    assert other_read.status_code == 404
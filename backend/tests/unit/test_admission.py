@@ -0,0 +1,84 @@
+import asyncio
+import pytest
+from app.core.admission import AdmissionController, AdmissionRejected, TokenBuckets
+
+"""
+This module contains unit tests for the admission control guarding slow LLM calls.
+"""
+
+
+def test_token_bucket_allows_burst_then_limits():
+    """
+    Test that a client may make `burst` calls at once and is then told how long to wait.
+    """
+    buckets = TokenBuckets(rate=0.5, burst=2)
+
+    assert buckets.acquire("client") == 0
+    assert buckets.acquire("client") == 0
+    assert buckets.acquire("client") == pytest.approx(2, abs=0.1)
+    assert buckets.acquire("other") == 0
+
+
+def test_waiting_call_gets_released_slot():
+    """
+    Test that a queued call is admitted as soon as a running call releases its slot.
+    """
+    controller = AdmissionController(max_concurrent=1, max_queue=1, queue_timeout=1, rate=0, burst=1)
+    order = []
+
+    async def call(name, seconds):
+        async with controller.admit(name):
+            order.append(name)
+            await asyncio.sleep(seconds)
+
+    async def scenario():
+        await asyncio.gather(call("first", 0.05), call("second", 0))
+
+    asyncio.run(scenario())
+
+    assert order == ["first", "second"]
+    assert controller.active == 0
+
+
+def test_full_queue_and_timeout_are_rejected():
+    """
+    Test that calls beyond the queue are rejected at once and queued calls time out.
+    """
+    controller = AdmissionController(max_concurrent=1, max_queue=1, queue_timeout=0.05, rate=0, burst=1)
+
+    async def call(seconds):
+        async with controller.admit("client"):
+            await asyncio.sleep(seconds)
+
+    async def scenario():
+        return await asyncio.gather(call(0.2), call(0), call(0), return_exceptions=True)
+
+    results = asyncio.run(scenario())
+
+    assert results[0] is None
+    assert [error.reason for error in results[1:]] == ["Timed out waiting for capacity", "Too many pending requests"]
+    assert all(isinstance(error, AdmissionRejected) and error.retry_after >= 1 for error in results[1:])
+    assert controller.active == 0
+
+
+def test_global_rate_limit_applies_across_clients():
+    """
+    Test that the global bucket limits all clients together, without charging clients over their own rate.
+    """
+    controller = AdmissionController(
+        max_concurrent=4, max_queue=0, queue_timeout=1, rate=0.01, burst=1, global_rate=0.01, global_burst=2
+    )
+
+    async def call(client_id):
+        async with controller.admit(client_id):
+            pass
+
+    async def scenario():
+        return await asyncio.gather(*(call(client_id) for client_id in ("a", "a", "b", "c")), return_exceptions=True)
+
+    results = asyncio.run(scenario())
+
+    assert results[0] is None and results[2] is None
+    assert results[1].reason == "Rate limit exceeded"
+    assert results[3].reason == "Global rate limit exceeded"
+    assert results[3].retry_after >= 1
@@ -0,0 +1,56 @@
+import time
+from app.core.cache import Cache, cache, player_tag, publish_invalidation
+
+"""
+This module contains unit tests for the in-process cache and its invalidation on commit.
+"""
+
+
+def test_invalidate_tag_drops_tagged_entries():
+    """
+    Test that invalidating a tag drops only the entries carrying it.
+    """
+    local = Cache(max_entries=10, ttl=60)
+    local.set("history", 1, tags=["player:a"])
+    local.set("trends", 2, tags=["player:a", "game:1"])
+    local.set("other", 3, tags=["player:b"])
+
+    local.invalidate("player:a")
+
+    assert local.get("history") is None
+    assert local.get("trends") is None
+    assert local.get("other") == 3
+
+
+def test_entries_expire_and_evict():
+    """
+    Test that entries expire after the TTL and the least recently used entry is evicted.
+    """
+    expiring = Cache(max_entries=10, ttl=0.01)
+    expiring.set("key", "value")
+    time.sleep(0.02)
+    assert expiring.get("key") is None
+
+    bounded = Cache(max_entries=2, ttl=60)
+    bounded.set("a", 1)
+    bounded.set("b", 2)
+    bounded.get("a")
+    bounded.set("c", 3)
+    assert bounded.get("b") is None
+    assert (bounded.get("a"), bounded.get("c")) == (1, 3)
+
+
+def test_publish_invalidation_applies_on_commit_only(db):
+    """
+    Test that published tags invalidate the cache after commit and are discarded on rollback.
+    """
+    cache.set("stats", "cached", tags=[player_tag("Cache Player")])
+
+    publish_invalidation(db, player_tag("Cache Player"))
+    db.rollback()
+    assert cache.get("stats") == "cached"
+
+    publish_invalidation(db, player_tag("Cache Player"))
+    assert cache.get("stats") == "cached"
+    db.commit()
+    assert cache.get("stats") is None
@@ -0,0 +1,32 @@
+from starlette.requests import Request
+from app.api.etag import if_match_revision, make_etag
+
+"""
+This module contains unit tests for reading the revision a client expects from its ETags.
+"""
+
+
+def make_request(if_match: bytes = None) -> Request:
+    """
+    Build a request carrying the given raw `If-Match` header, decoded as a server would.
+    """
+    headers = [(b"if-match", if_match)] if if_match is not None else []
+    return Request({"type": "http", "headers": headers})
+
+
+def test_if_match_revision():
+    """
+    Test that the revision is read from the ETag of the resource, weak or strong.
+    """
+    assert if_match_revision(make_request(), "score", 1) is None
+    assert if_match_revision(make_request(b"*"), "score", 1) is None
+    assert if_match_revision(make_request(make_etag("score", 1, 4).encode()), "score", 1) == 4
+    assert if_match_revision(make_request(b'"other-1-4", "score-1-5"'), "score", 1) == 5
+    assert if_match_revision(make_request(b'W/"score-2-4"'), "score", 1) == -1
+
+
+def test_if_match_revision_with_non_decimal_digits():
+    """
+    Test that a revision of digits int() can't parse, like "²", never matches instead of failing.
+    """
+    assert if_match_revision(make_request('W/"score-1-²"'.encode("latin-1")), "score", 1) == -1
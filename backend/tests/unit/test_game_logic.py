@@ -1,5 +1,5 @@
 import pytest
-from app.db.models import Game, Frame
+from app.db.models import Frame, Game, Player
 
 # Docstring for the module
 """
@@ -12,7 +12,7 @@ def test_perfect_game(db_session):
     """
     Test that a perfect game (12 consecutive strikes) results in a score of 300.
     """
-    game = Game(player="Perfect Player")
+    game = Game(player=Player(name="Perfect Player"))
     db_session.add(game)
     db_session.commit()
 
@@ -32,7 +32,7 @@ def test_gutter_game(db_session):
     """
     Test that a gutter game (0 pins every roll) results in a score of 0.
     """
-    game = Game(player="Gutter Player")
+    game = Game(player=Player(name="Gutter Player"))
     db_session.add(game)
     db_session.commit()
 
@@ -52,7 +52,7 @@ def test_spare_calculation(db_session):
     """
     Test that a spare adds the score of the next roll to the current frame.
     """
-    game = Game(player="Spare Player")
+    game = Game(player=Player(name="Spare Player"))
     db_session.add(game)
     db_session.commit()
 
@@ -73,7 +73,7 @@ def test_strike_calculation(db_session):
     """
     Test that a strike adds the score of the next two rolls to the current frame.
     """
-    game = Game(player="Strike Player")
+    game = Game(player=Player(name="Strike Player"))
     db_session.add(game)
     db_session.commit()
 
@@ -94,7 +94,7 @@ def test_tenth_frame_bonus(db_session):
     """
     Test that in the 10th frame, the player can roll three times if they score a strike or spare.
     """
-    game = Game(player="Bonus Player")
+    game = Game(player=Player(name="Bonus Player"))
     db_session.add(game)
     db_session.commit()
 
@@ -120,7 +120,7 @@ def test_invalid_rolls(db_session):
     """
     Test handling of invalid rolls (e.g., negative values or too many pins in a frame).
     """
-    game = Game(player="Invalid Player")
+    game = Game(player=Player(name="Invalid Player"))
     db_session.add(game)
     db_session.commit()
 
@@ -0,0 +1,66 @@
+import json
+import time
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from app.core.profiling import ProfilingMiddleware
+
+"""
+This module contains unit tests for the on-demand request profiling middleware.
+"""
+
+
+def build_app(tmp_path):
+    engine = create_engine("sqlite://")
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware, token="secret", directory=str(tmp_path))
+
+    @app.get("/players/{name}/history")
+    def history(name: str):
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1")).scalar()
+        # Busy for long enough to be sampled several times
+        deadline = time.perf_counter() + 0.05
+        while time.perf_counter() < deadline:
+            pass
+        return {"player": name}
+
+    return app
+
+
+def test_request_with_token_is_profiled(tmp_path):
+    """
+    Test that a request sending the token gets a collapsed-stack profile and a SQL/Python breakdown.
+    """
+    client = TestClient(build_app(tmp_path))
+
+    response = client.get("/players/Jane Doe/history", headers={"X-Profile": "secret"})
+
+    name = response.headers["X-Profile"]
+    breakdown = json.loads((tmp_path / f"{name}.json").read_text())
+    assert response.status_code == 200
+    assert name.endswith("-GET-players_Jane_Doe_history")
+    assert "sql;dur=" in response.headers["Server-Timing"]
+    assert breakdown["sql_statements"] == 1
+    assert breakdown["total_ms"] >= breakdown["sql_ms"]
+    stacks = []
+    for line in (tmp_path / f"{name}.folded").read_text().splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert stack and int(count) > 0
+        stacks.append(stack)
+    # The sync handler runs on a threadpool thread, which must be sampled too
+    assert any("build_app.<locals>.history" in stack for stack in stacks)
+
+
+def test_request_without_valid_token_is_not_profiled(tmp_path):
+    """
+    Test that requests without the token, or with a wrong one, are served without profiling.
+    """
+    client = TestClient(build_app(tmp_path))
+
+    plain = client.get("/players/Jane/history")
+    wrong = client.get("/players/Jane/history", headers={"X-Profile": "guess"})
+
+    assert "X-Profile" not in plain.headers
+    assert "Server-Timing" not in wrong.headers
+    assert list(tmp_path.iterdir()) == []
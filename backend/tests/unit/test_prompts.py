@@ -0,0 +1,53 @@
+import pytest
+from app.api.prompts import build_prompt, compact_prompt, estimate_tokens, frame_notation
+
+"""
+This module contains unit tests for the summary prompt encodings.
+"""
+
+FRAMES = {f"Frame {number}": rolls for number, rolls in enumerate([[10], [7, 3], [9, 0], [0, 0]], start=1)}
+RUNNING_SCORES = [20, 39, 48, 48]
+
+
+@pytest.mark.parametrize(
+    "rolls, notation",
+    [([10], "X"), ([7, 3], "7/"), ([9, 0], "9-"), ([0, 10], "-/"), ([10, 10, 10], "XXX"), ([10, 7, 3], "X7/")],
+)
+def test_frame_notation(rolls, notation):
+    """
+    Test writing frames in standard bowling notation.
+    """
+    assert frame_notation(rolls) == notation
+
+
+def test_compact_prompt_encodes_scorecard():
+    """
+    Test that the compact prompt lists the frames with their running scores and the totals.
+    """
+    prompt = compact_prompt(FRAMES, RUNNING_SCORES)
+
+    assert "1 X 20 | 2 7/ 39 | 3 9- 48 | 4 -- 48" in prompt
+    assert "Score 48 after 4 frames: 1 strikes, 1 spares, 2 open." in prompt
+
+
+def test_compact_prompt_fits_token_budget():
+    """
+    Test that detail is dropped until the prompt fits the token budget.
+    """
+    full = compact_prompt(FRAMES, RUNNING_SCORES)
+    without_scores = compact_prompt(FRAMES, RUNNING_SCORES, token_budget=estimate_tokens(full) - 1)
+    totals_only = compact_prompt(FRAMES, RUNNING_SCORES, token_budget=1)
+
+    assert "Frames: X 7/ 9- --" in without_scores
+    assert "Frames" not in totals_only
+    assert "Score 48" in totals_only
+
+
+def test_compact_prompt_is_smaller_than_legacy_prompt():
+    """
+    Test that the compact prompt uses fewer tokens than the legacy prompt.
+    """
+    legacy = build_prompt("v1", FRAMES, RUNNING_SCORES)
+    compact = build_prompt("v2", FRAMES, RUNNING_SCORES)
+
+    assert estimate_tokens(compact) < estimate_tokens(legacy) / 2
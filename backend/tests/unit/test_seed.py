@@ -0,0 +1,36 @@
+import random
+from app.api.endpoints import calculate_score
+from app.db.archive import ArchivedFrame, is_game_complete
+from benchmarks.seed import generate_game, player_skill
+
+"""
+This module contains unit tests for the synthetic game generator used to seed load tests.
+"""
+
+
+def test_generated_games_follow_bowling_rules():
+    """
+    Test that generated games never knock down more than ten pins per rack and are complete.
+    """
+    rng = random.Random(7)
+
+    for index in range(200):
+        game = generate_game(rng, player_skill(index))
+        frames = [ArchivedFrame(number + 1, rolls) for number, rolls in enumerate(game)]
+
+        assert is_game_complete(frames)
+        for rolls in game[:9]:
+            assert rolls == [10] or (len(rolls) == 2 and sum(rolls) <= 10)
+        tenth = game[9]
+        if tenth[0] == 10 and tenth[1] != 10:
+            assert tenth[1] + tenth[2] <= 10
+        assert 0 <= calculate_score(frames) <= 300
+
+
+def test_generated_unfinished_games():
+    """
+    Test that fewer than ten frames can be requested for in-progress games.
+    """
+    game = generate_game(random.Random(1), player_skill(0), frames=4)
+
+    assert len(game) == 4
@@ -0,0 +1,43 @@
+from app.core.sketch import ScoreSketch
+
+"""
+This module contains unit tests for the mergeable score sketch.
+"""
+
+
+def sketch_of(*scores):
+    sketch = ScoreSketch()
+    for score in scores:
+        sketch.add(score)
+    return sketch
+
+
+def test_quantiles_interpolate_like_percentile_cont():
+    """
+    Test that quantiles interpolate between neighbouring scores like SQL percentile_cont.
+    """
+    sketch = sketch_of(100, 150, 200, 250)
+
+    assert sketch.quantile(0.5) == 175
+    assert sketch.quantile(0.9) == 235
+    assert ScoreSketch().quantile(0.5) is None
+
+
+def test_merge_and_histogram():
+    """
+    Test that merged sketches count the games of both and bin them into a histogram.
+    """
+    merged = sketch_of(95, 101, 109).merge(sketch_of(110, 300))
+
+    assert merged.total == 5
+    assert merged.histogram(10) == [(90, 99, 1), (100, 109, 2), (110, 119, 1), (300, 309, 1)]
+
+
+def test_percentile_rank_counts_ties_as_half():
+    """
+    Test the percentile rank of a score among the sketched games.
+    """
+    sketch = sketch_of(100, 150, 150, 200)
+
+    assert sketch.percentile_rank(150) == 50.0
+    assert sketch.percentile_rank(250) == 100.0
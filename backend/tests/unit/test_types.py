@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, insert, select, text
+from app.db.types import Rolls
+
+"""
+This module contains unit tests for the portable rolls column type.
+"""
+
+
+def test_rolls_are_packed_on_sqlite():
+    """
+    Test that rolls round-trip through SQLite stored as one byte per roll.
+    """
+    engine = create_engine("sqlite://")
+    frames = Table("frames", MetaData(), Column("id", Integer, primary_key=True), Column("rolls", Rolls))
+    frames.metadata.create_all(engine)
+
+    with engine.begin() as connection:
+        connection.execute(insert(frames), [{"id": 1, "rolls": [10, 10, 10]}, {"id": 2, "rolls": [0, 9]}])
+        rolls = connection.execute(select(frames.c.rolls).order_by(frames.c.id)).scalars().all()
+        stored = connection.execute(text("SELECT rolls FROM frames WHERE id = 1")).scalar_one()
+
+    assert rolls == [[10, 10, 10], [0, 9]]
+    assert stored == b"\n\n\n"
@@ -0,0 +1,65 @@
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.api.endpoints import DEFAULT_TRENDS_WINDOW
+from app.api.warmup import Warmup
+from app.core.cache import cache
+from app.db import models
+from app.db.base import Base
+
+"""
+This module contains unit tests for the startup warm-up.
+"""
+
+
+def test_warmup_fills_pool_and_primes_recent_players(tmp_path):
+    """
+    Test that warm-up opens pooled connections, compiles the hot queries and primes recent players.
+
+    - Player A bowled long ago, players B and C recently
+    Only the two most recently active players are primed.
+    """
+    # Arrange
+    engine = create_engine(f"sqlite:///{tmp_path / 'warmup.db'}")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as db:
+        for name, score in (("Player A", 120), ("Player B", 150), ("Player C", 180)):
+            player = models.Player(name=name)
+            db.add(models.Game(player=player, score=score))
+            db.flush()
+            db.add(models.PlayerStats(player_id=player.id, total_games=1, total_score=score, revision=1))
+        db.commit()
+    cache.clear()
+    warmup = Warmup()
+
+    # Act
+    warmup.run([Session], connections=3, players=2)
+
+    # Assert
+    assert warmup.ready.is_set()
+    assert warmup.report["connections"] == 3
+    assert warmup.report["queries"] > 0
+    assert warmup.report["players"] == 2
+    assert warmup.report["statistics_rows"] == 2
+    assert engine.pool.checkedin() == 3
+    assert cache.get(("trends", 3, DEFAULT_TRENDS_WINDOW))[1]["last_n"]["average_score"] == 180.0
+    assert cache.get(("trends", 1, DEFAULT_TRENDS_WINDOW)) is None
+
+    cache.clear()
+    engine.dispose()
+
+
+def test_warmup_failure_still_reports_ready():
+    """
+    Test that a worker whose warm-up fails still becomes ready, to serve requests cold.
+    """
+    # Arrange
+    engine = create_engine("sqlite:////nonexistent/directory/warmup.db")
+    warmup = Warmup()
+
+    # Act
+    warmup.run([sessionmaker(bind=engine)], connections=2, players=0)
+
+    # Assert
+    assert warmup.ready.is_set()
+    assert warmup.report["connections"] == 0